@@ -22,114 +22,217 @@ Usage:
 
 import sys
 import argparse
+import functools
 import math
+import operator
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import shapely
 
 from geocoder import geocode
 from toronto_gis import (
     query_exception_zone,
     query_waterline_geometry,
-    _query_where,
+    _iter_where,
 )
+from cache import persistent_cache
 from config import DEFAULT_ADDRESS, LAYER_PROPERTY_BOUNDARY
 
+_METERS_PER_DEG_LAT = 111320.0
+
+
+@functools.lru_cache(maxsize=256)
+def _mpd_lon(lat_rounded):
+    """Meters per degree of longitude at a latitude (rounded to 0.01 by callers)."""
+    return _METERS_PER_DEG_LAT * math.cos(math.radians(lat_rounded))
+
 
 # ---------------------------------------------------------------------------
 # Road location via property boundary data
 # ---------------------------------------------------------------------------
 
-def _find_road_position(road_name, near_lat, near_lon, radius=0.005):
+def _ring_columns(features):
     """
-    Find a road's position by querying City property parcels that front it.
+    Flatten every polygon ring vertex of the given features into two
+    contiguous float64 columns (lons, lats).
+
+    Esri JSON gives [[lon, lat], ...] pairs; splitting them into separate
+    columns lets min/max/mean stream over contiguous memory instead of
+    striding across interleaved pairs.
+    """
+    rings = [np.asarray(ring, dtype=np.float64)
+             for f in features for ring in f.get("geometry", {}).get("rings", [])]
+    rings = [r for r in rings if len(r)]
+    if not rings:
+        empty = np.empty(0)
+        return empty, empty
+    lons, lats = np.ascontiguousarray(np.concatenate(rings, axis=0).T)
+    return lons, lats
+
+
+# Largest shift of the search centre from snapping it to 3 decimals (~55m)
+_SNAP_MARGIN = 0.0005
 
-    The City's property boundary layer has ADDRESS_NUMBER and LINEAR_NAME_FULL
-    for each parcel. By finding all parcels on a named road near a location,
-    we get the road's actual position from authoritative parcel geometry.
+
+def _find_neighbourhood_parcels(near_lat, near_lon, radius=0.005):
+    """
+    Fetch every property parcel around a location once, for local lookups.
+
+    Road positions and the street layout both read the same property
+    boundary layer around the same point, so a single envelope query
+    answers both: each is a mask over the parcel table returned here.
+
+    The query (and its cache entry) is centred on the point snapped to
+    ~100m and widened by the snap margin, so nearby addresses share it; the
+    table is then cut back to the parcels that actually intersect the
+    envelope around the exact point, as a direct query would return.
 
     Returns:
-        dict with road_lon_range (for N-S roads) or road_lat_range (for E-W roads),
-        plus parcel_count and source details.
+        dict of parallel per-parcel arrays: "names" (LINEAR_NAME_FULL),
+        "geoms" (parcel polygons), "extents" (lon_min, lon_max, lat_min,
+        lat_max), "vertex_sums" (sum of ring lons, lats) and "vertex_counts".
     """
-    envelope = (f"{near_lon - radius},{near_lat - radius},"
-                f"{near_lon + radius},{near_lat + radius}")
+    parcels = _neighbourhood_parcels_cached(round(near_lat, 3), round(near_lon, 3),
+                                            radius + _SNAP_MARGIN)
+    return _parcels_in_box(parcels, near_lat, near_lon, radius)
+
+
+def _parcels_in_box(parcels, near_lat, near_lon, radius):
+    """Rows of a parcel table whose polygons intersect the box around a point."""
+    search_box = shapely.box(near_lon - radius, near_lat - radius,
+                             near_lon + radius, near_lat + radius)
+    hits = np.sort(shapely.STRtree(parcels["geoms"]).query(search_box, predicate="intersects"))
+    return {key: values[hits] for key, values in parcels.items()}
 
-    features = _query_where(
+
+@persistent_cache("neighbourhood_parcel_polygons")
+def _neighbourhood_parcels_cached(near_lat, near_lon, radius):
+    """Uncached body of _find_neighbourhood_parcels(), on the snapped centre."""
+    envelope = (near_lon - radius, near_lat - radius, near_lon + radius, near_lat + radius)
+
+    features = _iter_where(
         LAYER_PROPERTY_BOUNDARY,
-        where_clause=f"LINEAR_NAME_FULL = '{road_name}'",
+        where_clause="1=1",
         out_fields="ADDRESS_NUMBER,LINEAR_NAME_FULL",
         return_geometry=True,
+        envelope=envelope,
         extra_params={
-            "geometry": envelope,
-            "geometryType": "esriGeometryEnvelope",
-            "inSR": "4326",
-            "spatialRel": "esriSpatialRelIntersects",
+            # 6 decimals (~0.1m) is far below parcel size and trims the
+            # coordinate text ArcGIS sends for every vertex
+            "geometryPrecision": 6,
         },
     )
 
-    if not features:
-        return None
-
-    all_lons = []
-    all_lats = []
+    # Features stream in page by page and are reduced to one row each, so
+    # no ring coordinates outlive their feature. _iter_where always sets
+    # "attributes", so plain item lookups replace chained .get() calls.
+    # Each parcel's closed rings become one multipolygon for intersects tests.
+    get_attrs = operator.itemgetter("attributes")
+    names, geoms, extents, sums, counts = [], [], [], [], []
     for f in features:
-        geom = f.get("geometry", {})
-        for ring in geom.get("rings", []):
-            for coord in ring:
-                all_lons.append(coord[0])
-                all_lats.append(coord[1])
+        lons, lats = _ring_columns([f])
+        if not len(lons):
+            continue
+        rings = [ring for ring in f["geometry"]["rings"] if len(ring) >= 4]
+        names.append(get_attrs(f).get("LINEAR_NAME_FULL"))
+        geoms.append(shapely.multipolygons([shapely.polygons(ring) for ring in rings]))
+        extents.append((lons.min(), lons.max(), lats.min(), lats.max()))
+        sums.append((lons.sum(), lats.sum()))
+        counts.append(len(lons))
 
     return {
-        "road_name": road_name,
-        "parcel_count": len(features),
-        "lon_range": (min(all_lons), max(all_lons)),
-        "lat_range": (min(all_lats), max(all_lats)),
-        "centroid_lon": sum(all_lons) / len(all_lons),
-        "centroid_lat": sum(all_lats) / len(all_lats),
-        "source": f"City property boundary layer ({len(features)} parcels)",
+        "names": np.array(names, dtype=object),
+        "geoms": np.array(geoms, dtype=object),
+        "extents": np.array(extents, dtype=np.float64).reshape(-1, 4),
+        "vertex_sums": np.array(sums, dtype=np.float64).reshape(-1, 2),
+        "vertex_counts": np.array(counts, dtype=np.int64),
     }
 
 
-def _find_all_nearby_streets(near_lat, near_lon, radius=0.003):
+def _find_road_positions(road_names, near_lat, near_lon, radius=0.005, parcels=None):
     """
-    Find all streets with properties near a location.
-    Returns a dict of street_name -> lon_range for mapping the neighbourhood layout.
-    """
-    envelope = (f"{near_lon - radius},{near_lat - radius},"
-                f"{near_lon + radius},{near_lat + radius}")
+    Find the positions of several roads from nearby property parcels.
 
-    features = _query_where(
-        LAYER_PROPERTY_BOUNDARY,
-        where_clause="1=1",
-        out_fields="LINEAR_NAME_FULL",
-        return_geometry=True,
-        extra_params={
-            "geometry": envelope,
-            "geometryType": "esriGeometryEnvelope",
-            "inSR": "4326",
-            "spatialRel": "esriSpatialRelIntersects",
-        },
-    )
+    The City's property boundary layer has ADDRESS_NUMBER and LINEAR_NAME_FULL
+    for each parcel. By finding all parcels on the named roads near a location,
+    we get each road's actual position from authoritative parcel geometry.
 
-    streets = {}
-    for f in features:
-        street = f.get("attributes", {}).get("LINEAR_NAME_FULL") or "unknown"
-        geom = f.get("geometry", {})
-        lons = [c[0] for ring in geom.get("rings", []) for c in ring]
-        lats = [c[1] for ring in geom.get("rings", []) for c in ring]
-        if not lons:
+    Args:
+        parcels: optional result of _find_neighbourhood_parcels() to reuse;
+            fetched (or read from cache) when omitted
+
+    Returns:
+        dict of road_name -> position dict (see _find_road_position). Roads
+        with no parcels near the location are absent.
+    """
+    if parcels is None:
+        parcels = _find_neighbourhood_parcels(near_lat, near_lon, radius)
+
+    positions = {}
+    for road_name in road_names:
+        mask = parcels["names"] == road_name
+        count = int(mask.sum())
+        if not count:
             continue
-        if street not in streets:
-            streets[street] = {"count": 0, "lons": [], "lats": []}
-        streets[street]["count"] += 1
-        streets[street]["lons"].extend(lons)
-        streets[street]["lats"].extend(lats)
+        ext = parcels["extents"][mask]
+        centroid_lon, centroid_lat = (parcels["vertex_sums"][mask].sum(axis=0)
+                                      / parcels["vertex_counts"][mask].sum())
 
-    result = {}
-    for street, data in streets.items():
-        result[street] = {
-            "count": data["count"],
-            "lon_range": (min(data["lons"]), max(data["lons"])),
-            "lat_range": (min(data["lats"]), max(data["lats"])),
+        positions[road_name] = {
+            "road_name": road_name,
+            "parcel_count": count,
+            "lon_range": (float(ext[:, 0].min()), float(ext[:, 1].max())),
+            "lat_range": (float(ext[:, 2].min()), float(ext[:, 3].max())),
+            "centroid_lon": float(centroid_lon),
+            "centroid_lat": float(centroid_lat),
+            "source": f"City property boundary layer ({count} parcels)",
         }
+    return positions
+
+
+def _find_road_position(road_name, near_lat, near_lon, radius=0.005):
+    """
+    Find a road's position by querying City property parcels that front it.
+
+    Returns:
+        dict with lon_range, lat_range, centroid_lon/centroid_lat, plus
+        parcel_count and source details. None if no parcels were found.
+    """
+    return _find_road_positions([road_name], near_lat, near_lon, radius).get(road_name)
+
+
+def _find_all_nearby_streets(near_lat, near_lon, radius=0.003, parcels=None):
+    """
+    Find all streets with properties near a location.
+    Returns a dict of street_name -> lon_range for mapping the neighbourhood layout.
+
+    Pass `parcels` (from _find_neighbourhood_parcels() around the same point,
+    with a radius at least this one) to reuse an existing fetch.
+    """
+    if parcels is None:
+        parcels = _find_neighbourhood_parcels(near_lat, near_lon, radius)
+    else:
+        # Parcels whose polygons intersect the (smaller) search box
+        parcels = _parcels_in_box(parcels, near_lat, near_lon, radius)
+    ext = parcels["extents"]
+
+    result = {}
+    for street, (lon_min, lon_max, lat_min, lat_max) in zip(parcels["names"], ext):
+        street = street or "unknown"
+        entry = result.get(street)
+        if entry is None:
+            result[street] = {
+                "count": 1,
+                "lon_range": (float(lon_min), float(lon_max)),
+                "lat_range": (float(lat_min), float(lat_max)),
+            }
+            continue
+        entry["count"] += 1
+        entry["lon_range"] = (min(entry["lon_range"][0], float(lon_min)),
+                              max(entry["lon_range"][1], float(lon_max)))
+        entry["lat_range"] = (min(entry["lat_range"][0], float(lat_min)),
+                              max(entry["lat_range"][1], float(lat_max)))
     return result
 
 
@@ -137,20 +240,47 @@ def _find_all_nearby_streets(near_lat, near_lon, radius=0.003):
 # Boundary checks
 # ---------------------------------------------------------------------------
 
+def _classify_side(values, center, expected_side):
+    """
+    Classify coordinates against a road centre line in one array operation.
+
+    Args:
+        values: longitude(s) for "west"/"east" checks, latitude(s) for
+            "south"/"north"; a scalar or any array-like
+        center: the road centroid on the same axis
+        expected_side: "west", "east", "south" or "north"
+
+    Returns:
+        (is_correct, actual): a bool array, and an array of side names
+        ("west"/"east" or "south"/"north") for each value.
+    """
+    values = np.atleast_1d(np.asarray(values, dtype=np.float64))
+    low, high = ("west", "east") if expected_side in ("west", "east") else ("south", "north")
+    below = values < center
+    is_correct = below if expected_side == low else values > center
+    return is_correct, np.where(below, low, high)
+
+
 def check_relative_to_road(point_lon, point_lat, road_name, expected_side,
-                           near_lat=None, near_lon=None):
+                           near_lat=None, near_lon=None, parcels=None):
     """
     Check if a point is on the expected side of a road.
 
     expected_side: "west", "east", "north", "south"
 
-    Uses City property boundary data to locate the road precisely.
+    Uses City property boundary data to locate the road precisely. Pass the
+    result of _find_neighbourhood_parcels() as `parcels` to locate the road
+    from already-fetched parcels instead of querying.
     """
-    road = _find_road_position(
-        road_name,
-        near_lat=near_lat or point_lat,
-        near_lon=near_lon or point_lon,
-    )
+    if parcels is not None:
+        road = _find_road_positions([road_name], near_lat or point_lat,
+                                    near_lon or point_lon, parcels=parcels).get(road_name)
+    else:
+        road = _find_road_position(
+            road_name,
+            near_lat=near_lat or point_lat,
+            near_lon=near_lon or point_lon,
+        )
 
     if not road:
         return {
@@ -169,13 +299,9 @@ def check_relative_to_road(point_lon, point_lat, road_name, expected_side,
     # fronting a road approximates the road centerline.
     if expected_side in ("west", "east"):
         # For N-S roads, compare longitude against centroid
-        if expected_side == "west":
-            is_correct = point_lon < road_center_lon
-        else:
-            is_correct = point_lon > road_center_lon
-
-        actual = "west" if point_lon < road_center_lon else "east"
-        offset = abs(point_lon - road_center_lon) * 111320 * math.cos(math.radians(point_lat))
+        is_correct, actual = _classify_side(point_lon, road_center_lon, expected_side)
+        is_correct, actual = bool(is_correct[0]), str(actual[0])
+        offset = abs(point_lon - road_center_lon) * _mpd_lon(round(point_lat, 2))
 
         return {
             "check": f"{expected_side} of {road_name}",
@@ -191,13 +317,9 @@ def check_relative_to_road(point_lon, point_lat, road_name, expected_side,
         }
     else:
         # For E-W roads, compare latitude against centroid
-        if expected_side == "south":
-            is_correct = point_lat < road_center_lat
-        else:
-            is_correct = point_lat > road_center_lat
-
-        actual = "south" if point_lat < road_center_lat else "north"
-        offset = abs(point_lat - road_center_lat) * 111320
+        is_correct, actual = _classify_side(point_lat, road_center_lat, expected_side)
+        is_correct, actual = bool(is_correct[0]), str(actual[0])
+        offset = abs(point_lat - road_center_lat) * _METERS_PER_DEG_LAT
 
         return {
             "check": f"{expected_side} of {road_name}",
@@ -213,40 +335,80 @@ def check_relative_to_road(point_lon, point_lat, road_name, expected_side,
         }
 
 
+@functools.lru_cache(maxsize=16)
+def _creek_index(creek_name):
+    """
+    Spatial index over a creek's waterline vertices, built once per creek.
+
+    Returns:
+        (STRtree over vertex Points, (N, 2) lon/lat array), or (None, empty array)
+        if the waterline has no vertices.
+    """
+    coords = np.asarray(query_waterline_geometry(creek_name), dtype=np.float64)
+    if not len(coords):
+        return None, coords
+    return shapely.STRtree(shapely.points(coords)), coords
+
+
 def check_relative_to_creek(point_lon, point_lat, creek_name, expected_side="east"):
     """
     Check if a point is on the expected side of a creek using waterline geometry.
     """
-    coords = query_waterline_geometry(creek_name)
-
-    # Find nearest creek coordinate
-    nearest_lon = None
-    nearest_lat = None
-    min_dist = float("inf")
-    for c in coords:
-        dist = math.sqrt((point_lon - c[0]) ** 2 + (point_lat - c[1]) ** 2)
-        if dist < min_dist:
-            min_dist = dist
-            nearest_lon, nearest_lat = c
-
-    is_east = point_lon > nearest_lon if nearest_lon else None
-
-    if expected_side == "east":
-        passed = is_east
-    else:
-        passed = not is_east
+    return check_relative_to_creek_batch([(point_lon, point_lat)], creek_name, expected_side)[0]
 
-    return {
-        "check": f"{expected_side} of {creek_name}",
-        "result": "PASS" if passed else ("FAIL" if passed is not None else "INCONCLUSIVE"),
-        "creek_name": creek_name,
-        "nearest_creek_lon": round(nearest_lon, 6) if nearest_lon else None,
-        "nearest_creek_lat": round(nearest_lat, 6) if nearest_lat else None,
-        "property_lon": round(point_lon, 6),
-        "property_lat": round(point_lat, 6),
-        "offset_m": round(min_dist * 111320) if min_dist < float("inf") else None,
-        "direction": "east" if is_east else "west" if is_east is not None else "unknown",
-    }
+
+def check_relative_to_creek_batch(points_lonlat, creek_name, expected_side="east"):
+    """
+    Check many (lon, lat) points against a creek; check_relative_to_creek()
+    is the one-point case.
+
+    All points are matched against the creek's vertex index in one
+    vectorized nearest-neighbour query and classified with array
+    comparisons, so cost stays in C rather than a per-point Python loop.
+
+    Returns:
+        List of result dicts, one per input point, in input order
+        (INCONCLUSIVE if the creek has no waterline vertices).
+    """
+    pts = np.asarray(points_lonlat, dtype=np.float64).reshape(-1, 2)
+    tree, coords = _creek_index(creek_name)
+    if tree is None:
+        return [
+            {
+                "check": f"{expected_side} of {creek_name}",
+                "result": "INCONCLUSIVE",
+                "creek_name": creek_name,
+                "nearest_creek_lon": None,
+                "nearest_creek_lat": None,
+                "property_lon": round(float(lon), 6),
+                "property_lat": round(float(lat), 6),
+                "offset_m": None,
+                "direction": "unknown",
+            }
+            for lon, lat in pts
+        ]
+
+    (_, nearest_idx), dist = tree.query_nearest(shapely.points(pts), return_distance=True,
+                                                all_matches=False)
+    nearest = coords[nearest_idx]
+    is_east = pts[:, 0] > nearest[:, 0]
+    passed = is_east if expected_side == "east" else ~is_east
+    offsets = np.rint(dist * _METERS_PER_DEG_LAT)
+
+    return [
+        {
+            "check": f"{expected_side} of {creek_name}",
+            "result": "PASS" if passed[i] else "FAIL",
+            "creek_name": creek_name,
+            "nearest_creek_lon": round(float(nearest[i, 0]), 6),
+            "nearest_creek_lat": round(float(nearest[i, 1]), 6),
+            "property_lon": round(float(pts[i, 0]), 6),
+            "property_lat": round(float(pts[i, 1]), 6),
+            "offset_m": int(offsets[i]),
+            "direction": "east" if is_east[i] else "west",
+        }
+        for i in range(len(pts))
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -269,68 +431,83 @@ def validate_thompson_orchard(lat, lon, exception_number=42):
     """
     results = {"exception_zone": None, "boundary_checks": [], "street_layout": None, "verdict": None}
 
-    # 1. Map the exception zone
-    print(f"  Mapping Exception {exception_number} zone (RD parcels near property)...")
-    try:
-        zone = query_exception_zone(
-            exception_number, zone_type="RD", near_lat=lat, near_lon=lon, radius=0.015
+    # The lookups are independent network round-trips: issue them all at once,
+    # then report each result in order (future.result() waits or re-raises).
+    # One neighbourhood parcel fetch serves both road checks and the street
+    # layout, which are answered locally from it.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        zone_future = pool.submit(
+            query_exception_zone,
+            exception_number, zone_type="RD", near_lat=lat, near_lon=lon, radius=0.015,
         )
-        if "error" not in zone:
-            bbox = zone["bounding_box"]
-            print(f"    Found {zone['parcel_count']} RD zoning polygons nearby")
-            print(f"    Bounding box: {bbox['min_lat']:.4f}-{bbox['max_lat']:.4f} lat, "
-                  f"{bbox['min_lon']:.4f}-{bbox['max_lon']:.4f} lon")
-            print(f"    Zoning strings: {', '.join(set(zone['zoning_strings']))}")
-        results["exception_zone"] = zone
-    except Exception as e:
-        results["exception_zone"] = {"error": str(e)}
-        print(f"    ERROR: {e}")
-
-    # 2. West of Royal York Rd
-    print(f"  Checking: position relative to Royal York Rd...")
-    try:
-        check1 = check_relative_to_road(lon, lat, "Royal York Rd", "west")
-        results["boundary_checks"].append(check1)
-        _print_road_check(check1, "lon")
-    except Exception as e:
-        results["boundary_checks"].append({"check": "west of Royal York Rd", "result": "ERROR", "error": str(e)})
-        print(f"    ERROR: {e}")
-
-    # 3. South of Bloor St W
-    print(f"  Checking: position relative to Bloor St W...")
-    try:
-        check2 = check_relative_to_road(lon, lat, "Bloor St W", "south")
-        results["boundary_checks"].append(check2)
-        _print_road_check(check2, "lat")
-    except Exception as e:
-        results["boundary_checks"].append({"check": "south of Bloor St W", "result": "ERROR", "error": str(e)})
-        print(f"    ERROR: {e}")
-
-    # 4. East of Mimico Creek
-    print(f"  Checking: position relative to Mimico Creek...")
-    try:
-        check3 = check_relative_to_creek(lon, lat, "Mimico Creek", expected_side="east")
-        results["boundary_checks"].append(check3)
-        print(f"    Creek nearest point: {check3.get('nearest_creek_lon', '?')}")
-        print(f"    Property:            {check3['property_lon']}")
-        print(f"    Result: {check3['direction'].upper()} of creek ({check3['result']}) ~{check3.get('offset_m', '?')}m")
-    except Exception as e:
-        results["boundary_checks"].append({"check": "east of Mimico Creek", "result": "ERROR", "error": str(e)})
-        print(f"    ERROR: {e}")
-
-    # 5. Street layout context
-    print(f"  Mapping neighbourhood street layout...")
-    try:
-        streets = _find_all_nearby_streets(lat, lon, radius=0.004)
-        results["street_layout"] = streets
-        print(f"    Found {len(streets)} streets nearby (west to east):")
-        for street in sorted(streets.keys(), key=lambda s: streets[s]["lon_range"][0]):
-            s = streets[street]
-            lon_mid = (s["lon_range"][0] + s["lon_range"][1]) / 2
-            marker = " *** TARGET" if street == "Ashton Manor" else ""
-            print(f"      {street:30s}  lon ~{lon_mid:.4f}  ({s['count']} parcels){marker}")
-    except Exception as e:
-        print(f"    ERROR: {e}")
+        parcels_future = pool.submit(_find_neighbourhood_parcels, lat, lon)
+        creek_future = pool.submit(
+            check_relative_to_creek, lon, lat, "Mimico Creek", expected_side="east",
+        )
+
+        # 1. Map the exception zone
+        print(f"  Mapping Exception {exception_number} zone (RD parcels near property)...")
+        try:
+            zone = zone_future.result()
+            if "error" not in zone:
+                bbox = zone["bounding_box"]
+                print(f"    Found {zone['parcel_count']} RD zoning polygons nearby")
+                print(f"    Bounding box: {bbox['min_lat']:.4f}-{bbox['max_lat']:.4f} lat, "
+                      f"{bbox['min_lon']:.4f}-{bbox['max_lon']:.4f} lon")
+                print(f"    Zoning strings: {', '.join(set(zone['zoning_strings']))}")
+            results["exception_zone"] = zone
+        except Exception as e:
+            results["exception_zone"] = {"error": str(e)}
+            print(f"    ERROR: {e}")
+
+        # 2. West of Royal York Rd
+        print(f"  Checking: position relative to Royal York Rd...")
+        try:
+            check1 = check_relative_to_road(lon, lat, "Royal York Rd", "west",
+                                            parcels=parcels_future.result())
+            results["boundary_checks"].append(check1)
+            _print_road_check(check1, "lon")
+        except Exception as e:
+            results["boundary_checks"].append({"check": "west of Royal York Rd", "result": "ERROR", "error": str(e)})
+            print(f"    ERROR: {e}")
+
+        # 3. South of Bloor St W
+        print(f"  Checking: position relative to Bloor St W...")
+        try:
+            check2 = check_relative_to_road(lon, lat, "Bloor St W", "south",
+                                            parcels=parcels_future.result())
+            results["boundary_checks"].append(check2)
+            _print_road_check(check2, "lat")
+        except Exception as e:
+            results["boundary_checks"].append({"check": "south of Bloor St W", "result": "ERROR", "error": str(e)})
+            print(f"    ERROR: {e}")
+
+        # 4. East of Mimico Creek
+        print(f"  Checking: position relative to Mimico Creek...")
+        try:
+            check3 = creek_future.result()
+            results["boundary_checks"].append(check3)
+            print(f"    Creek nearest point: {check3.get('nearest_creek_lon', '?')}")
+            print(f"    Property:            {check3['property_lon']}")
+            print(f"    Result: {check3['direction'].upper()} of creek ({check3['result']}) ~{check3.get('offset_m', '?')}m")
+        except Exception as e:
+            results["boundary_checks"].append({"check": "east of Mimico Creek", "result": "ERROR", "error": str(e)})
+            print(f"    ERROR: {e}")
+
+        # 5. Street layout context
+        print(f"  Mapping neighbourhood street layout...")
+        try:
+            streets = _find_all_nearby_streets(lat, lon, radius=0.004,
+                                               parcels=parcels_future.result())
+            results["street_layout"] = streets
+            print(f"    Found {len(streets)} streets nearby (west to east):")
+            for street in sorted(streets.keys(), key=lambda s: streets[s]["lon_range"][0]):
+                s = streets[street]
+                lon_mid = (s["lon_range"][0] + s["lon_range"][1]) / 2
+                marker = " *** TARGET" if street == "Ashton Manor" else ""
+                print(f"      {street:30s}  lon ~{lon_mid:.4f}  ({s['count']} parcels){marker}")
+        except Exception as e:
+            print(f"    ERROR: {e}")
 
     # Overall verdict
     check_results = [c["result"] for c in results["boundary_checks"]]
@@ -0,0 +1,113 @@
+"""
+Persistent memoization for GIS lookups whose answers rarely change.
+
+Road, waterline and parcel geometry is effectively static between runs, so
+results are kept in memory and pickled to CACHE_DIR (one file per cache name)
+when the process exits. Entries older than CACHE_MAX_AGE_DAYS are refetched.
+Exceptions are never cached.
+"""
+
+import atexit
+import functools
+import os
+import pickle
+import threading
+import time
+
+from config import CACHE_DIR, CACHE_MAX_AGE_DAYS
+
+_stores = {}   # cache name -> {args tuple: (timestamp, value)}
+_dirty = set()
+_lock = threading.Lock()
+_enabled = True
+
+
+def disable_cache():
+    """
+    Stop reading and writing CACHE_DIR for the rest of the process (--no-cache).
+
+    Lookups still go to the services afresh, but are memoized in memory for
+    the run, so a query repeated within one run is only sent once.
+    """
+    global _enabled
+    with _lock:
+        _enabled = False
+        _stores.clear()
+        _dirty.clear()
+
+
+def _store(name):
+    """
+    Return the in-memory store for a cache name, loading it from disk on first use.
+
+    With the cache disabled the store starts empty and lives for the run only.
+    """
+    with _lock:
+        if name not in _stores:
+            _stores[name] = {}
+            if _enabled:
+                try:
+                    with open(os.path.join(CACHE_DIR, f"{name}.pkl"), "rb") as f:
+                        _stores[name] = pickle.load(f)
+                except (OSError, EOFError, pickle.UnpicklingError):
+                    pass
+        return _stores[name]
+
+
+def flush_cache():
+    """
+    Write every modified store back to CACHE_DIR.
+
+    Entries another process saved since this one loaded the file are merged
+    in rather than overwritten. Runs automatically at exit.
+    """
+    with _lock:
+        if not _dirty or not _enabled:
+            return
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            for name in _dirty:
+                path = os.path.join(CACHE_DIR, f"{name}.pkl")
+                try:
+                    with open(path, "rb") as f:
+                        merged = pickle.load(f)
+                except (OSError, EOFError, pickle.UnpicklingError):
+                    merged = {}
+                merged.update(_stores[name])
+                _stores[name] = merged
+                tmp = f"{path}.{os.getpid()}.tmp"
+                with open(tmp, "wb") as f:
+                    pickle.dump(merged, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, path)
+            _dirty.clear()
+        except OSError as e:
+            print(f"  WARNING: could not save lookup cache: {e}")
+
+
+atexit.register(flush_cache)
+
+
+def persistent_cache(name):
+    """
+    Memoize a function on its positional arguments, persisted across runs.
+
+    Arguments must be hashable and picklable; return values must be picklable
+    and are shared between callers, so treat them as read-only.
+    """
+    max_age = CACHE_MAX_AGE_DAYS * 86400
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            store = _store(name)
+            hit = store.get(args)
+            if hit is not None and time.time() - hit[0] < max_age:
+                return hit[1]
+            value = func(*args)
+            with _lock:
+                store[args] = (time.time(), value)
+                if _enabled:
+                    _dirty.add(name)
+            return value
+        return wrapper
+    return decorator
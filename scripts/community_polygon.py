@@ -17,20 +17,75 @@ Usage:
 
 import json
 import argparse
+import ctypes
+import functools
+import itertools
+import math
 import os
+import pathlib
+import queue
+import re
 import sys
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 
 import numpy as np
+import shapely
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used instead
+    orjson = None
+
 from shapely.geometry import (
-    LineString, MultiLineString, Polygon, MultiPolygon, Point, box, mapping,
+    LineString, MultiLineString, MultiPolygon, Point, box, mapping,
 )
-from shapely.ops import linemerge, unary_union, nearest_points
+from shapely.errors import GEOSException
+from shapely.ops import linemerge, nearest_points
 
-from toronto_gis import _query_where, query_exception_zone
-from geocoder import geocode
+from toronto_gis import (
+    _SESSION, _decode, _iter_where, _query_where_cached, query_exception_zone,
+)
+from geocoder import geocode, share_nominatim_lock
+from cache import disable_cache, flush_cache, persistent_cache
 from config import LAYER_ROAD_CENTRELINE, LAYER_WATERLINE, OUTPUT_DIR
 
+# Meters per degree of latitude; also used as a rough degrees-to-meters
+# factor for planar distances in EPSG:4326
+METERS_PER_DEG_LAT = 111320
+
+# Progress output from worker threads. A worker run through _run_logged()
+# collects its lines here instead of printing them, so the caller can print
+# each worker's output as one block, in input order.
+_thread_log = threading.local()
+
+
+def _log(message):
+    """Print a progress line, or buffer it when running under _run_logged()."""
+    lines = getattr(_thread_log, "lines", None)
+    if lines is None:
+        print(message)
+    else:
+        lines.append(message)
+
+
+def _run_logged(func, *args, **kwargs):
+    """
+    Call func(*args, **kwargs) with its _log() output buffered.
+
+    Returns:
+        (lines, result, error): the buffered progress lines, then the
+        return value, or the exception raised (result is None then).
+    """
+    _thread_log.lines = lines = []
+    try:
+        return lines, func(*args, **kwargs), None
+    except Exception as e:
+        return lines, None, e
+    finally:
+        _thread_log.lines = None
 
 # ---------------------------------------------------------------------------
 # Road name normalization
@@ -46,38 +101,63 @@ ROAD_DIRECTION_MAP = {
     "West": "W", "East": "E", "North": "N", "South": "S",
 }
 
+# Every abbreviation in one table and one precompiled pattern. Matches are
+# whole whitespace-separated words only (so "Dundas-Street" is left alone).
+_ROAD_WORD_MAP = {**ROAD_DIRECTION_MAP, **ROAD_SUFFIX_MAP}
+_ROAD_WORD_RE = re.compile(
+    r"(?<!\S)(" + "|".join(map(re.escape, _ROAD_WORD_MAP)) + r")(?!\S)"
+)
+
+
+@functools.lru_cache(maxsize=1024)
 def normalize_road_name(name):
     """Normalize a road name to match Toronto ArcGIS LINEAR_NAME_FULL format."""
-    words = name.split()
-    normalized = []
-    for word in words:
-        if word in ROAD_SUFFIX_MAP:
-            normalized.append(ROAD_SUFFIX_MAP[word])
-        elif word in ROAD_DIRECTION_MAP:
-            normalized.append(ROAD_DIRECTION_MAP[word])
-        else:
-            normalized.append(word)
-    return " ".join(normalized)
+    return _ROAD_WORD_RE.sub(lambda m: _ROAD_WORD_MAP[m.group(1)], " ".join(name.split()))
 
 
 # ---------------------------------------------------------------------------
 # GIS name resolution
 # ---------------------------------------------------------------------------
 
-def _road_orientation(segments):
-    """Determine if a set of segments runs predominantly E-W or N-S."""
-    total_dx = 0
-    total_dy = 0
-    for seg in segments:
-        coords = list(seg.coords)
-        total_dx += abs(coords[-1][0] - coords[0][0])
-        total_dy += abs(coords[-1][1] - coords[0][1])
-    return "ew" if total_dx > total_dy else "ns"
+def _candidate_table(candidates):
+    """
+    Geometry summary of candidate roads for _compass_match_scores().
+
+    `candidates` is a list of LineString lists, one per candidate road. All
+    values come from batched shapely calls over the flattened segments.
 
+    Returns:
+        dict with "count" (number of candidates), "segments" (segment count
+        per candidate), "present" (indices of candidates with segments) and,
+        aligned with "present": "centroids" (lon, lat; length-weighted),
+        "length_m" and "is_ew" (whether the road runs mostly east-west).
+        Scoring is then pure array arithmetic.
+    """
+    counts = np.array([len(segs) for segs in candidates], dtype=np.intp)
+    present = np.flatnonzero(counts)
+    table = {"count": len(candidates), "segments": counts, "present": present}
+    if not len(present):
+        return table
+
+    segments = np.array([seg for i in present for seg in candidates[i]], dtype=object)
+    owner = np.repeat(np.arange(len(present)), counts[present])
+
+    # One MultiLineString per candidate: its centroid is length-weighted
+    combined = shapely.multilinestrings(segments, indices=owner)
+    table["centroids"] = shapely.get_coordinates(shapely.centroid(combined))
+    table["length_m"] = shapely.length(combined) * METERS_PER_DEG_LAT
 
-def _compass_match_score(linestrings, ref_lat, ref_lon, compass_direction):
+    # Orientation flag: summed end-to-end |dx| of the segments exceeds |dy|
+    spans = np.abs(shapely.get_coordinates(shapely.get_point(segments, -1))
+                   - shapely.get_coordinates(shapely.get_point(segments, 0)))
+    table["is_ew"] = (np.bincount(owner, weights=spans[:, 0], minlength=len(present))
+                      > np.bincount(owner, weights=spans[:, 1], minlength=len(present)))
+    return table
+
+
+def _compass_match_scores(candidates, ref_lat, ref_lon, compass_direction, table=None):
     """
-    Score a candidate road for being the boundary in a given compass direction.
+    Score candidate roads for being the boundary in a given compass direction.
 
     A good boundary road is:
       - In the correct direction from the reference point (required)
@@ -85,21 +165,25 @@ def _compass_match_score(linestrings, ref_lat, ref_lon, compass_direction):
       - Long (boundaries are major roads/features, not residential streets)
       - Oriented correctly (E-W for north/south boundaries, N-S for east/west)
 
-    Returns a numeric score (higher = better match). Returns -999 if the road
-    is in the wrong direction entirely.
+    `candidates` is a list of LineString lists, one per candidate road; a
+    precomputed _candidate_table() can be passed instead as `table` when the
+    same candidates are scored for several boundaries. Returns a float array
+    aligned with the candidates (higher = better match; -999 for empty or
+    wrong-direction ones).
     """
-    if not linestrings:
-        return -999
-
-    combined = MultiLineString(linestrings) if len(linestrings) > 1 else linestrings[0]
-    centroid = combined.centroid
-    total_length_m = combined.length * 111320
-
-    dlat = centroid.y - ref_lat
-    dlon = centroid.x - ref_lon
+    if table is None:
+        table = _candidate_table(candidates)
+    scores = np.full(table["count"], -999.0)
+    present = table["present"]
+    if not len(present):
+        return scores
+    centroids = table["centroids"]
+    total_length_m = table["length_m"]
+
+    dlat = centroids[:, 1] - ref_lat
+    dlon = centroids[:, 0] - ref_lon
 
     # Gate: road must be in the correct compass direction
-    in_direction = False
     if compass_direction == "north":
         in_direction = dlat > -0.001
     elif compass_direction == "south":
@@ -109,32 +193,82 @@ def _compass_match_score(linestrings, ref_lat, ref_lon, compass_direction):
     elif compass_direction == "west":
         in_direction = dlon < 0.001
     elif compass_direction in ("west_and_south", "south_and_west"):
-        in_direction = (dlat < 0.001 or dlon < 0.001)
+        in_direction = (dlat < 0.001) | (dlon < 0.001)
     else:
-        in_direction = True
-
-    if not in_direction:
-        return -999
+        in_direction = np.ones(len(present), dtype=bool)
 
     # Distance from reference point (rough meters)
     cos_lat = 0.7  # cos(43.6°) ≈ 0.72
-    dist_m = ((dlat * 111320) ** 2 + (dlon * 111320 * cos_lat) ** 2) ** 0.5
+    dist_m = np.hypot(dlat * METERS_PER_DEG_LAT,
+                      dlon * METERS_PER_DEG_LAT * cos_lat)
 
-    # Orientation bonus: E-W roads for N/S boundaries, N-S roads for E/W boundaries
-    orient = _road_orientation(linestrings)
+    # Orientation bonus: E-W roads for N/S boundaries, N-S roads for E/W
+    # boundaries (orientation flag precomputed per candidate)
     expected_orient = ("ew" if compass_direction in ("north", "south")
                        else "ns" if compass_direction in ("east", "west")
                        else None)
-    orientation_bonus = 500 if (expected_orient and orient == expected_orient) else 0
+    orientation_bonus = np.zeros(len(present))
+    if expected_orient:
+        is_ew = table["is_ew"]
+        orientation_bonus[is_ew if expected_orient == "ew" else ~is_ew] = 500
 
     # Cap length bonus — any road >2km is "substantial enough";
     # prevents long trails from dominating over closer named roads
-    length_bonus = min(total_length_m, 2000)
+    length_bonus = np.minimum(total_length_m, 2000)
 
     # Score: reward length (capped) + orientation, penalize distance
-    score = length_bonus + orientation_bonus - dist_m
+    scores[present] = np.where(in_direction,
+                               length_bonus + orientation_bonus - dist_m, -999)
+    return scores
 
-    return score
+
+@functools.lru_cache(maxsize=32)
+def _area_candidates(feature_type, envelope):
+    """
+    Every named road (or waterline) in an envelope, summarized for scoring.
+
+    Several boundaries of one community fall back to the same area query
+    around the same reference point; the candidate set and its geometry
+    table are built once and each boundary only rescores them.
+
+    Returns:
+        (names, table): candidate names (tuple) and their _candidate_table().
+    """
+    if feature_type == "street":
+        field, layer = "LINEAR_NAME_FULL", LAYER_ROAD_CENTRELINE
+    else:
+        field, layer = "WATERLINE_NAME", LAYER_WATERLINE
+    features = _query_where_cached(
+        layer,
+        where_clause="1=1",
+        out_fields=field,
+        return_geometry=True,
+        extra_params=_SCORING_GEOMETRY_PARAMS,
+        envelope=envelope,
+    )
+
+    paths_by_name = _paths_by_name(features, field)
+    return tuple(paths_by_name), _candidate_table(_candidate_linestrings(paths_by_name))
+
+
+def _paths_by_name(features, field):
+    """Group the usable (2+ point) paths of ArcGIS features by their `field` name."""
+    paths_by_name = {}
+    for f in features:
+        attrs = f.get("attributes", {})
+        name = attrs.get(field) or f.get(field)
+        if not name:
+            continue
+        paths = paths_by_name.setdefault(name, [])
+        paths.extend(path for path in f.get("geometry", {}).get("paths", [])
+                     if len(path) >= 2)
+    return paths_by_name
+
+
+def _candidate_linestrings(paths_by_name):
+    """LineString lists aligned with a _paths_by_name() dict, built in one batched call."""
+    lines = iter(_build_linestrings([p for paths in paths_by_name.values() for p in paths]))
+    return [[next(lines) for _ in paths] for paths in paths_by_name.values()]
 
 
 def resolve_gis_name(approximate_name, feature_type, ref_lat, ref_lon,
@@ -162,15 +296,15 @@ def resolve_gis_name(approximate_name, feature_type, ref_lat, ref_lon,
     else:
         return approximate_name
 
-    envelope = _make_envelope_params(ref_lat, ref_lon, search_radius)
+    envelope = _make_envelope(ref_lat, ref_lon, search_radius)
 
     # Step 1: Try exact match with normalized name
-    features = _query_where(
+    features = _query_where_cached(
         layer,
         where_clause=f"{field} = '{normalized}'",
         out_fields=field,
         return_geometry=False,
-        extra_params=envelope,
+        envelope=envelope,
     )
     if features:
         if normalized != approximate_name:
@@ -180,12 +314,13 @@ def resolve_gis_name(approximate_name, feature_type, ref_lat, ref_lon,
     # Step 2: LIKE match — use the first word as the distinctive part
     base = approximate_name.split()[0]
     where_like = f"UPPER({field}) LIKE '%{base.upper()}%'"
-    features = _query_where(
+    features = _query_where_cached(
         layer,
         where_clause=where_like,
         out_fields=field,
         return_geometry=True,
-        extra_params=envelope,
+        extra_params=_SCORING_GEOMETRY_PARAMS,
+        envelope=envelope,
     )
 
     if not features:
@@ -196,45 +331,19 @@ def resolve_gis_name(approximate_name, feature_type, ref_lat, ref_lon,
         if compass_direction:
             print(f"    No name match for '{approximate_name}'. "
                   f"Trying compass-based fallback ({compass_direction})...")
-            features = _query_where(
-                layer,
-                where_clause="1=1",
-                out_fields=field,
-                return_geometry=True,
-                extra_params=envelope,
-            )
-            if features:
-                # Collect by name and score by compass + orientation
-                fallback_names = {}
-                for f in features:
-                    attrs = f.get("attributes", {})
-                    name = attrs.get(field) or f.get(field)
-                    if not name:
-                        continue
-                    if name not in fallback_names:
-                        fallback_names[name] = []
-                    for path in f.get("geometry", {}).get("paths", []):
-                        if len(path) >= 2:
-                            fallback_names[name].append(LineString(path))
-
-                # Score each candidate by compass direction, proximity,
-                # length, and orientation (all handled in _compass_match_score)
-                best_name = None
-                best_score = -999
-
-                for name, segments in fallback_names.items():
-                    if not segments:
-                        continue
-                    score = _compass_match_score(segments, ref_lat, ref_lon,
-                                                compass_direction)
-                    if score > best_score:
-                        best_score = score
-                        best_name = name
-
-                if best_name and best_score > 0:
+            names, table = _area_candidates(feature_type, envelope)
+            if names:
+                # Score every candidate at once by compass direction,
+                # proximity, length, and orientation (_compass_match_scores)
+                scores = _compass_match_scores(None, ref_lat, ref_lon,
+                                               compass_direction, table=table)
+                best = int(np.argmax(scores))
+
+                if scores[best] > 0:
+                    best_name = names[best]
                     print(f"    Resolved '{approximate_name}' -> '{best_name}' "
                           f"(compass fallback: best '{compass_direction}' match "
-                          f"from {list(fallback_names.keys())})")
+                          f"from {list(names)})")
                     return best_name
 
         print(f"    WARNING: No GIS features matching '{approximate_name}' "
@@ -242,46 +351,35 @@ def resolve_gis_name(approximate_name, feature_type, ref_lat, ref_lon,
               f"and compass fallback)")
         return normalized
 
-    # Collect unique names with their geometries
-    name_segments = {}
-    for f in features:
-        attrs = f.get("attributes", {})
-        name = attrs.get(field) or f.get(field)
-        if not name:
-            continue
-        if name not in name_segments:
-            name_segments[name] = []
-        for path in f.get("geometry", {}).get("paths", []):
-            if len(path) >= 2:
-                name_segments[name].append(LineString(path))
+    # Collect unique names with their paths. Geometry is only built when
+    # several names have to be told apart by compass direction.
+    name_paths = _paths_by_name(features, field)
 
-    if not name_segments:
+    if not name_paths:
         return normalized
 
-    if len(name_segments) == 1:
-        resolved = list(name_segments.keys())[0]
+    if len(name_paths) == 1:
+        resolved = list(name_paths.keys())[0]
         if resolved != approximate_name:
             print(f"    Resolved '{approximate_name}' -> '{resolved}' (LIKE match)")
         return resolved
 
     # Multiple matches — use compass direction to pick the best candidate
     if compass_direction:
-        best_name = None
-        best_score = -999
-        for name, segments in name_segments.items():
-            score = _compass_match_score(segments, ref_lat, ref_lon, compass_direction)
-            if score > best_score:
-                best_score = score
-                best_name = name
+        names = list(name_paths)
+        scores = _compass_match_scores(_candidate_linestrings(name_paths),
+                                       ref_lat, ref_lon, compass_direction)
+        best = int(np.argmax(scores))
+        best_name = names[best] if scores[best] > -999 else None
         print(f"    Resolved '{approximate_name}' -> '{best_name}' "
               f"(best compass match for '{compass_direction}' from "
-              f"{list(name_segments.keys())})")
+              f"{list(name_paths.keys())})")
         return best_name
 
     # No compass direction — pick the name with most segments nearby
-    best = max(name_segments.keys(), key=lambda n: len(name_segments[n]))
+    best = max(name_paths.keys(), key=lambda n: len(name_paths[n]))
     print(f"    Resolved '{approximate_name}' -> '{best}' "
-          f"(most segments from {list(name_segments.keys())})")
+          f"(most segments from {list(name_paths.keys())})")
     return best
 
 
@@ -289,14 +387,43 @@ def resolve_gis_name(approximate_name, feature_type, ref_lat, ref_lon,
 # Geometry fetching
 # ---------------------------------------------------------------------------
 
-def _make_envelope_params(ref_lat, ref_lon, radius):
-    """Create ArcGIS spatial envelope parameters for bounding box queries."""
-    return {
-        "geometry": f"{ref_lon - radius},{ref_lat - radius},{ref_lon + radius},{ref_lat + radius}",
-        "geometryType": "esriGeometryEnvelope",
-        "inSR": "4326",
-        "spatialRel": "esriSpatialRelIntersects",
-    }
+# Geometry fetches only need 2D WGS84 paths: skip Z/M values and round
+# coordinates to 6 decimals (~0.1m) to shrink the JSON ArcGIS sends
+_LEAN_GEOMETRY_PARAMS = {
+    "returnZ": "false",
+    "returnM": "false",
+    "geometryPrecision": 6,
+}
+
+# Name resolution only scores candidate roads by centroid, length and
+# orientation, so its geometry can be coarser still: 5 decimals (~1m) and
+# server-side generalization to ~5m (maxAllowableOffset is in outSR units,
+# degrees here) cut the size of broad "1=1" area queries several-fold
+_SCORING_GEOMETRY_PARAMS = {
+    "returnZ": "false",
+    "returnM": "false",
+    "geometryPrecision": 5,
+    "maxAllowableOffset": 0.00005,
+}
+
+
+def _make_envelope(ref_lat, ref_lon, radius):
+    """Create an (xmin, ymin, xmax, ymax) bounding box for _query_where(envelope=...)."""
+    return (ref_lon - radius, ref_lat - radius, ref_lon + radius, ref_lat + radius)
+
+
+def _build_linestrings(paths):
+    """
+    Build one LineString per path in a single batched shapely call.
+
+    Every path must be a sequence of at least two (x, y) pairs. Returns a
+    list aligned with `paths`.
+    """
+    if not paths:
+        return []
+    coords = np.array([pt[:2] for path in paths for pt in path], dtype=np.float64)
+    indices = np.repeat(np.arange(len(paths)), [len(path) for path in paths])
+    return list(shapely.linestrings(coords, indices=indices))
 
 
 def fetch_road_linestrings(road_name, ref_lat, ref_lon, radius=0.015):
@@ -305,57 +432,79 @@ def fetch_road_linestrings(road_name, ref_lat, ref_lon, radius=0.015):
 
     Unlike query_road_geometry() which flattens all coords into one list,
     this preserves segment boundaries so linemerge() can work correctly.
+    Results are cached on disk (see cache.py); callers get their own list.
+
+    `road_name` may be a user-facing or an already-resolved GIS name:
+    normalization is idempotent and memoized, and the query envelope is only
+    built on a cache miss, so resolved names cost nothing extra here.
     """
-    road_name = normalize_road_name(road_name)
+    return list(_road_linestrings_cached(normalize_road_name(road_name),
+                                         ref_lat, ref_lon, radius))
+
+
+@persistent_cache("road_linestrings")
+def _road_linestrings_cached(road_name, ref_lat, ref_lon, radius):
+    """Uncached body of fetch_road_linestrings()."""
     where = f"LINEAR_NAME_FULL = '{road_name}'"
-    extra = _make_envelope_params(ref_lat, ref_lon, radius)
+    envelope = _make_envelope(ref_lat, ref_lon, radius)
 
-    features = _query_where(
+    # Pages stream in and only their paths are kept, not the feature dicts
+    paths = []
+    found = False
+    for f in _iter_where(
         LAYER_ROAD_CENTRELINE,
         where_clause=where,
         out_fields="LINEAR_NAME_FULL",
         return_geometry=True,
-        extra_params=extra,
-    )
-
-    if not features:
+        envelope=envelope,
+        extra_params=_LEAN_GEOMETRY_PARAMS,
+    ):
+        found = True
+        paths.extend(path for path in f.get("geometry", {}).get("paths", [])
+                     if len(path) >= 2)
+
+    if not found:
         raise ValueError(f"No road segments found for: {road_name} "
                          f"near ({ref_lat:.4f}, {ref_lon:.4f})")
 
-    lines = []
-    for f in features:
-        for path in f.get("geometry", {}).get("paths", []):
-            if len(path) >= 2:
-                lines.append(LineString(path))
-    return lines
+    return _build_linestrings(paths)
 
 
 def fetch_waterline_linestrings(waterline_name, ref_lat=None, ref_lon=None, radius=0.02):
     """
     Fetch waterline geometry as individual LineString objects per path segment.
+    Results are cached on disk (see cache.py); callers get their own list.
     """
+    return list(_waterline_linestrings_cached(waterline_name, ref_lat, ref_lon, radius))
+
+
+@persistent_cache("waterline_linestrings")
+def _waterline_linestrings_cached(waterline_name, ref_lat, ref_lon, radius):
+    """Uncached body of fetch_waterline_linestrings()."""
     where = f"WATERLINE_NAME = '{waterline_name}'"
-    extra = None
+    envelope = None
     if ref_lat is not None and ref_lon is not None:
-        extra = _make_envelope_params(ref_lat, ref_lon, radius)
+        envelope = _make_envelope(ref_lat, ref_lon, radius)
 
-    features = _query_where(
+    # Pages stream in and only their paths are kept, not the feature dicts
+    paths = []
+    found = False
+    for f in _iter_where(
         LAYER_WATERLINE,
         where_clause=where,
         out_fields="WATERLINE_NAME",
         return_geometry=True,
-        extra_params=extra,
-    )
-
-    if not features:
+        envelope=envelope,
+        extra_params=_LEAN_GEOMETRY_PARAMS,
+    ):
+        found = True
+        paths.extend(path for path in f.get("geometry", {}).get("paths", [])
+                     if len(path) >= 2)
+
+    if not found:
         raise ValueError(f"No waterline segments found for: {waterline_name}")
 
-    lines = []
-    for f in features:
-        for path in f.get("geometry", {}).get("paths", []):
-            if len(path) >= 2:
-                lines.append(LineString(path))
-    return lines
+    return _build_linestrings(paths)
 
 
 OVERPASS_ENDPOINTS = [
@@ -363,21 +512,125 @@ OVERPASS_ENDPOINTS = [
     "https://overpass.kumi.systems/api/interpreter",
 ]
 
-# Module-level Overpass throttle to respect API rate limits
-_last_overpass_time = 0
+# Module-level Overpass throttle to respect API rate limits. The lock keeps
+# concurrent boundary fetches from all passing the check at once.
+# Times are monotonic, so clock adjustments can't stretch or skip the wait;
+# the monotonic clock is system-wide, so the times also compare across
+# worker processes (see share_overpass_throttle()).
+_overpass_lock = threading.Lock()
+_last_overpass_time = ctypes.c_double(float("-inf"))
+
+
+def share_overpass_throttle(lock, last_time):
+    """
+    Throttle Overpass requests on `lock` and `last_time` instead of the
+    per-process ones.
+
+    Used as a process-pool initializer with a multiprocessing.Lock and a
+    shared Value("d"), so parallel worker processes still space their
+    Overpass requests out.
+    """
+    global _overpass_lock, _last_overpass_time
+    _overpass_lock = lock
+    _last_overpass_time = last_time
 
 
 def _overpass_throttle():
     """Wait if needed to respect Overpass API rate limits (~12s between requests)."""
-    global _last_overpass_time
     import time
-    now = time.time()
-    elapsed = now - _last_overpass_time
-    if elapsed < 12:
-        wait = 12 - elapsed
-        print(f"    (Overpass throttle: waiting {wait:.0f}s...)")
-        time.sleep(wait)
-    _last_overpass_time = time.time()
+    with _overpass_lock:
+        wait = _last_overpass_time.value + 12 - time.monotonic()
+        if wait > 0:
+            _log(f"    (Overpass throttle: waiting {wait:.0f}s...)")
+            time.sleep(wait)
+        _last_overpass_time.value = time.monotonic()
+
+
+def _overpass_fetch(endpoint, query, timeout):
+    """GET one Overpass endpoint and decode the JSON body."""
+    resp = _SESSION.get(endpoint, params={"data": query}, timeout=timeout)
+    resp.raise_for_status()
+    return _decode(resp)
+
+
+# Seconds to wait on one Overpass endpoint before trying the next one
+# alongside it
+OVERPASS_FAILOVER_DELAY = 10
+
+
+def _overpass_query(query, timeout):
+    """
+    Run an Overpass query with staggered failover across the endpoints.
+
+    Endpoints are tried in order. The next one starts as soon as the current
+    one fails, or alongside it once it has been running for
+    OVERPASS_FAILOVER_DELAY seconds, so a stalled mirror no longer costs its
+    full timeout. The first success wins. Requests run on daemon threads:
+    a request still in flight is left to finish in the background and
+    cannot hold up interpreter exit.
+
+    Waits out the throttle first; callers build their query beforehand, so
+    the request goes out as soon as the throttle window opens.
+
+    Raises the last endpoint error if every endpoint fails.
+    """
+    _overpass_throttle()
+    results = queue.SimpleQueue()
+
+    def fetch(endpoint):
+        try:
+            results.put((endpoint, _overpass_fetch(endpoint, query, timeout), None))
+        except Exception as e:
+            results.put((endpoint, None, e))
+
+    endpoints = iter(OVERPASS_ENDPOINTS)
+    remaining = len(OVERPASS_ENDPOINTS)
+    in_flight = 0
+    last_error = None
+    while True:
+        if remaining:
+            threading.Thread(target=fetch, args=(next(endpoints),), daemon=True).start()
+            remaining -= 1
+            in_flight += 1
+        elif not in_flight:
+            break
+        try:
+            endpoint, data, error = results.get(
+                timeout=OVERPASS_FAILOVER_DELAY if remaining else None)
+        except queue.Empty:
+            continue  # slow endpoint: start the next one alongside it
+        in_flight -= 1
+        if error is None:
+            return data
+        last_error = error
+        _log(f"    Overpass endpoint {endpoint.split('/')[2]} failed: {error}")
+    raise last_error or ValueError("All Overpass endpoints failed")
+
+
+def _overpass_ways(data):
+    """
+    Extract usable ways from an Overpass `out geom` response.
+
+    Returns:
+        (ways, lines): the way elements with at least two geometry points
+        (their "geometry" lists removed), and their LineStrings (aligned),
+        built in one batched call.
+    """
+    ways = [el for el in data.get("elements", [])
+            if el.get("type") == "way" and len(el.get("geometry", ())) >= 2]
+    if not ways:
+        return ways, []
+    # Stream every lon/lat straight into one float array: no per-way
+    # coordinate lists or tuples are built. Each way's point dicts (the bulk
+    # of a decoded response) are detached as they are copied, so they are
+    # freed before the LineStrings are built; callers only need the tags.
+    counts = [len(el["geometry"]) for el in ways]
+    coords = np.fromiter(
+        (v for el in ways for pt in el.pop("geometry") for v in (pt["lon"], pt["lat"])),
+        dtype=np.float64, count=2 * sum(counts),
+    ).reshape(-1, 2)
+    lines = shapely.linestrings(coords, indices=np.repeat(np.arange(len(ways)), counts))
+    return ways, list(lines)
 
 
 def fetch_waterline_overpass(waterline_name, ref_lat, ref_lon, radius=0.02):
@@ -386,12 +639,15 @@ def fetch_waterline_overpass(waterline_name, ref_lat, ref_lon, radius=0.02):
     Used as fallback when Toronto ArcGIS waterline data is too sparse.
 
     Free, no API key required. Returns much more complete creek/river geometry.
-    Tries multiple Overpass endpoints for reliability.
+    Tries multiple Overpass endpoints for reliability. Results are cached on
+    disk (see cache.py), so repeat runs skip the throttle entirely.
     """
-    import requests
-    import time
-    _overpass_throttle()
+    return list(_waterline_overpass_cached(waterline_name, ref_lat, ref_lon, radius))
+
 
+@persistent_cache("waterline_overpass")
+def _waterline_overpass_cached(waterline_name, ref_lat, ref_lon, radius):
+    """Uncached body of fetch_waterline_overpass()."""
     bbox = f"{ref_lat - radius},{ref_lon - radius},{ref_lat + radius},{ref_lon + radius}"
     query = f"""[out:json][timeout:60];
 (
@@ -399,26 +655,8 @@ def fetch_waterline_overpass(waterline_name, ref_lat, ref_lon, radius=0.02):
 );
 out geom;"""
 
-    last_error = None
-    for endpoint in OVERPASS_ENDPOINTS:
-        try:
-            resp = requests.get(endpoint, params={"data": query}, timeout=45)
-            resp.raise_for_status()
-            data = resp.json()
-
-            lines = []
-            for element in data.get("elements", []):
-                if element.get("type") == "way" and "geometry" in element:
-                    coords = [(pt["lon"], pt["lat"]) for pt in element["geometry"]]
-                    if len(coords) >= 2:
-                        lines.append(LineString(coords))
-            return lines
-        except Exception as e:
-            last_error = e
-            print(f"    Overpass endpoint {endpoint.split('/')[2]} failed: {e}")
-            time.sleep(2)
-
-    raise last_error or ValueError("All Overpass endpoints failed")
+    _, lines = _overpass_ways(_overpass_query(query, timeout=45))
+    return lines
 
 
 def fetch_road_overpass(road_name, ref_lat, ref_lon, radius=0.02):
@@ -432,11 +670,15 @@ def fetch_road_overpass(road_name, ref_lat, ref_lon, radius=0.02):
     Groups results by OSM road name and returns only the road with the most
     total geometry. This filters out unrelated roads that match the regex
     (e.g. "North Yonge Boulevard" when searching for "Yonge").
+    Results are cached on disk (see cache.py), so repeat runs skip the
+    throttle entirely.
     """
-    import requests
-    import time
-    _overpass_throttle()
+    return list(_road_overpass_cached(road_name, ref_lat, ref_lon, radius))
+
 
+@persistent_cache("road_overpass")
+def _road_overpass_cached(road_name, ref_lat, ref_lon, radius):
+    """Uncached body of fetch_road_overpass()."""
     bbox = f"{ref_lat - radius},{ref_lon - radius},{ref_lat + radius},{ref_lon + radius}"
     query = f"""[out:json][timeout:60];
 (
@@ -444,39 +686,119 @@ def fetch_road_overpass(road_name, ref_lat, ref_lon, radius=0.02):
 );
 out geom;"""
 
-    last_error = None
-    for endpoint in OVERPASS_ENDPOINTS:
-        try:
-            resp = requests.get(endpoint, params={"data": query}, timeout=45)
-            resp.raise_for_status()
-            data = resp.json()
-
-            # Group segments by exact OSM road name
-            roads = {}  # name -> [LineStrings]
-            for element in data.get("elements", []):
-                if element.get("type") == "way" and "geometry" in element:
-                    coords = [(pt["lon"], pt["lat"]) for pt in element["geometry"]]
-                    osm_name = element.get("tags", {}).get("name", "")
-                    if len(coords) >= 2:
-                        roads.setdefault(osm_name, []).append(LineString(coords))
-
-            if not roads:
-                return []
-
-            # Pick the road with the most total geometry — the actual
-            # boundary road has more segments than a short side street
-            best_name = max(roads.keys(),
-                            key=lambda n: sum(l.length for l in roads[n]))
-            print(f"    OSM: picked '{best_name}' "
-                  f"({len(roads[best_name])} segments from "
-                  f"{len(roads)} road names)")
-            return roads[best_name]
-        except Exception as e:
-            last_error = e
-            print(f"    Overpass endpoint {endpoint.split('/')[2]} failed: {e}")
-            time.sleep(2)
+    return _pick_osm_road(*_overpass_ways(_overpass_query(query, timeout=45)))
 
-    raise last_error or ValueError("All Overpass endpoints failed")
+
+def _pick_osm_road(ways, lines):
+    """
+    Keep the best road among Overpass ways matching one road name.
+
+    `ways` and `lines` are aligned, as returned by _overpass_ways().
+    """
+    # Group segments by exact OSM road name
+    roads = {}  # name -> [LineStrings]
+    for element, line in zip(ways, lines):
+        osm_name = element.get("tags", {}).get("name", "")
+        roads.setdefault(osm_name, []).append(line)
+
+    if not roads:
+        return []
+
+    # Pick the road with the most total geometry — the actual
+    # boundary road has more segments than a short side street
+    best_name = max(roads.keys(),
+                    key=lambda n: shapely.length(roads[n]).sum())
+    _log(f"    OSM: picked '{best_name}' "
+          f"({len(roads[best_name])} segments from "
+          f"{len(roads)} road names)")
+    return roads[best_name]
+
+
+# Boundary batches: one compound Overpass query covers every boundary of a
+# community. The lock makes concurrent boundary fetches wait for the first
+# one's query instead of each issuing their own.
+_overpass_batch_lock = threading.Lock()
+
+
+def _overpass_batch_query(specs, ref_lat, ref_lon, radius):
+    """Compound Overpass query for (feature_type, name) boundary specs."""
+    bbox = f"{ref_lat - radius},{ref_lon - radius},{ref_lat + radius},{ref_lon + radius}"
+    clauses = []
+    for ftype, name in specs:
+        if ftype == "street":
+            clauses.append(f'  way["name"~"{name}",i]["highway"]({bbox});')
+        else:
+            clauses.append(f'  way["name"~"{name}"]["waterway"]({bbox});')
+    return "[out:json][timeout:60];\n(\n" + "\n".join(clauses) + "\n);\nout geom;"
+
+
+@persistent_cache("boundaries_overpass")
+def _boundaries_overpass_cached(specs, ref_lat, ref_lon, radius):
+    """
+    Uncached body of _boundaries_overpass().
+
+    Each returned way is routed to every boundary whose name pattern and
+    feature tag it matches, then reduced the same way as the per-edge
+    fetchers (best road for streets, all segments for waterways).
+    """
+    ways, lines = _overpass_ways(
+        _overpass_query(_overpass_batch_query(specs, ref_lat, ref_lon, radius), timeout=45))
+
+    results = []
+    for ftype, name in specs:
+        if ftype == "street":
+            pattern, tag = re.compile(name, re.IGNORECASE), "highway"
+        else:
+            pattern, tag = re.compile(name), "waterway"
+        matched = [i for i, el in enumerate(ways)
+                   if tag in el.get("tags", {})
+                   and pattern.search(el["tags"].get("name", ""))]
+        if ftype == "street":
+            results.append(_pick_osm_road([ways[i] for i in matched],
+                                          [lines[i] for i in matched]))
+        else:
+            results.append([lines[i] for i in matched])
+    return results
+
+
+@functools.lru_cache(maxsize=8)
+def _boundaries_overpass(specs, ref_lat, ref_lon, radius):
+    """
+    Overpass geometry for several boundaries from one compound query.
+
+    Returns a list aligned with `specs`, or None if the query failed (so the
+    failure is remembered for this run and callers go per-edge instead).
+    """
+    _log(f"    Fetching {len(specs)} boundaries from Overpass in one query...")
+    try:
+        return _boundaries_overpass_cached(specs, ref_lat, ref_lon, radius)
+    except Exception as e:
+        _log(f"    Batched Overpass query failed: {e}")
+        return None
+
+
+def _overpass_fallback(boundary, ref_lat, ref_lon, radius, batch_with=None):
+    """
+    Overpass geometry for one boundary, from the community batch when possible.
+
+    `batch_with` is the community's full boundary list. The first boundary
+    that needs Overpass fetches all of them in one compound query (one
+    throttle wait instead of one per edge); later ones reuse the result.
+    Without a batch, or if it fails, the boundary is fetched on its own.
+    """
+    ftype = boundary["feature_type"]
+    fname = boundary["feature_name"]
+    specs = tuple((b["feature_type"], b["feature_name"]) for b in batch_with or ()
+                  if b["feature_type"] in ("street", "waterway"))
+    if len(specs) > 1 and (ftype, fname) in specs:
+        with _overpass_batch_lock:
+            batch = _boundaries_overpass(specs, ref_lat, ref_lon, radius)
+        if batch is not None:
+            return list(batch[specs.index((ftype, fname))])
+
+    if ftype == "street":
+        return fetch_road_overpass(fname, ref_lat, ref_lon, radius=radius)
+    return fetch_waterline_overpass(fname, ref_lat, ref_lon, radius=radius)
 
 
 def fetch_corridor_road_osm(corridor_poly, ref_lat, ref_lon):
@@ -490,10 +812,6 @@ def fetch_corridor_road_osm(corridor_poly, ref_lat, ref_lon):
     span), picks the one closest to the reference point — this naturally
     selects the community-side lane of a dual-carriageway.
     """
-    import requests
-    import time
-    _overpass_throttle()
-
     bounds = corridor_poly.bounds  # (minx, miny, maxx, maxy)
     bbox = f"{bounds[1]},{bounds[0]},{bounds[3]},{bounds[2]}"
     query = f"""[out:json][timeout:30];
@@ -501,70 +819,94 @@ way["highway"~"primary|secondary|tertiary|residential|trunk"]({bbox});
 out geom;"""
 
     ref = Point(ref_lon, ref_lat)
-    last_error = None
-    for endpoint in OVERPASS_ENDPOINTS:
-        try:
-            resp = requests.get(endpoint, params={"data": query}, timeout=30)
-            resp.raise_for_status()
-            data = resp.json()
-
-            # Group segments by road name, merge each road's segments
-            roads = {}  # name -> list of LineStrings
-            for element in data.get("elements", []):
-                if element.get("type") == "way" and "geometry" in element:
-                    coords = [(pt["lon"], pt["lat"]) for pt in element["geometry"]]
-                    name = element.get("tags", {}).get("name", f"unnamed_{element['id']}")
-                    if len(coords) >= 2:
-                        roads.setdefault(name, []).append(LineString(coords))
-
-            candidates = []
-            for name, segments in roads.items():
-                merged = linemerge(MultiLineString(segments)) if len(segments) > 1 else segments[0]
-                clipped = merged.intersection(corridor_poly)
-                if not clipped.is_empty and clipped.length > 0:
-                    span = clipped.length * 111320
-                    dist = clipped.distance(ref) * 111320
-                    candidates.append((clipped, span, dist, name))
-
-            if not candidates:
-                return None
-
-            # Pick the road that spans the longest distance in the corridor.
-            # Among similarly-long roads (>50% of max), pick closest to ref.
-            max_span = max(c[1] for c in candidates)
-            long_roads = [c for c in candidates if c[1] > max_span * 0.5]
-            best = min(long_roads, key=lambda x: x[2])
-            print(f"    OSM corridor: picked '{best[3]}' "
-                  f"(span={best[1]:.0f}m, dist={best[2]:.0f}m)")
-            result = best[0]
-            if result.geom_type == "MultiLineString":
-                result = linemerge(result)
-            # If still MultiLineString (disconnected segments), pick longest piece
-            if result.geom_type == "MultiLineString":
-                pieces = list(result.geoms)
-                result = max(pieces, key=lambda g: g.length)
-            return result if result.geom_type == "LineString" else None
-
-        except Exception as e:
-            last_error = e
-            print(f"    Overpass endpoint {endpoint.split('/')[2]} failed: {e}")
-            time.sleep(2)
+    try:
+        data = _overpass_query(query, timeout=30)
 
-    if last_error:
-        print(f"    OSM corridor road fetch failed: {last_error}")
+        # The bbox query returns every road in the corridor's bounding box;
+        # one STRtree query keeps only the segments touching the corridor
+        # itself, so the per-road merges below see far fewer segments
+        ways, lines = _overpass_ways(data)
+        if not lines:
+            return None
+        hits = np.sort(shapely.STRtree(lines).query(corridor_poly, predicate="intersects"))
+
+        # Group the surviving segments by road name, merge each road's segments
+        roads = {}  # name -> list of LineStrings
+        for i in hits:
+            element = ways[i]
+            name = element.get("tags", {}).get("name", f"unnamed_{element['id']}")
+            roads.setdefault(name, []).append(lines[i])
+        if not roads:
+            return None
+
+        # Merge every road's segments at once: one MultiLineString per road
+        # name, sewn by a single vectorized line_merge call
+        names = list(roads)
+        owner = np.repeat(np.arange(len(names)), [len(segs) for segs in roads.values()])
+        merged = shapely.line_merge(shapely.multilinestrings(
+            [seg for segs in roads.values() for seg in segs], indices=owner))
+        # Clip, measure and range every road in one vectorized pass each
+        clipped = shapely.intersection(merged, corridor_poly)
+        spans = shapely.length(clipped) * METERS_PER_DEG_LAT
+        dists = shapely.distance(clipped, ref) * METERS_PER_DEG_LAT
+        keep = ~shapely.is_empty(clipped) & (spans > 0)
+        if not keep.any():
+            return None
+
+        # Pick the road that spans the longest distance in the corridor.
+        # Among similarly-long roads (>50% of max), pick closest to ref.
+        long_roads = np.flatnonzero(keep & (spans > spans[keep].max() * 0.5))
+        best = long_roads[np.argmin(dists[long_roads])]
+        print(f"    OSM corridor: picked '{names[best]}' "
+              f"(span={spans[best]:.0f}m, dist={dists[best]:.0f}m)")
+        result = clipped[best]
+        if result.geom_type == "MultiLineString":
+            result = linemerge(result)
+        # If still MultiLineString (disconnected segments), pick longest piece
+        if result.geom_type == "MultiLineString":
+            pieces = list(result.geoms)
+            result = max(pieces, key=lambda g: g.length)
+        return result if result.geom_type == "LineString" else None
+    except Exception as e:
+        print(f"    OSM corridor road fetch failed: {e}")
     return None
 
 
 SPARSE_THRESHOLD_M = 200  # boundaries shorter than this trigger Overpass fallback
 
+KM2_PER_SQ_DEG_LAT = (METERS_PER_DEG_LAT / 1000) ** 2
+
+
+def _length_m(geoms, ref_lat):
+    """
+    Total length in meters of a geometry or list of geometries.
+
+    Coordinates are scaled once into a local equirectangular frame at
+    ref_lat (a degree of longitude is cos(lat) times a degree of latitude)
+    by one vectorized transform, instead of treating every degree as 111km.
+    """
+    arr = np.atleast_1d(np.asarray(geoms, dtype=object))
+    scale = np.array([math.cos(math.radians(ref_lat)), 1.0])
+    projected = shapely.transform(arr, lambda c: c * scale)
+    return float(shapely.length(projected).sum() * METERS_PER_DEG_LAT)
+
+
+def _area_km2(polygon, ref_lat):
+    """Polygon area in km^2 (or an array of them) in the same local frame as _length_m()."""
+    return shapely.area(polygon) * KM2_PER_SQ_DEG_LAT * math.cos(math.radians(ref_lat))
+
 
-def fetch_boundary_geometry(boundary, ref_lat, ref_lon, search_radius=0.015):
+def fetch_boundary_geometry(boundary, ref_lat, ref_lon, search_radius=0.015,
+                            batch_with=None):
     """
     Fetch real GIS geometry for a single boundary edge.
 
     For waterways: tries Toronto ArcGIS first, falls back to Overpass API
     if the ArcGIS data is too sparse (< 200m total geometry).
 
+    `batch_with` (the community's boundary list) lets the Overpass fallback
+    fetch every boundary in one compound query; see _overpass_fallback().
+
     Returns:
         list of shapely.geometry.LineString
     """
@@ -579,17 +921,17 @@ def fetch_boundary_geometry(boundary, ref_lat, ref_lon, search_radius=0.015):
             pass
 
         # Fallback: OpenStreetMap via Overpass API
-        print(f"    ArcGIS has no data for '{fname}'. Trying Overpass API...")
+        _log(f"    ArcGIS has no data for '{fname}'. Trying Overpass API...")
         try:
-            osm_lines = fetch_road_overpass(fname, ref_lat, ref_lon,
-                                            radius=search_radius + 0.01)
+            osm_lines = _overpass_fallback(boundary, ref_lat, ref_lon,
+                                           search_radius + 0.01, batch_with)
             if osm_lines:
-                osm_length = sum(l.length for l in osm_lines) * 111320
-                print(f"    Overpass returned {len(osm_lines)} segments, "
+                osm_length = _length_m(osm_lines, ref_lat)
+                _log(f"    Overpass returned {len(osm_lines)} segments, "
                       f"~{osm_length:.0f}m")
                 return osm_lines
         except Exception as e:
-            print(f"    Overpass fallback failed: {e}")
+            _log(f"    Overpass fallback failed: {e}")
 
         raise ValueError(f"No road segments found for: {fname} "
                          f"(ArcGIS + Overpass)")
@@ -601,18 +943,19 @@ def fetch_boundary_geometry(boundary, ref_lat, ref_lon, search_radius=0.015):
             lines = []
 
         # Check if ArcGIS data is sufficient
-        total_length = sum(l.length for l in lines) * 111320 if lines else 0
+        total_length = _length_m(lines, ref_lat) if lines else 0
         if total_length < SPARSE_THRESHOLD_M:
-            print(f"    ArcGIS waterline sparse ({total_length:.0f}m). "
+            _log(f"    ArcGIS waterline sparse ({total_length:.0f}m). "
                   f"Trying Overpass API...")
             try:
-                osm_lines = fetch_waterline_overpass(fname, ref_lat, ref_lon, radius=search_radius + 0.01)
+                osm_lines = _overpass_fallback(boundary, ref_lat, ref_lon,
+                                               search_radius + 0.01, batch_with)
                 if osm_lines:
-                    osm_length = sum(l.length for l in osm_lines) * 111320
-                    print(f"    Overpass returned {len(osm_lines)} segments, ~{osm_length:.0f}m")
+                    osm_length = _length_m(osm_lines, ref_lat)
+                    _log(f"    Overpass returned {len(osm_lines)} segments, ~{osm_length:.0f}m")
                     return osm_lines
             except Exception as e:
-                print(f"    Overpass fallback failed: {e}")
+                _log(f"    Overpass fallback failed: {e}")
 
         if not lines:
             raise ValueError(f"No waterline segments found for: {fname}")
@@ -625,14 +968,21 @@ def fetch_boundary_geometry(boundary, ref_lat, ref_lon, search_radius=0.015):
 # Line processing helpers
 # ---------------------------------------------------------------------------
 
-def _line_substring(line, start_dist, end_dist, num_points=200):
-    """Extract a sub-segment of a LineString between two distances along it."""
-    if start_dist > end_dist:
-        start_dist, end_dist = end_dist, start_dist
-    distances = np.linspace(start_dist, end_dist, num_points)
-    points = [line.interpolate(d) for d in distances]
-    coords = [(p.x, p.y) for p in points]
-    return LineString(coords)
+def _line_substring_coords(lines, start_dists, end_dists, num_points=200):
+    """
+    Coordinates of the sub-segments of LineStrings between two distances along each.
+
+    Takes aligned sequences and returns a (len(lines), num_points, 2) array;
+    callers adjust the end points before building segments, so no
+    intermediate LineString is made.
+    """
+    lo = np.minimum(start_dists, end_dists)
+    hi = np.maximum(start_dists, end_dists)
+    distances = np.linspace(lo, hi, num_points, axis=-1)
+    # One vectorized GEOS call for every point of every line, then one copy
+    points = shapely.line_interpolate_point(
+        np.asarray(lines, dtype=object)[:, None], distances)
+    return shapely.get_coordinates(points).reshape(len(lines), num_points, 2)
 
 
 def _apply_corridor_clip(clipped, prev_corner, next_corner, boundary,
@@ -643,64 +993,77 @@ def _apply_corridor_clip(clipped, prev_corner, next_corner, boundary,
         clipped = linemerge(clipped)
     if clipped.geom_type != "LineString":
         return False
+    cc = shapely.get_coordinates(clipped)
+    corner_xy = np.array([[prev_corner.x, prev_corner.y],
+                          [next_corner.x, next_corner.y]])
     # Orient from prev_corner to next_corner
-    if (Point(clipped.coords[0]).distance(next_corner)
-            < Point(clipped.coords[0]).distance(prev_corner)):
-        clipped = LineString(list(reversed(clipped.coords)))
-    cc = list(clipped.coords)
-    cc[0] = (prev_corner.x, prev_corner.y)
-    cc[-1] = (next_corner.x, next_corner.y)
+    d2 = ((corner_xy - cc[0]) ** 2).sum(axis=1)
+    if d2[1] < d2[0]:
+        cc = cc[::-1].copy()
+    cc[0] = corner_xy[0]
+    cc[-1] = corner_xy[1]
     segment = LineString(cc)
     ring_segments.append(segment)
     print(f"    {boundary['feature_name']}: corridor-clipped from {source} "
-          f"({len(cc)} pts, ~{segment.length * 111320:.0f}m)")
+          f"({len(cc)} pts, ~{segment.length * METERS_PER_DEG_LAT:.0f}m)")
     return True
 
 
-def _chain_segments_spatially(linestrings, compass_direction):
+def _chain_segments_spatially(linestrings, compass_direction, centroids=None):
     """
     Chain line segments spatially when linemerge produces too many fragments.
 
     OSM data has gaps at intersection nodes (10-22m) where divided road lanes
     have separate nodes. linemerge requires exact endpoint matches and fails.
-    This fallback sorts segments along the road direction and concatenates
-    them, bridging the gaps.
+    This fallback starts from the segment at one end of the road and keeps
+    appending whichever remaining segment has an endpoint nearest the chain's
+    tail, bridging the gaps. Unlike a plain sort by centroid, this follows
+    curved roads whose segments double back along the sort axis.
 
     For divided roads, segments from both directions get interleaved, creating
     a small zigzag (~15m oscillation) that's acceptable for polygon construction.
+
+    `centroids` may pass in the segments' (N, 2) centroid array if the caller
+    already has it.
     """
     if not linestrings:
         return None
     if len(linestrings) == 1:
         return linestrings[0]
 
-    # Determine sort axis from compass direction
-    # North/south boundaries run east-west -> sort by centroid longitude (x)
-    # East/west boundaries run north-south -> sort by centroid latitude (y)
+    # Determine the road axis from compass direction
+    # North/south boundaries run east-west -> start at the westmost segment (x)
+    # East/west boundaries run north-south -> start at the southmost segment (y)
     sort_by_x = compass_direction in ("north", "south")
     if not sort_by_x and compass_direction not in ("east", "west"):
         # Compound directions: check which axis dominates
         sort_by_x = "north" in compass_direction or "south" in compass_direction
-
-    if sort_by_x:
-        sorted_segs = sorted(linestrings, key=lambda ls: ls.centroid.x)
-    else:
-        sorted_segs = sorted(linestrings, key=lambda ls: ls.centroid.y)
-
-    # Chain: append each segment in the correct orientation
-    chain_coords = list(sorted_segs[0].coords)
-    for seg in sorted_segs[1:]:
-        seg_coords = list(seg.coords)
-        chain_end = chain_coords[-1]
-        d_start = ((chain_end[0] - seg_coords[0][0])**2 +
-                   (chain_end[1] - seg_coords[0][1])**2)**0.5
-        d_end = ((chain_end[0] - seg_coords[-1][0])**2 +
-                 (chain_end[1] - seg_coords[-1][1])**2)**0.5
-        if d_end < d_start:
-            seg_coords = list(reversed(seg_coords))
-        chain_coords.extend(seg_coords)
-
-    return LineString(chain_coords)
+    axis = 0 if sort_by_x else 1
+
+    coords = [shapely.get_coordinates(ls) for ls in linestrings]
+    ends = np.array([(c[0], c[-1]) for c in coords])  # (N, 2 ends, xy)
+    if centroids is None:
+        centroids = shapely.get_coordinates(shapely.centroid(linestrings))
+
+    # First segment, oriented to run away from the road's end
+    current = int(np.argmin(centroids[:, axis]))
+    first = coords[current]
+    if first[0, axis] > first[-1, axis]:
+        first = first[::-1]
+    chain = [first]
+    remaining = np.ones(len(coords), dtype=bool)
+    remaining[current] = False
+
+    # Greedy chain: one vectorized distance pass over all endpoints per step
+    for _ in range(len(coords) - 1):
+        d2 = ((ends - chain[-1][-1]) ** 2).sum(axis=2)
+        d2[~remaining] = np.inf
+        k, at_end = divmod(int(np.argmin(d2)), 2)
+        # Enter the segment at its nearest endpoint
+        chain.append(coords[k][::-1] if at_end else coords[k])
+        remaining[k] = False
+
+    return LineString(np.concatenate(chain))
 
 
 def _merge_and_select(linestrings, clip_box=None, compass_direction=None,
@@ -710,7 +1073,7 @@ def _merge_and_select(linestrings, clip_box=None, compass_direction=None,
 
     Args:
         linestrings: list of LineString objects
-        clip_box: optional shapely Polygon to clip to
+        clip_box: optional axis-aligned box (shapely.geometry.box) to clip to
         compass_direction: e.g. "north", "east", "west_and_south" — used to
             filter out segments on the wrong side of the reference point
         ref_lat, ref_lon: reference point coordinates for compass filtering
@@ -721,37 +1084,46 @@ def _merge_and_select(linestrings, clip_box=None, compass_direction=None,
     if not linestrings:
         return None
 
-    total_raw = sum(ls.length for ls in linestrings) * 111320
+    total_raw = _length_m(linestrings, ref_lat or 0.0)
     print(f"      [merge] input: {len(linestrings)} segments, ~{total_raw:.0f}m")
 
-    # Clip to bounding box if provided
+    # Clip to bounding box if provided. An STRtree query picks out the
+    # segments whose extents touch the box; the rest can't intersect it.
+    # Segments whose extents lie inside the box are kept as-is; only those
+    # crossing its edge are clipped, in one vectorized call. The result is
+    # flattened to its non-empty LineString parts.
     if clip_box:
-        clipped = []
-        for ls in linestrings:
-            intersection = ls.intersection(clip_box)
-            if not intersection.is_empty:
-                if intersection.geom_type == "LineString":
-                    clipped.append(intersection)
-                elif intersection.geom_type == "MultiLineString":
-                    clipped.extend(intersection.geoms)
+        candidates = np.sort(shapely.STRtree(linestrings).query(clip_box))
+        pieces = np.array(linestrings, dtype=object)[candidates]
+        seg_bounds = shapely.bounds(pieces)
+        bx = clip_box.bounds
+        crossing = ((seg_bounds[:, 0] < bx[0]) | (seg_bounds[:, 1] < bx[1])
+                    | (seg_bounds[:, 2] > bx[2]) | (seg_bounds[:, 3] > bx[3]))
+        pieces[crossing] = shapely.intersection(pieces[crossing], clip_box)
+        pieces = shapely.get_parts(pieces)
+        clipped = [g for g in pieces if g.geom_type == "LineString" and not g.is_empty]
         linestrings = clipped if clipped else linestrings
-        total_clip = sum(ls.length for ls in linestrings) * 111320
+        total_clip = _length_m(linestrings, ref_lat or 0.0)
         print(f"      [merge] after clip_box: {len(linestrings)} segments, ~{total_clip:.0f}m")
 
-    # Filter by compass direction — discard segments on the wrong side
+    # Filter by compass direction — discard segments on the wrong side.
+    # The centroids are kept for the spatial chain fallback below.
+    centroids = None
     if compass_direction and ref_lat is not None and ref_lon is not None:
-        filtered = _filter_by_compass(linestrings, ref_lat, ref_lon,
-                                      compass_direction)
-        if filtered:
-            total_compass = sum(ls.length for ls in filtered) * 111320
+        centroids = shapely.get_coordinates(shapely.centroid(linestrings))
+        mask = _compass_mask(centroids, ref_lat, ref_lon, compass_direction)
+        if mask.any():
+            filtered = np.asarray(linestrings, dtype=object)[mask].tolist()
+            total_compass = _length_m(filtered, ref_lat or 0.0)
             print(f"      [merge] after compass({compass_direction}): "
                   f"{len(filtered)} segments, ~{total_compass:.0f}m")
             linestrings = filtered
+            centroids = centroids[mask]
         else:
             print(f"      [merge] compass({compass_direction}): ALL filtered out, keeping original")
 
     # Merge connected segments
-    merged = linemerge(MultiLineString(linestrings))
+    merged = shapely.line_merge(shapely.multilinestrings(linestrings))
 
     # If MultiLineString, select the most relevant component:
     # the longest one within max_dist of the reference point.
@@ -762,20 +1134,21 @@ def _merge_and_select(linestrings, clip_box=None, compass_direction=None,
         # Use clip_box diagonal as max distance (adapts to community size)
         if clip_box:
             bx = clip_box.bounds
-            max_dist = max(bx[2] - bx[0], bx[3] - bx[1]) * 111320
+            max_dist = max(bx[2] - bx[0], bx[3] - bx[1]) * METERS_PER_DEG_LAT
         else:
             max_dist = 2000
-        candidates = [(g, g.length, g.distance(ref) * 111320)
-                      for g in merged.geoms]
-        total_merged = sum(g.length for g in merged.geoms)
-        max_component = max(g.length for g in merged.geoms)
+        parts = shapely.get_parts(merged)
+        lengths = shapely.length(parts)
+        dists = shapely.distance(parts, ref) * METERS_PER_DEG_LAT
+        total_merged = float(lengths.sum())
+        max_component = float(lengths.max())
 
-        print(f"      [merge] after linemerge: {len(candidates)} components, "
+        print(f"      [merge] after linemerge: {len(parts)} components, "
               f"max_dist={max_dist:.0f}m")
         # Show top 5 components by length
-        by_len = sorted(candidates, key=lambda x: x[1], reverse=True)[:5]
-        for g, length, dist in by_len:
-            print(f"        ~{length * 111320:.0f}m, dist={dist:.0f}m")
+        for k in np.argsort(-lengths, kind="stable")[:5]:
+            print(f"        ~{lengths[k] * METERS_PER_DEG_LAT:.0f}m, "
+                  f"dist={dists[k]:.0f}m")
 
         # If linemerge is badly fragmented (longest < 40% of total),
         # fall back to spatial chaining — common with OSM data where
@@ -783,106 +1156,146 @@ def _merge_and_select(linestrings, clip_box=None, compass_direction=None,
         if max_component < total_merged * 0.4 and compass_direction:
             print(f"      [merge] fragmented ({max_component/total_merged:.0%} "
                   f"in longest) — using spatial chain")
-            merged = _chain_segments_spatially(linestrings, compass_direction)
+            merged = _chain_segments_spatially(linestrings, compass_direction,
+                                               centroids)
         else:
-            nearby = [(g, length) for g, length, dist in candidates
-                      if dist < max_dist]
-            if nearby:
-                merged = max(nearby, key=lambda x: x[1])[0]
+            nearby = np.flatnonzero(dists < max_dist)
+            if len(nearby):
+                merged = parts[nearby[np.argmax(lengths[nearby])]]
             else:
                 # All far away — take the closest
-                merged = min(candidates, key=lambda x: x[2])[0]
+                merged = parts[np.argmin(dists)]
 
     return merged
 
 
-def _filter_by_compass(linestrings, ref_lat, ref_lon, compass_direction):
+def _compass_mask(centroids, ref_lat, ref_lon, compass_direction):
     """
-    Keep only linestrings whose centroid is in the expected compass direction
+    Mask of segments whose centroid is in the expected compass direction
     relative to the reference point.
 
-    A "north" boundary should have segments north of (higher lat than) the
-    reference point. Uses a small margin to avoid cutting segments that
-    straddle the boundary.
+    `centroids` is an (N, 2) array of segment centroids (lon, lat). A "north"
+    boundary should have segments north of (higher lat than) the reference
+    point. Uses a small margin to avoid cutting segments that straddle the
+    boundary.
     """
     margin = 0.003  # ~330m margin
+    cx, cy = centroids[:, 0], centroids[:, 1]
 
-    kept = []
-    for ls in linestrings:
-        c = ls.centroid
-
-        if compass_direction == "north":
-            if c.y >= ref_lat - margin:
-                kept.append(ls)
-        elif compass_direction == "south":
-            if c.y <= ref_lat + margin:
-                kept.append(ls)
-        elif compass_direction == "east":
-            if c.x >= ref_lon - margin:
-                kept.append(ls)
-        elif compass_direction == "west":
-            if c.x <= ref_lon + margin:
-                kept.append(ls)
-        elif compass_direction in ("west_and_south", "south_and_west"):
-            # Keep segments west OR south of reference
-            if c.x <= ref_lon + margin or c.y <= ref_lat + margin:
-                kept.append(ls)
-        else:
-            kept.append(ls)  # Unknown direction — keep everything
-
-    return kept if kept else None  # Return None if everything filtered out
+    if compass_direction == "north":
+        mask = cy >= ref_lat - margin
+    elif compass_direction == "south":
+        mask = cy <= ref_lat + margin
+    elif compass_direction == "east":
+        mask = cx >= ref_lon - margin
+    elif compass_direction == "west":
+        mask = cx <= ref_lon + margin
+    elif compass_direction in ("west_and_south", "south_and_west"):
+        # Keep segments west OR south of reference
+        mask = (cx <= ref_lon + margin) | (cy <= ref_lat + margin)
+    else:
+        mask = np.ones(len(centroids), dtype=bool)  # Unknown direction — keep everything
+    return mask
 
 
+@functools.lru_cache(maxsize=256)
 def _geocode_intersection_all(road_a, road_b, city="Toronto, ON"):
     """
     Geocode a road intersection using all available geocoders.
-    Returns a list of candidate Points (may be empty).
-    Deduplicates points within 50m of each other.
+    Returns a tuple of candidate Points (may be empty).
+    Candidates within 50m of each other are merged into their centroid.
+
+    Memoized per (road_a, road_b, city) for the run, so corners geocoded
+    up front by construct_from_boundaries() are not looked up again.
+    Non-empty results are also cached on disk (see cache.py), so repeat
+    runs skip the geocoders entirely; a miss is retried next run.
+    """
+    try:
+        return _geocode_intersection_cached(road_a, road_b, city)
+    except LookupError:
+        return ()
+
+
+@persistent_cache("intersections")
+def _geocode_intersection_cached(road_a, road_b, city):
+    """
+    Uncached body of _geocode_intersection_all().
+
+    Raises LookupError when no geocoder finds the intersection, so that
+    misses (often transient) are not cached.
     """
     from geocoder import geocode_nominatim, geocode_google
     from config import GOOGLE_MAPS_API_KEY
 
-    candidates = []
     queries = [
         f"{road_a} & {road_b}, {city}",
         f"{road_b} & {road_a}, {city}",
     ]
 
+    tasks = []
     for query in queries:
-        # Try Google
+        # Try Google, then Nominatim
         if GOOGLE_MAPS_API_KEY:
-            try:
-                result = geocode_google(query)
-                candidates.append(Point(result["lon"], result["lat"]))
-            except Exception:
-                pass
-        # Try Nominatim
-        try:
-            result = geocode_nominatim(query)
-            candidates.append(Point(result["lon"], result["lat"]))
-        except Exception:
-            pass
+            tasks.append((geocode_google, query))
+        tasks.append((geocode_nominatim, query))
 
     # Also try "at" format for Nominatim
     for query in [f"{road_a} at {road_b}, {city}", f"{road_b} at {road_a}, {city}"]:
+        tasks.append((geocode_nominatim, query))
+
+    def lookup(task):
+        provider, query = task
         try:
-            result = geocode_nominatim(query)
-            candidates.append(Point(result["lon"], result["lat"]))
+            result = provider(query)
+            return Point(result["lon"], result["lat"])
         except Exception:
-            pass
+            return None
+
+    # All lookups are independent, so they run concurrently (Nominatim's
+    # still go one at a time, see geocoder.py); results keep task order
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        candidates = [pt for pt in pool.map(lookup, tasks) if pt is not None]
+
+    if not candidates:
+        raise LookupError(f"No geocoder found {road_a} & {road_b}, {city}")
+    # Geocoders agreeing within 50m are one candidate, at their centroid
+    return _cluster_points(candidates, 50)
+
+
+def _component_labels(count, left, right):
+    """
+    Connected-component label for each of `count` items, given neighbour
+    index pairs (as from STRtree.query on the items themselves).
+
+    Each item is labelled with the lowest index in its component, found by
+    propagating the minimum label along the pairs until nothing changes.
+    """
+    labels = np.arange(count)
+    while True:
+        lowest = labels.copy()
+        np.minimum.at(lowest, left, labels[right])
+        if np.array_equal(lowest, labels):
+            return labels
+        labels = lowest
+
 
-    # Deduplicate — keep only points >50m apart
-    unique = []
-    for pt in candidates:
-        is_dup = False
-        for existing in unique:
-            if pt.distance(existing) * 111320 < 50:
-                is_dup = True
-                break
-        if not is_dup:
-            unique.append(pt)
+def _cluster_points(points, radius_m):
+    """
+    Merge points that are within radius_m of each other (transitively).
+
+    Returns a tuple with one Point per cluster, the centroid of its members,
+    ordered by each cluster's first member.
+    Neighbour pairs come from one STRtree "dwithin" query.
+    """
+    pts = np.array(points, dtype=object)
+    left, right = shapely.STRtree(pts).query(
+        pts, predicate="dwithin", distance=radius_m / METERS_PER_DEG_LAT)
+    labels = _component_labels(len(pts), left, right)
 
-    return unique
+    members = np.unique(labels, return_inverse=True)[1]
+    order = np.argsort(members, kind="stable")
+    return tuple(shapely.centroid(
+        shapely.multipoints(pts[order], indices=members[order])))
 
 
 def _find_corner(boundary_i, boundary_j, line_i, line_j, city="Toronto, ON"):
@@ -920,19 +1333,28 @@ def _find_corner(boundary_i, boundary_j, line_i, line_j, city="Toronto, ON"):
     for group_label, gi, gj in name_groups:
         points = _geocode_intersection_all(gi, gj, city=city)
 
-        for pt in points:
-            snap_i = line_i.interpolate(line_i.project(pt))
-            snap_j = line_j.interpolate(line_j.project(pt))
-            di = pt.distance(snap_i) * 111320
-            dj = pt.distance(snap_j) * 111320
+        if points:
+            # Snap every candidate onto both lines in one batch: row 0 is
+            # line_i, row 1 is line_j. The first candidate that validates
+            # against either line wins, as candidates are in geocoder order.
+            pts = np.asarray(points, dtype=object)
+            lines = np.array([[line_i], [line_j]], dtype=object)
+            snaps = shapely.line_interpolate_point(
+                lines, shapely.line_locate_point(lines, pts))
+            dists = shapely.distance(pts, snaps) * METERS_PER_DEG_LAT
+            valid = (dists.max(axis=0) < 500) | (dists.min(axis=0) < 200)
+
+            if valid.any():
+                k = int(np.argmax(valid))
+                snap_i, snap_j = snaps[:, k]
+                di, dj = dists[:, k].tolist()
+
+                if max(di, dj) < 500:
+                    corner = Point((snap_i.x + snap_j.x) / 2,
+                                   (snap_i.y + snap_j.y) / 2)
+                    gap_m = snap_i.distance(snap_j) * METERS_PER_DEG_LAT
+                    return corner, gap_m, "geocoded+snapped"
 
-            if max(di, dj) < 500:
-                corner = Point((snap_i.x + snap_j.x) / 2,
-                               (snap_i.y + snap_j.y) / 2)
-                gap_m = snap_i.distance(snap_j) * 111320
-                return corner, gap_m, "geocoded+snapped"
-
-            if min(di, dj) < 200:
                 closer = snap_i if di < dj else snap_j
                 gap_m = max(di, dj)
                 return closer, gap_m, "geocoded+partial"
@@ -944,13 +1366,22 @@ def _find_corner(boundary_i, boundary_j, line_i, line_j, city="Toronto, ON"):
         if points and group_label == "original":
             break
 
-    # Strategy 2: Actual geometric intersection
-    ix = line_i.intersection(line_j)
-    if not ix.is_empty:
-        if ix.geom_type == "Point":
-            return ix, 0, "intersection"
-        elif hasattr(ix, 'centroid'):
-            return ix.centroid, 0, "intersection"
+    # Index line_i's parts once so the intersection and nearest-point
+    # strategies below only touch parts whose bounding boxes can matter
+    parts_i = shapely.get_parts(line_i)
+    tree_i = shapely.STRtree(parts_i)
+
+    # Strategy 2: Actual geometric intersection (skipped outright when no
+    # part of line_i intersects line_j)
+    hits = np.sort(tree_i.query(line_j, predicate="intersects"))
+    if len(hits):
+        near_i = parts_i[hits[0]] if len(hits) == 1 else MultiLineString(list(parts_i[hits]))
+        ix = near_i.intersection(line_j)
+        if not ix.is_empty:
+            if ix.geom_type == "Point":
+                return ix, 0, "intersection"
+            elif hasattr(ix, 'centroid'):
+                return ix.centroid, 0, "intersection"
 
     # Strategy 3: Extrapolate endpoints to find projected intersection
     # Handles cases where roads cross at different elevations (bridge/valley)
@@ -958,29 +1389,39 @@ def _find_corner(boundary_i, boundary_j, line_i, line_j, city="Toronto, ON"):
     corner = _extrapolate_corner(line_i, line_j)
     if corner:
         # Compute gap: distance from the projected corner to both original lines
-        d_i = line_i.distance(corner) * 111320
-        d_j = line_j.distance(corner) * 111320
-        gap = max(d_i, d_j)
+        gap = float(shapely.distance([line_i, line_j], corner).max()
+                    * METERS_PER_DEG_LAT)
         if gap < 2000:  # Reasonable extrapolation
             return corner, gap, "extrapolated"
 
-    # Strategy 4: Nearest points fallback
+    # Strategy 4: Nearest points fallback. Snap every endpoint of each line
+    # onto the other in one batch and keep the closest pair.
     best_pt = None
     best_gap = float('inf')
 
     for line_a, line_b in [(line_i, line_j), (line_j, line_i)]:
-        for ep in _get_endpoints(line_a):
-            snap = line_b.interpolate(line_b.project(ep))
-            gap = ep.distance(snap) * 111320
-            if gap < best_gap:
-                best_gap = gap
-                best_pt = Point((ep.x + snap.x) / 2, (ep.y + snap.y) / 2)
-
-    p1, p2 = nearest_points(line_i, line_j)
-    gap_np = p1.distance(p2) * 111320
-    if gap_np < best_gap:
-        best_gap = gap_np
-        best_pt = Point((p1.x + p2.x) / 2, (p1.y + p2.y) / 2)
+        eps = np.asarray(_get_endpoints(line_a), dtype=object)
+        if not len(eps):
+            continue
+        snaps = shapely.line_interpolate_point(
+            line_b, shapely.line_locate_point(line_b, eps))
+        gaps = shapely.distance(eps, snaps) * METERS_PER_DEG_LAT
+        k = int(np.argmin(gaps))
+        if gaps[k] < best_gap:
+            best_gap = float(gaps[k])
+            ep, snap = eps[k], snaps[k]
+            best_pt = Point((ep.x + snap.x) / 2, (ep.y + snap.y) / 2)
+
+    # The index already knows the nearest part's distance, so the exact
+    # nearest_points pair is only computed when it could beat the endpoints
+    (k,), (dist_np,) = tree_i.query_nearest(
+        line_j, all_matches=False, return_distance=True)
+    if dist_np * METERS_PER_DEG_LAT <= best_gap + 1e-6:
+        p1, p2 = nearest_points(parts_i[k], line_j)
+        gap_np = p1.distance(p2) * METERS_PER_DEG_LAT
+        if gap_np < best_gap:
+            best_gap = gap_np
+            best_pt = Point((p1.x + p2.x) / 2, (p1.y + p2.y) / 2)
 
     if best_pt and best_gap <= 1200:
         return best_pt, best_gap, "nearest"
@@ -988,6 +1429,24 @@ def _find_corner(boundary_i, boundary_j, line_i, line_j, city="Toronto, ON"):
     return None, None, None
 
 
+def _distances_to_line(points, line, index_from=16):
+    """
+    Distance from each of `points` to `line`, as shapely.distance(points, line).
+
+    A road with many parts has as many endpoints, and a plain distance call
+    measures every endpoint against every part. From `index_from` parts on,
+    an STRtree over the parts answers each point from its nearest part.
+    """
+    parts = shapely.get_parts(line)
+    if len(parts) < index_from:
+        return shapely.distance(points, line)
+    (idx, _), dist = shapely.STRtree(parts).query_nearest(
+        points, all_matches=False, return_distance=True)
+    out = np.empty(len(points))
+    out[idx] = dist
+    return out
+
+
 def _extrapolate_corner(line_i, line_j, extension_m=2000):
     """
     Find where two non-intersecting lines would meet if extended.
@@ -1001,22 +1460,14 @@ def _extrapolate_corner(line_i, line_j, extension_m=2000):
     - GIS centrelines have large gaps at intersections (100-1500m)
     - A waterway goes underground near a road crossing
     """
-    ext_deg = extension_m / 111320  # rough conversion
-
-    # Find the pair of "facing" endpoints — each line's endpoint closest to the other
-    best_pairs = []
-    for ep_i in _get_endpoints(line_i):
-        d = line_j.distance(ep_i)
-        best_pairs.append((d, ep_i, 'i'))
-    for ep_j in _get_endpoints(line_j):
-        d = line_i.distance(ep_j)
-        best_pairs.append((d, ep_j, 'j'))
+    ext_deg = extension_m / METERS_PER_DEG_LAT  # rough conversion
 
-    # Get the closest endpoint from each line
-    facing_i = min((d, ep) for d, ep, which in best_pairs if which == 'i')
-    facing_j = min((d, ep) for d, ep, which in best_pairs if which == 'j')
-    ep_i = facing_i[1]
-    ep_j = facing_j[1]
+    # Find the pair of "facing" endpoints — each line's endpoint closest to
+    # the other, from one vectorized distance call per line
+    eps_i = np.array(_get_endpoints(line_i), dtype=object)
+    eps_j = np.array(_get_endpoints(line_j), dtype=object)
+    ep_i = eps_i[np.argmin(_distances_to_line(eps_i, line_j))]
+    ep_j = eps_j[np.argmin(_distances_to_line(eps_j, line_i))]
 
     # Get direction vectors at these endpoints (average of last N segments)
     dir_i = _endpoint_direction(line_i, ep_i, n_points=5)
@@ -1025,12 +1476,13 @@ def _extrapolate_corner(line_i, line_j, extension_m=2000):
     if dir_i is None or dir_j is None:
         return None
 
-    # Extend both endpoints along their direction
-    ext_end_i = Point(ep_i.x + dir_i[0] * ext_deg, ep_i.y + dir_i[1] * ext_deg)
-    ext_end_j = Point(ep_j.x + dir_j[0] * ext_deg, ep_j.y + dir_j[1] * ext_deg)
-
-    ext_line_i = LineString([(ep_i.x, ep_i.y), (ext_end_i.x, ext_end_i.y)])
-    ext_line_j = LineString([(ep_j.x, ep_j.y), (ext_end_j.x, ext_end_j.y)])
+    # Extend both endpoints along their direction: row 0 is line_i, row 1
+    # line_j, so both extensions come from one array expression
+    ep_xy = np.array([[ep_i.x, ep_i.y], [ep_j.x, ep_j.y]])
+    ext_xy = ep_xy + np.array([dir_i, dir_j]) * ext_deg
+    ext_ends = shapely.points(ext_xy)
+    ext_end_i, ext_end_j = ext_ends
+    ext_line_i, ext_line_j = shapely.linestrings(np.stack([ep_xy, ext_xy], axis=1))
 
     ix = ext_line_i.intersection(ext_line_j)
     if not ix.is_empty:
@@ -1040,18 +1492,19 @@ def _extrapolate_corner(line_i, line_j, extension_m=2000):
         return pt
 
     # Extensions didn't cross — try snapping one extension to the other line
-    snap_ext_i_on_j = line_j.interpolate(line_j.project(ext_end_i))
-    snap_ext_j_on_i = line_i.interpolate(line_i.project(ext_end_j))
+    # (both snaps and both distances in one vectorized call each)
+    others = np.array([line_j, line_i], dtype=object)
+    snap_ext_i_on_j, snap_ext_j_on_i = shapely.line_interpolate_point(
+        others, shapely.line_locate_point(others, ext_ends))
 
     # Use the extension that gets closer to the other line
-    d1 = ext_end_i.distance(snap_ext_i_on_j)
-    d2 = ext_end_j.distance(snap_ext_j_on_i)
+    d1, d2 = shapely.distance(ext_ends, [snap_ext_i_on_j, snap_ext_j_on_i]).tolist()
 
-    if d1 < d2 and d1 * 111320 < 500:
+    if d1 < d2 and d1 * METERS_PER_DEG_LAT < 500:
         pt = Point((ext_end_i.x + snap_ext_i_on_j.x) / 2,
                     (ext_end_i.y + snap_ext_i_on_j.y) / 2)
         return pt
-    elif d2 * 111320 < 500:
+    elif d2 * METERS_PER_DEG_LAT < 500:
         pt = Point((ext_end_j.x + snap_ext_j_on_i.x) / 2,
                     (ext_end_j.y + snap_ext_j_on_i.y) / 2)
         return pt
@@ -1069,66 +1522,132 @@ def _endpoint_direction(line, endpoint, n_points=5):
         or None if can't determine.
     """
     if line.geom_type == "MultiLineString":
-        # Find which sub-line contains this endpoint
-        for part in line.geoms:
-            coords = list(part.coords)
-            if (abs(coords[0][0] - endpoint.x) < 1e-8 and
-                    abs(coords[0][1] - endpoint.y) < 1e-8):
-                return _endpoint_direction(part, endpoint, n_points)
-            if (abs(coords[-1][0] - endpoint.x) < 1e-8 and
-                    abs(coords[-1][1] - endpoint.y) < 1e-8):
-                return _endpoint_direction(part, endpoint, n_points)
-        return None
-
-    coords = list(line.coords)
+        # Find which sub-line contains this endpoint: every part's first and
+        # last coordinates come out as two arrays, compared in one pass
+        parts = shapely.get_parts(line)
+        xy = (endpoint.x, endpoint.y)
+        starts = shapely.get_coordinates(shapely.get_point(parts, 0))
+        ends = shapely.get_coordinates(shapely.get_point(parts, -1))
+        at_start = (np.abs(starts - xy) < 1e-8).all(axis=1)
+        match = at_start | (np.abs(ends - xy) < 1e-8).all(axis=1)
+        if not match.any():
+            return None
+        # The scan already knows which end matched, so read the part's
+        # direction straight from its coordinates
+        k = int(np.argmax(match))
+        return _direction_from_coords(shapely.get_coordinates(parts[k]),
+                                      bool(at_start[k]), n_points)
+
+    coords = shapely.get_coordinates(line)
     if len(coords) < 2:
         return None
 
     # Determine if endpoint is at start or end
-    is_start = (abs(coords[0][0] - endpoint.x) < 1e-8 and
-                abs(coords[0][1] - endpoint.y) < 1e-8)
-    is_end = (abs(coords[-1][0] - endpoint.x) < 1e-8 and
-              abs(coords[-1][1] - endpoint.y) < 1e-8)
+    xy = (endpoint.x, endpoint.y)
+    if (np.abs(coords[0] - xy) < 1e-8).all():
+        return _direction_from_coords(coords, True, n_points)
+    if (np.abs(coords[-1] - xy) < 1e-8).all():
+        return _direction_from_coords(coords, False, n_points)
+    return None
+
 
-    if is_start:
+def _direction_from_coords(coords, at_start, n_points=5):
+    """
+    Numeric core of _endpoint_direction() on an (N, 2) coordinate array.
+
+    Returns the normalized outward (dx, dy) at the start (or end) of the
+    coordinates, averaged over the last n_points, or None if degenerate.
+    """
+    n = min(n_points, len(coords))
+    if at_start:
         # Direction = from interior toward start (outward)
-        n = min(n_points, len(coords))
-        dx = coords[0][0] - coords[n - 1][0]
-        dy = coords[0][1] - coords[n - 1][1]
-    elif is_end:
-        # Direction = from interior toward end (outward)
-        n = min(n_points, len(coords))
-        dx = coords[-1][0] - coords[-n][0]
-        dy = coords[-1][1] - coords[-n][1]
+        dx, dy = coords[0] - coords[n - 1]
     else:
-        return None
+        # Direction = from interior toward end (outward)
+        dx, dy = coords[-1] - coords[-n]
 
     # Normalize
-    mag = (dx ** 2 + dy ** 2) ** 0.5
+    mag = math.hypot(dx, dy)
     if mag < 1e-10:
         return None
-    return (dx / mag, dy / mag)
+    return (float(dx / mag), float(dy / mag))
 
 
 def _get_endpoints(line):
     """Get the start and end points of a LineString or MultiLineString."""
-    endpoints = []
-    if line.geom_type == "LineString":
-        coords = list(line.coords)
-        endpoints.append(Point(coords[0]))
-        endpoints.append(Point(coords[-1]))
-    elif line.geom_type == "MultiLineString":
-        for part in line.geoms:
-            coords = list(part.coords)
-            endpoints.append(Point(coords[0]))
-            endpoints.append(Point(coords[-1]))
-    return endpoints
+    if line.geom_type not in ("LineString", "MultiLineString"):
+        return []
+    # First and last point of every part, without copying any coordinates
+    # out: (start, end) per part, in part order
+    parts = shapely.get_parts(line)
+    return np.column_stack([shapely.get_point(parts, 0),
+                            shapely.get_point(parts, -1)]).ravel().tolist()
 
 
 # ---------------------------------------------------------------------------
 # Boundary name resolution (pre-pass)
 # ---------------------------------------------------------------------------
 
+def _resolve_boundary_direct(b, ref_lat, ref_lon):
+    """
+    Pass 1 of _resolve_all_boundary_names() for one boundary: exact or LIKE match.
+
+    Updates `b` in place. Run under _run_logged() so the boundaries can be
+    resolved concurrently and still report in order.
+    """
+    ftype = b["feature_type"]
+    fname = b["feature_name"]
+
+    if ftype == "street":
+        normalized = b.get("gis_hint") or normalize_road_name(fname)
+        field = "LINEAR_NAME_FULL"
+        layer = LAYER_ROAD_CENTRELINE
+    elif ftype == "waterway":
+        normalized = fname
+        field = "WATERLINE_NAME"
+        layer = LAYER_WATERLINE
+    else:
+        b["_resolved"] = True
+        return
+
+    # Check if exact/LIKE match works
+    envelope = _make_envelope(ref_lat, ref_lon, 0.02)
+    features = _query_where_cached(
+        layer, where_clause=f"{field} = '{normalized}'",
+        out_fields=field, return_geometry=False, envelope=envelope,
+    )
+    if features:
+        if normalized != fname:
+            _log(f"    '{fname}' -> '{normalized}' (exact match)")
+        b["feature_name"] = normalized
+        b["_resolved"] = True
+    else:
+        # Try LIKE
+        base = fname.split()[0]
+        features = _query_where_cached(
+            layer, where_clause=f"UPPER({field}) LIKE '%{base.upper()}%'",
+            out_fields=field, return_geometry=False, envelope=envelope,
+        )
+        if features:
+            # Pick first unique name
+            names = set()
+            for f in features:
+                name = (f.get("attributes", {}).get(field)
+                        or f.get(field))
+                if name:
+                    names.add(name)
+            if len(names) == 1:
+                resolved_name = names.pop()
+                _log(f"    '{fname}' -> '{resolved_name}' (LIKE match)")
+                b["feature_name"] = resolved_name
+                b["_resolved"] = True
+            else:
+                b["_resolved"] = False
+                b["_like_names"] = names
+        else:
+            b["_resolved"] = False
+
+
 def _resolve_all_boundary_names(boundaries, ref_lat, ref_lon, city="Toronto, ON"):
     """
     Resolve all boundary names to exact GIS field values.
@@ -1151,60 +1670,17 @@ def _resolve_all_boundary_names(boundaries, ref_lat, ref_lon, city="Toronto, ON"
 
     print("  Resolving boundary names...")
 
-    # Pass 1: Direct resolution
-    for b in resolved:
-        ftype = b["feature_type"]
-        fname = b["feature_name"]
-        compass = b.get("compass_direction")
-
-        if ftype == "street":
-            normalized = b.get("gis_hint") or normalize_road_name(fname)
-            field = "LINEAR_NAME_FULL"
-            layer = LAYER_ROAD_CENTRELINE
-        elif ftype == "waterway":
-            normalized = fname
-            field = "WATERLINE_NAME"
-            layer = LAYER_WATERLINE
-        else:
-            b["_resolved"] = True
-            continue
-
-        # Check if exact/LIKE match works
-        envelope = _make_envelope_params(ref_lat, ref_lon, 0.02)
-        features = _query_where(
-            layer, where_clause=f"{field} = '{normalized}'",
-            out_fields=field, return_geometry=False, extra_params=envelope,
-        )
-        if features:
-            if normalized != fname:
-                print(f"    '{fname}' -> '{normalized}' (exact match)")
-            b["feature_name"] = normalized
-            b["_resolved"] = True
-        else:
-            # Try LIKE
-            base = fname.split()[0]
-            features = _query_where(
-                layer, where_clause=f"UPPER({field}) LIKE '%{base.upper()}%'",
-                out_fields=field, return_geometry=False, extra_params=envelope,
-            )
-            if features:
-                # Pick first unique name
-                names = set()
-                for f in features:
-                    name = (f.get("attributes", {}).get(field)
-                            or f.get(field))
-                    if name:
-                        names.add(name)
-                if len(names) == 1:
-                    resolved_name = names.pop()
-                    print(f"    '{fname}' -> '{resolved_name}' (LIKE match)")
-                    b["feature_name"] = resolved_name
-                    b["_resolved"] = True
-                else:
-                    b["_resolved"] = False
-                    b["_like_names"] = names
-            else:
-                b["_resolved"] = False
+    # Pass 1: Direct resolution. Each boundary is independent network work,
+    # so they resolve concurrently and report in boundary order.
+    with ThreadPoolExecutor(max_workers=min(n, 8) or 1) as pool:
+        futures = [pool.submit(_run_logged, _resolve_boundary_direct, b, ref_lat, ref_lon)
+                   for b in resolved]
+        for future in futures:
+            lines, _, error = future.result()
+            for line in lines:
+                print(line)
+            if error is not None:
+                raise error
 
     # Pass 2: Intersection-based resolution for unresolved boundaries
     # Skip if no boundaries resolved at all (non-Toronto area — ArcGIS has no data)
@@ -1226,6 +1702,13 @@ def _resolve_all_boundary_names(boundaries, ref_lat, ref_lon, city="Toronto, ON"
         print(f"    '{b['feature_name']}' not found in GIS. "
               f"Trying intersection-based resolution...")
 
+        # Geocode the intersections with both adjacent boundaries at once;
+        # the loop below then reads the memoized results in order
+        adj_names = [resolved[(i + di) % n]["feature_name"] for di in (-1, 1)]
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(lambda adj: _geocode_intersection_all(approx, adj, city=city),
+                          adj_names))
+
         # Try geocoding intersection with each adjacent boundary
         for di in [-1, 1]:
             j = (i + di) % n
@@ -1242,42 +1725,23 @@ def _resolve_all_boundary_names(boundaries, ref_lat, ref_lon, city="Toronto, ON"
             # Search for what roads exist at this intersection
             # Use a generous radius — geocoded points can be offset
             # from the actual GIS geometry by 500-800m
-            local_env = _make_envelope_params(pt.y, pt.x, 0.008)
-            features = _query_where(
-                LAYER_ROAD_CENTRELINE,
-                where_clause="1=1",
-                out_fields="LINEAR_NAME_FULL",
-                return_geometry=True,
-                extra_params=local_env,
-            )
+            # (same cached candidate table as resolve_gis_name's fallback,
+            # so both neighbours of a corner share one query and one table)
+            names, table = _area_candidates("street", _make_envelope(pt.y, pt.x, 0.008))
 
-            if not features:
-                continue
-
-            # Collect unique names (excluding the adjacent boundary's name)
-            name_segments = {}
-            for f in features:
-                name = (f.get("attributes", {}).get("LINEAR_NAME_FULL")
-                        or f.get("LINEAR_NAME_FULL"))
-                if not name or name == adj_name:
-                    continue
-                if name not in name_segments:
-                    name_segments[name] = []
-                for path in f.get("geometry", {}).get("paths", []):
-                    if len(path) >= 2:
-                        name_segments[name].append(LineString(path))
-
-            if not name_segments:
+            # Unique names, excluding the adjacent boundary's name
+            keep = np.flatnonzero(np.asarray(names, dtype=object) != adj_name)
+            if not len(keep):
                 continue
 
-            # Pick the best match by compass direction
-            if compass and len(name_segments) > 1:
-                best = max(name_segments.keys(),
-                           key=lambda nm: _compass_match_score(
-                               name_segments[nm], ref_lat, ref_lon, compass))
+            # Pick the best match by compass direction, else the name with
+            # the most segments (both pure array lookups on the table)
+            if compass and len(keep) > 1:
+                scores = _compass_match_scores(None, ref_lat, ref_lon, compass,
+                                               table=table)
             else:
-                best = max(name_segments.keys(),
-                           key=lambda nm: len(name_segments[nm]))
+                scores = table["segments"]
+            best = names[keep[np.argmax(scores[keep])]]
 
             print(f"    Resolved '{b['feature_name']}' -> '{best}' "
                   f"(found at intersection with {adj_name})")
@@ -1297,7 +1761,50 @@ def _resolve_all_boundary_names(boundaries, ref_lat, ref_lon, city="Toronto, ON"
 # Approach A: Boundary Lines -> Polygon
 # ---------------------------------------------------------------------------
 
-def construct_from_boundaries(description, ref_lat, ref_lon):
+def _stitch_ring(segments):
+    """
+    Join consecutive ring segments into one closed (N, 2) coordinate array.
+
+    Each segment after the first starts at the previous one's end corner,
+    so its first point is dropped; the ring is closed if needed. All
+    coordinates come out of GEOS in one call.
+    """
+    coords, owner = shapely.get_coordinates(segments, return_index=True)
+    keep = np.ones(len(coords), dtype=bool)
+    keep[1:] = owner[1:] == owner[:-1]
+    ring = coords[keep]
+    if not np.array_equal(ring[0], ring[-1]):
+        ring = np.vstack([ring, ring[:1]])
+    return ring
+
+
+def _zoning_fallback(description, ref_lat, ref_lon, approach_b=None):
+    """
+    Build the community's zoning parcel union (Approach B) as a fallback.
+
+    `approach_b` is an already-submitted Future for
+    construct_from_zoning_exception(); its result is reused rather than
+    querying the parcels a second time.
+
+    Returns None when the description has no zoning exception or the
+    parcel query fails.
+    """
+    ze = description.get("zoning_exception")
+    if not ze:
+        return None
+    try:
+        if approach_b is not None:
+            polygon, _ = approach_b.result()
+        else:
+            polygon, _ = construct_from_zoning_exception(
+                ze["exception_number"], ze.get("zone_type"), ref_lat, ref_lon)
+    except Exception as e:
+        print(f"    Zoning fallback unavailable: {e}")
+        return None
+    return polygon
+
+
+def construct_from_boundaries(description, ref_lat, ref_lon, approach_b=None):
     """
     Approach A: Construct polygon from boundary line geometries.
 
@@ -1309,12 +1816,18 @@ def construct_from_boundaries(description, ref_lat, ref_lon):
     4. Clip each boundary to the segment between its two corners
     5. Assemble clipped segments into a closed polygon ring
 
+    If any boundary fetch fails and the description has a zoning exception,
+    the zoning parcel union stands in when too few boundaries are usable or
+    the assembled ring misses the reference point. `approach_b` (a Future
+    for construct_from_zoning_exception(), if Approach B is already running)
+    supplies that union without a second parcel query.
+
     Returns:
-        (polygon, boundary_lines) where boundary_lines is list of
-        (LineString, meta_dict) tuples for visualization
+        (polygon, boundary_lines, used_fallback) where boundary_lines is list
+        of (LineString, meta_dict) tuples for visualization, and
+        used_fallback is True when polygon is the zoning parcel union
     """
     boundaries = description["boundaries"]
-    reference_point = Point(ref_lon, ref_lat)
 
     # Extract city from reference address for geocoding outside Toronto
     ref_address = description.get("reference_point", {}).get("address", "")
@@ -1325,18 +1838,30 @@ def construct_from_boundaries(description, ref_lat, ref_lon):
     # Pre-resolve boundary names to exact GIS field values
     boundaries = _resolve_all_boundary_names(boundaries, ref_lat, ref_lon, city=city)
 
-    # Pass 1: Fetch all boundary geometries
+    # Pass 1: Fetch all boundary geometries. Each fetch is an independent
+    # network round-trip, so they run concurrently; each fetch's progress
+    # lines are buffered and reported in boundary order.
     raw_lines = []
-    for b in boundaries:
-        print(f"  Fetching {b['feature_type']}: {b['feature_name']}...")
-        try:
-            linestrings = fetch_boundary_geometry(b, ref_lat, ref_lon,
-                                                  search_radius=0.03)
-            print(f"    Got {len(linestrings)} segments")
-            raw_lines.append(linestrings)
-        except Exception as e:
-            print(f"    WARNING: {e}")
-            raw_lines.append(None)
+    with ThreadPoolExecutor(max_workers=min(len(boundaries), 8) or 1) as pool:
+        futures = [pool.submit(_run_logged, fetch_boundary_geometry, b, ref_lat, ref_lon,
+                               search_radius=0.03, batch_with=boundaries)
+                   for b in boundaries]
+        for b, future in zip(boundaries, futures):
+            lines, linestrings, error = future.result()
+            print(f"  Fetching {b['feature_type']}: {b['feature_name']}...")
+            for line in lines:
+                print(line)
+            if error is None:
+                print(f"    Got {len(linestrings)} segments")
+                raw_lines.append(linestrings)
+            else:
+                print(f"    WARNING: {error}")
+                raw_lines.append(None)
+
+    # Parcels are only fetched once a boundary is known to be missing
+    fallback = None
+    if any(group is None for group in raw_lines):
+        fallback = _zoning_fallback(description, ref_lat, ref_lon, approach_b)
 
     # Compute work_box from actual geometry bounds (data-driven)
     all_segments = [ls for group in raw_lines if group for ls in group]
@@ -1361,26 +1886,49 @@ def construct_from_boundaries(description, ref_lat, ref_lon):
         merged = _merge_and_select(raw_lines[i], clip_box=work_box,
                                    compass_direction=b.get("compass_direction"),
                                    ref_lat=ref_lat, ref_lon=ref_lon)
-        total_length_m = merged.length * 111320 if merged else 0
+        total_length_m = _length_m(merged, ref_lat) if merged else 0
         print(f"    {b['feature_name']}: merged {merged.geom_type}, "
               f"~{total_length_m:.0f}m")
         merged_lines.append(merged)
         viz_lines.append((merged, b))
 
     # Check which boundaries have usable geometry
-    usable = [(i, ml) for i, ml in enumerate(merged_lines) if ml is not None and ml.length > 0.0001]
+    # One vectorized length/emptiness pass; missing boundaries (None) give
+    # NaN length and compare False below
+    merged_arr = np.array(merged_lines, dtype=object)
+    merged_lengths = shapely.length(merged_arr)
+    usable = np.flatnonzero(merged_lengths > 0.0001)
     if len(usable) < 2:
+        if fallback is not None:
+            print(f"\n  Only {len(usable)} boundaries have usable geometry: "
+                  f"using zoning parcel union instead")
+            return fallback, [(merged_lines[i], boundaries[i]) for i in usable], True
         raise ValueError(f"Only {len(usable)} boundaries have usable geometry. Need at least 2.")
 
     sparse_threshold = 0.001  # ~111m - boundaries shorter than this are "sparse"
-    for i, ml in enumerate(merged_lines):
-        if ml and ml.length < sparse_threshold:
-            print(f"    WARNING: {boundaries[i]['feature_name']} has sparse geometry "
-                  f"({ml.length * 111320:.0f}m). Will use available points.")
+    sparse = ~shapely.is_empty(merged_arr) & (merged_lengths < sparse_threshold)
+    for i in np.flatnonzero(sparse):
+        print(f"    WARNING: {boundaries[i]['feature_name']} has sparse geometry "
+              f"({_length_m(merged_lines[i], ref_lat):.0f}m). Will use available points.")
 
     # Find "corner" points between adjacent boundary pairs
     # Boundaries are ordered around the perimeter, so boundary[i] and boundary[i+1] share a corner
     n = len(boundaries)
+
+    # Geocode every corner's intersection up front and concurrently, using
+    # the names _find_corner tries first; it then reads the memoized
+    # results. Nominatim calls themselves stay one at a time (geocoder.py).
+    geocode_pairs = list(dict.fromkeys(
+        (boundaries[i].get("_original_name", boundaries[i]["feature_name"]),
+         boundaries[(i + 1) % n].get("_original_name", boundaries[(i + 1) % n]["feature_name"]))
+        for i in range(n)
+        if merged_lines[i] is not None and merged_lines[(i + 1) % n] is not None
+    ))
+    if geocode_pairs:
+        with ThreadPoolExecutor(max_workers=min(len(geocode_pairs), 8)) as pool:
+            list(pool.map(lambda pair: _geocode_intersection_all(*pair, city=city),
+                          geocode_pairs))
+
     corners = []
     print("\n  Finding boundary corners...")
     for i in range(n):
@@ -1415,6 +1963,24 @@ def construct_from_boundaries(description, ref_lat, ref_lon):
     print("\n  Building polygon ring...")
     ring_segments = []
 
+    # Project both corners of every boundary onto its line in one vectorized
+    # call (row 0: previous corners, row 1: next corners), then sample every
+    # boundary's sub-segment in one more, instead of GEOS round-trips per
+    # boundary
+    projectable = [i for i in range(n)
+                   if corners[(i - 1) % n] is not None and corners[i] is not None
+                   and merged_lines[i] is not None and not merged_lines[i].is_empty]
+    projections = {}
+    substrings = {}
+    if projectable:
+        proj_lines = np.array([merged_lines[i] for i in projectable], dtype=object)
+        proj_corners = np.array([[corners[(i - 1) % n] for i in projectable],
+                                 [corners[i] for i in projectable]], dtype=object)
+        starts, ends = shapely.line_locate_point(proj_lines, proj_corners)
+        projections = dict(zip(projectable, zip(starts.tolist(), ends.tolist())))
+        substrings = dict(zip(projectable, _line_substring_coords(
+            proj_lines, starts, ends, num_points=100)))
+
     for i in range(n):
         prev_corner = corners[(i - 1) % n]
         next_corner = corners[i]
@@ -1439,9 +2005,8 @@ def construct_from_boundaries(description, ref_lat, ref_lon):
             print(f"    {boundaries[i]['feature_name']}: straight line (sparse geometry)")
             continue
 
-        # Project corners onto the boundary line and extract sub-segment
-        d_start = line.project(prev_corner)
-        d_end = line.project(next_corner)
+        # Corners projected onto the boundary line; extract the sub-segment
+        d_start, d_end = projections[i]
 
         if abs(d_start - d_end) < 0.00001:
             # Corners project to same point - use straight line
@@ -1452,27 +2017,28 @@ def construct_from_boundaries(description, ref_lat, ref_lon):
             print(f"    {boundaries[i]['feature_name']}: straight line (corners too close on line)")
             continue
 
-        segment = _line_substring(line, d_start, d_end, num_points=100)
+        coords = substrings[i]
 
         # Ensure segment starts at prev_corner and ends at next_corner
         # (the substring might go in wrong direction along the line)
-        seg_start = Point(segment.coords[0])
-        if seg_start.distance(next_corner) < seg_start.distance(prev_corner):
+        corner_xy = np.array([[prev_corner.x, prev_corner.y],
+                              [next_corner.x, next_corner.y]])
+        d2 = ((corner_xy - coords[0]) ** 2).sum(axis=1)
+        if d2[1] < d2[0]:
             # Segment is reversed - flip it
-            segment = LineString(list(reversed(segment.coords)))
+            coords = coords[::-1]
 
         # Force-connect to exact corner points
-        coords = list(segment.coords)
-        coords[0] = (prev_corner.x, prev_corner.y)
-        coords[-1] = (next_corner.x, next_corner.y)
+        coords[0] = corner_xy[0]
+        coords[-1] = corner_xy[1]
         segment = LineString(coords)
 
         # Detour detection: if a road boundary curves far away from the
         # straight line between corners (>2.5x the direct distance), try
         # corridor clipping. First try ArcGIS geometry, then fetch the
         # closest road from OSM within the corridor (name-free).
-        seg_len = segment.length * 111320
-        straight_len = prev_corner.distance(next_corner) * 111320
+        seg_len = segment.length * METERS_PER_DEG_LAT
+        straight_len = prev_corner.distance(next_corner) * METERS_PER_DEG_LAT
         if (straight_len > 0 and seg_len > straight_len * 2.5
                 and boundaries[i]["feature_type"] == "street"):
             straight = LineString([
@@ -1482,9 +2048,22 @@ def construct_from_boundaries(description, ref_lat, ref_lon):
             corridor = straight.buffer(0.002)  # ~220m at Toronto latitude
             used_corridor = False
 
-            # Try corridor clip on ArcGIS geometry first
-            clipped = line.intersection(corridor)
-            if not clipped.is_empty and clipped.length * 111320 > straight_len * 0.5:
+            # Try corridor clip on ArcGIS geometry first. Only parts whose
+            # bounding boxes overlap the corridor's can contribute, so the
+            # overlay skips the rest of a long multi-part road.
+            parts = shapely.get_parts(line)
+            pb = shapely.bounds(parts)
+            cb = corridor.bounds
+            near = parts[(pb[:, 0] <= cb[2]) & (pb[:, 2] >= cb[0])
+                         & (pb[:, 1] <= cb[3]) & (pb[:, 3] >= cb[1])]
+            if not len(near):
+                clipped = LineString()
+            elif len(near) == len(parts):
+                clipped = line.intersection(corridor)
+            else:
+                clipped = shapely.multilinestrings(near).intersection(corridor)
+            if (not clipped.is_empty
+                    and clipped.length * METERS_PER_DEG_LAT > straight_len * 0.5):
                 used_corridor = _apply_corridor_clip(
                     clipped, prev_corner, next_corner, boundaries[i], ring_segments)
 
@@ -1515,97 +2094,184 @@ def construct_from_boundaries(description, ref_lat, ref_lon):
     if not ring_segments:
         raise ValueError("No ring segments could be constructed")
 
-    # Assemble ring from segments
-    all_coords = []
-    for seg in ring_segments:
-        coords = list(seg.coords)
-        if all_coords:
-            # Skip first point if it's the same as the last (they share a corner)
-            all_coords.extend(coords[1:])
-        else:
-            all_coords.extend(coords)
-
-    # Close the ring
-    if all_coords[0] != all_coords[-1]:
-        all_coords.append(all_coords[0])
+    all_coords = _stitch_ring(ring_segments)
 
     try:
-        polygon = Polygon(all_coords)
+        polygon = shapely.polygons(all_coords)
         if not polygon.is_valid:
-            polygon = polygon.buffer(0)
-        # buffer(0) can produce MultiPolygon - take largest
-        if isinstance(polygon, MultiPolygon):
-            polygon = max(polygon.geoms, key=lambda p: p.area)
+            # make_valid can return a MultiPolygon or a collection with
+            # stray lines - take the largest polygonal part
+            parts = shapely.get_parts(shapely.make_valid(polygon))
+            parts = parts[shapely.get_type_id(parts) == 3]
+            polygon = parts[np.argmax(shapely.area(parts))]
     except Exception as e:
-        raise ValueError(f"Failed to create polygon: {e}")
+        if fallback is None:
+            raise ValueError(f"Failed to create polygon: {e}")
+        print(f"\n  Failed to create polygon ({e}): using zoning parcel union instead")
+        polygon = fallback
 
-    contains_ref = polygon.contains(reference_point)
-    area_km2 = polygon.area * (111.32 ** 2)
+    contains_ref = bool(shapely.contains_xy(polygon, ref_lon, ref_lat))
+    area_km2 = _area_km2(polygon, ref_lat)
     print(f"\n  Polygon area: ~{area_km2:.3f} km^2")
     print(f"  Reference point inside: {'YES' if contains_ref else 'NO'}")
 
+    if fallback is not None and polygon is not fallback:
+        overlap = polygon.intersection(fallback).area / fallback.area
+        print(f"  Overlap with zoning parcel union: {overlap:.0%}")
+        if not contains_ref and shapely.contains_xy(fallback, ref_lon, ref_lat):
+            print("  Reference point outside ring: using zoning parcel union instead")
+            polygon = fallback
+
     # Filter viz_lines to only usable ones
     viz_lines = [(ml, b) for ml, b in zip(merged_lines, boundaries) if ml is not None]
 
-    return polygon, viz_lines
+    return polygon, viz_lines, polygon is fallback
 
 
 # ---------------------------------------------------------------------------
 # Approach B: Zoning Exception Union
 # ---------------------------------------------------------------------------
 
-def construct_from_zoning_exception(exc_number, zone_type, ref_lat, ref_lon, radius=0.015):
+# shapely 2.1+ on GEOS 3.12+ can union mostly-disjoint inputs per connected
+# subset; older builds use the cascaded union_all (STRtree-bucketed)
+if hasattr(shapely, "disjoint_subset_union_all") and shapely.geos_version >= (3, 12, 0):
+    _overlay_union = shapely.disjoint_subset_union_all
+else:
+    _overlay_union = shapely.union_all
+
+
+def _union_parcels(parcels, jobs=1):
+    """
+    Union an array of parcel polygons, fastest path first.
+
+    Zoning lots normally form a coverage (edge-matched, non-overlapping),
+    which coverage_union_all merges by dropping shared edges without any
+    overlay, an order of magnitude faster. It does not check its input:
+    overlapping or edge-mismatched lots either raise or come back as an
+    invalid result, and are then redone with the general union.
+
+    With jobs > 1 the general union is split into that many west-to-east
+    strips of parcels, unioned on worker threads (GEOS releases the GIL),
+    and the partial results unioned once more.
+
+    Always returns a valid geometry (repaired with make_valid if needed).
+    """
+    try:
+        result = shapely.coverage_union_all(parcels)
+        if result.is_valid:
+            return result
+    except GEOSException:
+        pass
+    if jobs > 1 and len(parcels) >= 2 * jobs:
+        bounds = shapely.bounds(parcels)
+        order = np.argsort(bounds[:, 0] + bounds[:, 2], kind="stable")
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            partials = list(pool.map(_overlay_union, np.array_split(parcels[order], jobs)))
+        result = _overlay_union(partials)
+    else:
+        result = _overlay_union(parcels)
+    return result if result.is_valid else shapely.make_valid(result)
+
+
+def construct_from_zoning_exception(exc_number, zone_type, ref_lat, ref_lon, radius=0.015,
+                                    log=print, jobs=1, simplify_tol=None):
     """
     Approach B: Construct polygon by unioning all zoning parcels with a given exception.
+
+    Progress lines go to `log` (e.g. a list's append, to print them later
+    when running alongside Approach A). `jobs` threads share the parcel
+    union when the parcels don't form a clean coverage; `simplify_tol`
+    (degrees) simplifies the parcels first.
     """
-    print(f"\n  [Approach B: Zoning Exception Union (x{exc_number} {zone_type})]")
+    log(f"\n  [Approach B: Zoning Exception Union (x{exc_number} {zone_type})]")
 
     zone_data = query_exception_zone(exc_number, zone_type, ref_lat, ref_lon, radius)
 
     if "error" in zone_data:
         raise ValueError(f"No parcels found: {zone_data['error']}")
 
-    parcel_polygons = []
-    for feature in zone_data["features"]:
-        rings = feature.get("geometry", {}).get("rings", [])
-        if rings:
-            exterior = rings[0]
-            holes = rings[1:] if len(rings) > 1 else []
-            try:
-                p = Polygon(exterior, holes)
-                if not p.is_valid:
-                    p = p.buffer(0)
-                if isinstance(p, MultiPolygon):
-                    parcel_polygons.extend(p.geoms)
-                elif p.area > 0:
-                    parcel_polygons.append(p)
-            except Exception:
-                continue
-
-    if not parcel_polygons:
+    # Parcels whose rings all have the 3+ vertices a ring needs (the first
+    # ring is the exterior, the rest are holes)
+    parcel_rings = [rings for rings in (feature.get("geometry", {}).get("rings", [])
+                                        for feature in zone_data["features"])
+                    if rings and all(len(ring) >= 3 for ring in rings)]
+
+    # Every parcel goes through GEOS in two batched calls: linearrings over
+    # all vertices (closing open rings, as Polygon() does), then polygons
+    # grouping each parcel's exterior and holes
+    raw_polygons = np.empty(0, dtype=object)
+    if parcel_rings:
+        ring_sizes = [len(ring) for rings in parcel_rings for ring in rings]
+        coords = np.array([pt for rings in parcel_rings for ring in rings for pt in ring],
+                          dtype=np.float64)
+        ring_owner = np.repeat(np.arange(len(ring_sizes)), ring_sizes)
+        parcel_owner = np.repeat(np.arange(len(parcel_rings)),
+                                 [len(rings) for rings in parcel_rings])
+        raw_polygons = shapely.polygons(shapely.linearrings(coords, indices=ring_owner),
+                                        indices=parcel_owner)
+
+    # One vectorized validity check, then make_valid on just the invalid
+    # parcels; repairs may yield collections with stray lines/points, so
+    # explode and keep only non-empty polygonal parts
+    invalid = ~shapely.is_valid(raw_polygons)
+    if invalid.any():
+        raw_polygons[invalid] = shapely.make_valid(raw_polygons[invalid])
+    parts = shapely.get_parts(raw_polygons)
+    parcel_polygons = parts[(shapely.get_type_id(parts) == 3) & (shapely.area(parts) > 0)]
+
+    if not len(parcel_polygons):
         raise ValueError("No valid parcel polygons could be constructed")
 
-    print(f"    Parcels found: {len(parcel_polygons)}")
-    community_polygon = unary_union(parcel_polygons)
+    log(f"    Parcels found: {len(parcel_polygons)}")
+    # Parcels form a few clusters of touching lots, and only one becomes the
+    # community polygon: the one at the reference point, else the largest.
+    # Group them with one STRtree query and union just that cluster.
+    left, right = shapely.STRtree(parcel_polygons).query(
+        parcel_polygons, predicate="intersects")
+    labels = _component_labels(len(parcel_polygons), left, right)
+    at_ref = labels[shapely.intersects_xy(parcel_polygons, ref_lon, ref_lat)]
+    if len(at_ref):
+        in_cluster = np.isin(labels, at_ref)
+    else:
+        cluster_area = np.bincount(labels, weights=shapely.area(parcel_polygons))
+        in_cluster = labels == np.argmax(cluster_area)
+
+    cluster = parcel_polygons[in_cluster]
+
+    # Optional vertex thinning before the union. coverage_simplify moves the
+    # edge shared by two lots the same way for both, so the cluster still
+    # merges as a coverage; simplifying lots one by one would open slivers.
+    if simplify_tol:
+        if hasattr(shapely, "coverage_simplify") and shapely.geos_version >= (3, 12, 0):
+            cluster = shapely.coverage_simplify(cluster, simplify_tol)
+        else:
+            cluster = shapely.simplify(cluster, simplify_tol)
 
-    if not community_polygon.is_valid:
-        community_polygon = community_polygon.buffer(0)
+    # The coverage union just drops shared edges; the fallback unions are
+    # already cascaded inside GEOS (STRtree-ordered pairwise merges), so
+    # chunking the input gains nothing on a single thread
+    community_polygon = _union_parcels(cluster, jobs)
+
+    if community_polygon.geom_type == "GeometryCollection":
+        polys = [g for g in community_polygon.geoms if g.geom_type == "Polygon"]
+        community_polygon = MultiPolygon(polys) if len(polys) > 1 else polys[0]
 
     # Ensure we return a Polygon (not MultiPolygon)
+    # Point-in-polygon tests use contains_xy: one vectorized call over all
+    # parts, with no Point objects built for the reference location
     if isinstance(community_polygon, MultiPolygon):
         # Take the largest polygon, or the one containing the reference point
-        ref = Point(ref_lon, ref_lat)
-        for geom in community_polygon.geoms:
-            if geom.contains(ref):
-                community_polygon = geom
-                break
+        parts = shapely.get_parts(community_polygon)
+        inside = np.flatnonzero(shapely.contains_xy(parts, ref_lon, ref_lat))
+        if len(inside):
+            community_polygon = parts[inside[0]]
         else:
-            community_polygon = max(community_polygon.geoms, key=lambda p: p.area)
+            community_polygon = parts[np.argmax(shapely.area(parts))]
 
-    area_km2 = community_polygon.area * (111.32 ** 2)
-    print(f"    Union area: ~{area_km2:.3f} km^2")
-    print(f"    Reference point inside: "
-          f"{'YES' if community_polygon.contains(Point(ref_lon, ref_lat)) else 'NO'}")
+    area_km2 = _area_km2(community_polygon, ref_lat)
+    log(f"    Union area: ~{area_km2:.3f} km^2")
+    log(f"    Reference point inside: "
+          f"{'YES' if shapely.contains_xy(community_polygon, ref_lon, ref_lat) else 'NO'}")
 
     return community_polygon, len(parcel_polygons)
 
@@ -1614,60 +2280,136 @@ def construct_from_zoning_exception(exc_number, zone_type, ref_lat, ref_lon, rad
 # Export
 # ---------------------------------------------------------------------------
 
-def export_geojson(polygons_data, boundary_lines, metadata, output_path):
-    """Export as GeoJSON FeatureCollection."""
-    features = []
-
-    for polygon, label, source in polygons_data:
-        features.append({
-            "type": "Feature",
-            "properties": {
-                "name": label,
-                "source": source,
-                "area_deg2": polygon.area,
-            },
-            "geometry": mapping(polygon),
-        })
-
-    for line, bmeta in boundary_lines:
-        features.append({
-            "type": "Feature",
-            "properties": {
-                "name": bmeta["feature_name"],
-                "feature_type": bmeta["feature_type"],
-                "compass_direction": bmeta.get("compass_direction", ""),
-                "layer": "boundary_line",
-            },
-            "geometry": mapping(line),
-        })
+def _polygon_rings(polygons):
+    """
+    Ring coordinates of every Polygon/MultiPolygon, read out of GEOS at once.
 
-    geojson = {"type": "FeatureCollection", "features": features}
+    Returns one entry per input polygon: a list of its parts, each a list of
+    (N, 2) ring arrays with the exterior first. The GeoJSON and KML writers
+    share this, so an export extracts coordinates once in batched calls.
+    """
+    parts, part_owner = shapely.get_parts(polygons, return_index=True)
+    rings, ring_part = shapely.get_rings(parts, return_index=True)
+    coords, coord_ring = shapely.get_coordinates(rings, return_index=True)
+    ring_coords = np.split(coords, np.searchsorted(coord_ring, np.arange(1, len(rings))))
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(geojson, f, indent=2)
+    part_rings = [[] for _ in range(len(parts))]
+    for ring, part in zip(ring_coords, ring_part.tolist()):
+        part_rings[part].append(ring)
+    result = [[] for _ in range(len(polygons))]
+    for rings_of_part, owner in zip(part_rings, part_owner.tolist()):
+        result[owner].append(rings_of_part)
+    return result
 
-    return output_path
+
+def _geojson_geometry(geom, parts=None):
+    """
+    GeoJSON geometry dict with each ring/line as a float64 coordinate array.
+
+    Lines are one get_coordinates() call per line instead of mapping()'s
+    tuple per vertex; polygons take their `parts` from _polygon_rings().
+    orjson serializes the arrays directly (OPT_SERIALIZE_NUMPY).
+    """
+    gtype = geom.geom_type
+    if parts is not None and gtype == "Polygon":
+        coords = parts[0]
+    elif parts is not None and gtype == "MultiPolygon":
+        coords = parts
+    elif gtype == "LineString":
+        coords = shapely.get_coordinates(geom)
+    elif gtype == "MultiLineString":
+        coords = [shapely.get_coordinates(g) for g in geom.geoms]
+    else:
+        return mapping(geom)
+    return {"type": gtype, "coordinates": coords}
 
 
-def _polygon_to_kml_coords(polygon):
-    """Convert a Polygon or MultiPolygon to KML coordinate lists."""
-    if isinstance(polygon, MultiPolygon):
-        polys = list(polygon.geoms)
+def export_geojson(polygons_data, boundary_lines, metadata, output_path, rings=None,
+                   pretty=False):
+    """
+    Export as GeoJSON FeatureCollection.
+
+    Features are encoded and written one at a time (one per line, or
+    indented with `pretty`), so only a single feature's encoding is in
+    memory at once. `rings` may pass in _polygon_rings() for polygons_data,
+    already read for another writer.
+    """
+    # Arrays need orjson; the stdlib encoder gets plain mapping() tuples
+    to_geometry = _geojson_geometry if orjson is not None else mapping
+    if orjson is not None and rings is None:
+        rings = _polygon_rings([polygon for polygon, _, _ in polygons_data])
+
+    def features():
+        for i, (polygon, label, source) in enumerate(polygons_data):
+            yield {
+                "type": "Feature",
+                "properties": {
+                    "name": label,
+                    "source": source,
+                    "area_deg2": polygon.area,
+                },
+                "geometry": (_geojson_geometry(polygon, rings[i])
+                             if orjson is not None else mapping(polygon)),
+            }
+
+        for line, bmeta in boundary_lines:
+            yield {
+                "type": "Feature",
+                "properties": {
+                    "name": bmeta["feature_name"],
+                    "feature_type": bmeta["feature_type"],
+                    "compass_direction": bmeta.get("compass_direction", ""),
+                    "layer": "boundary_line",
+                },
+                "geometry": to_geometry(line),
+            }
+
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if pretty else 0)
+        encode = functools.partial(orjson.dumps, option=option)
     else:
-        polys = [polygon]
-    return polys
+        # The same JSON as orjson (compact separators, UTF-8); only float
+        # spellings can differ (e.g. 1e-05 vs 0.00001)
+        def encode(feature):
+            if pretty:
+                return json.dumps(feature, indent=2, ensure_ascii=False).encode()
+            return json.dumps(feature, separators=(",", ":"),
+                              ensure_ascii=False).encode()
+
+    with open(output_path, "wb") as f:
+        f.write(b'{"type": "FeatureCollection", "features": [\n')
+        for k, feature in enumerate(features()):
+            if k:
+                f.write(b",\n")
+            f.write(encode(feature))
+        f.write(b"\n]}\n")
+
+    return output_path
+
+
+def _kml_exteriors(polygons_data, rings=None):
+    """Per polygon, the exterior ring array of each part (KML writes no holes)."""
+    if rings is None:
+        rings = _polygon_rings([polygon for polygon, _, _ in polygons_data])
+    return [[part[0] for part in parts] for parts in rings]
 
 
-def export_kml(polygons_data, metadata, output_path):
-    """Export polygon(s) to KML format."""
+def export_kml(polygons_data, metadata, output_path, rings=None):
+    """
+    Export polygon(s) to KML format.
+
+    `rings` may pass in _polygon_rings() for polygons_data, already read
+    for another writer.
+    """
+    exteriors = _kml_exteriors(polygons_data, rings)
     try:
         import simplekml
         kml = simplekml.Kml()
 
-        for polygon, label, source in polygons_data:
-            for poly in _polygon_to_kml_coords(polygon):
-                coords_lonlat = list(poly.exterior.coords)
-                kml_coords = [(c[0], c[1], 0) for c in coords_lonlat]
+        for (polygon, label, source), outer_rings in zip(polygons_data, exteriors):
+            for ring in outer_rings:
+                kml_coords = list(zip(ring[:, 0].tolist(), ring[:, 1].tolist(),
+                                      itertools.repeat(0)))
                 pol = kml.newpolygon(name=label)
                 pol.outerboundaryis = kml_coords
                 pol.style.polystyle.color = simplekml.Color.changealphaint(100, simplekml.Color.blue)
@@ -1676,18 +2418,27 @@ def export_kml(polygons_data, metadata, output_path):
         kml.save(output_path)
 
     except ImportError:
-        _export_kml_manual(polygons_data, output_path)
+        _export_kml_manual(polygons_data, output_path, exteriors)
 
     return output_path
 
 
-def _export_kml_manual(polygons_data, output_path):
-    """Write minimal KML XML directly (no simplekml dependency)."""
-    placemarks = []
-    for polygon, label, source in polygons_data:
-        for poly in _polygon_to_kml_coords(polygon):
-            coords = " ".join(f"{c[0]},{c[1]},0" for c in poly.exterior.coords)
-            placemarks.append(f"""    <Placemark>
+def _kml_document(polygons_data, exteriors):
+    """
+    Yield the manual KML document in pieces: header, then per Placemark its
+    opening markup, coordinate text and closing markup, then footer.
+
+    A ring's coordinates are yielded on their own rather than formatted into
+    the Placemark string, so the largest piece is never copied again.
+    """
+    yield """<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2">
+  <Document>
+    <name>Community Polygons</name>
+"""
+    for (polygon, label, source), outer_rings in zip(polygons_data, exteriors):
+        for ring in outer_rings:
+            yield f"""    <Placemark>
       <name>{label}</name>
       <description>Source: {source}</description>
       <Style>
@@ -1695,20 +2446,46 @@ def _export_kml_manual(polygons_data, output_path):
         <LineStyle><color>ff0000ff</color><width>2</width></LineStyle>
       </Style>
       <Polygon>
-        <outerBoundaryIs><LinearRing><coordinates>{coords}</coordinates></LinearRing></outerBoundaryIs>
+        <outerBoundaryIs><LinearRing><coordinates>"""
+            # Formatted straight from the two coordinate columns, with no
+            # per-vertex pair list in between
+            yield " ".join(map("{0!r},{1!r},0".format,
+                               ring[:, 0].tolist(), ring[:, 1].tolist()))
+            yield """</coordinates></LinearRing></outerBoundaryIs>
       </Polygon>
-    </Placemark>""")
-
-    kml_str = f"""<?xml version="1.0" encoding="UTF-8"?>
-<kml xmlns="http://www.opengis.net/kml/2.2">
-  <Document>
-    <name>Community Polygons</name>
-{"".join(placemarks)}
+    </Placemark>"""
+    yield """
   </Document>
 </kml>"""
 
+
+def _export_kml_manual(polygons_data, output_path, exteriors=None):
+    """Write minimal KML XML directly (no simplekml dependency)."""
+    if exteriors is None:
+        exteriors = _kml_exteriors(polygons_data)
+    # One writelines() call: the file buffer coalesces the pieces into large
+    # writes without first joining the whole document into one string
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write(kml_str)
+        f.writelines(_kml_document(polygons_data, exteriors))
+
+
+# community_visualize pulls in folium (and branca/jinja2), which is slow to
+# import: load it once, and only when a map is actually requested
+_community_visualize = None
+
+
+def _visualize_module():
+    """
+    Return the community_visualize module, importing it on first use.
+
+    Kept lazy so --no-map runs never import folium; map runs warm it up
+    in the background (see _process_community).
+    """
+    global _community_visualize
+    if _community_visualize is None:
+        import community_visualize
+        _community_visualize = community_visualize
+    return _community_visualize
 
 
 # ---------------------------------------------------------------------------
@@ -1720,8 +2497,8 @@ def parse_args():
         description="Convert community boundary descriptions to geographic polygons"
     )
     parser.add_argument(
-        "input",
-        help="Path to boundary description JSON file"
+        "input", nargs="+",
+        help="Path(s) to boundary description JSON file(s); several are built in parallel"
     )
     parser.add_argument(
         "--approach", choices=["lines", "zoning", "both"], default="both",
@@ -1751,19 +2528,48 @@ def parse_args():
         "--provider", choices=["nominatim", "google"], default="nominatim",
         help="Geocoding provider for reference point"
     )
+    parser.add_argument(
+        "--simplify-tol", type=float, default=None,
+        help="Simplify both polygons by this tolerance (degrees, e.g. 1e-5) "
+             "before the IoU comparison only; exports are unaffected"
+    )
+    parser.add_argument(
+        "--parcel-simplify-tol", type=float, default=None,
+        help="Simplify zoning parcels by this tolerance (degrees, e.g. 1e-6) "
+             "before unioning them; changes the Approach B polygon accordingly"
+    )
+    parser.add_argument(
+        "--pretty", action="store_true",
+        help="Indent the GeoJSON output (default: one feature per line)"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1,
+        help="Threads for the zoning parcel union (default: 1)"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Ignore cached GIS and geocoding lookups and query the services afresh"
+    )
     return parser.parse_args()
 
 
-def main():
-    args = parse_args()
+def _process_community(args, input_path):
+    """Build, compare and export the polygon(s) for one description file."""
+    if args.no_cache:
+        disable_cache()
 
     # Load description
-    with open(args.input, "r", encoding="utf-8") as f:
-        description = json.load(f)
+    if orjson is not None:
+        with open(input_path, "rb") as f:
+            description = orjson.loads(f.read())
+    else:
+        with open(input_path, "r", encoding="utf-8") as f:
+            description = json.load(f)
 
     community_name = description["community_name"]
+    # Output file stem, e.g. thompson_orchard_20250101_120000
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    base_name = community_name.lower().replace(" ", "_")
+    stem = f"{community_name.lower().replace(' ', '_')}_{timestamp}"
 
     print("=" * 60)
     print(f"  Community Polygon Builder")
@@ -1800,18 +2606,44 @@ def main():
     # Ensure output directory exists
     os.makedirs(args.output_dir, exist_ok=True)
 
+    # Folium takes a noticeable moment to import; load it on a side thread
+    # while the approaches below wait on the GIS services
+    if not args.no_map:
+        threading.Thread(target=_visualize_module, daemon=True).start()
+
     polygons_for_export = []
     boundary_lines_for_export = []
     polygon_a = None
     polygon_b = None
+    used_fallback = False
+
+    # Approach B only needs the reference point, so it runs on a worker
+    # thread while Approach A builds (both mostly wait on the network).
+    # Its progress lines are held and printed after Approach A's.
+    b_pool = ThreadPoolExecutor(max_workers=1)
+    b_log = []
+    future_b = None
+    if args.approach in ("zoning", "both") and "zoning_exception" in description:
+        ze = description["zoning_exception"]
+        future_b = b_pool.submit(
+            lambda: construct_from_zoning_exception(
+                ze["exception_number"], ze["zone_type"], ref_lat, ref_lon,
+                log=b_log.append, jobs=args.jobs, simplify_tol=args.parcel_simplify_tol))
+    b_pool.shutdown(wait=False)
 
     # Approach A: Boundary Lines
     if args.approach in ("lines", "both"):
         try:
-            polygon_a, boundary_lines = construct_from_boundaries(description, ref_lat, ref_lon)
-            polygons_for_export.append(
-                (polygon_a, f"{community_name} (boundary lines)", "approach_a_lines")
-            )
+            polygon_a, boundary_lines, used_fallback = construct_from_boundaries(
+                description, ref_lat, ref_lon, approach_b=future_b)
+            if used_fallback:
+                polygons_for_export.append(
+                    (polygon_a, f"{community_name} (zoning fallback)", "approach_a_zoning_fallback")
+                )
+            else:
+                polygons_for_export.append(
+                    (polygon_a, f"{community_name} (boundary lines)", "approach_a_lines")
+                )
             boundary_lines_for_export = boundary_lines
         except Exception as e:
             print(f"\n  Approach A FAILED: {e}")
@@ -1821,17 +2653,17 @@ def main():
                 sys.exit(1)
 
     # Approach B: Zoning Exception Union
-    if args.approach in ("zoning", "both") and "zoning_exception" in description:
-        ze = description["zoning_exception"]
-        try:
-            polygon_b, parcel_count = construct_from_zoning_exception(
-                ze["exception_number"], ze["zone_type"], ref_lat, ref_lon
-            )
+    if future_b is not None:
+        error_b = future_b.exception()
+        if b_log:
+            print("\n".join(b_log))
+        if error_b is None:
+            polygon_b, parcel_count = future_b.result()
             polygons_for_export.append(
                 (polygon_b, f"{community_name} (zoning x{ze['exception_number']})", "approach_b_zoning")
             )
-        except Exception as e:
-            print(f"\n  Approach B FAILED: {e}")
+        else:
+            print(f"\n  Approach B FAILED: {error_b}")
             if args.approach == "zoning":
                 sys.exit(1)
 
@@ -1839,40 +2671,63 @@ def main():
         print("\n  No polygons were constructed. Exiting.")
         sys.exit(1)
 
-    # Compare approaches if both succeeded
-    if polygon_a and polygon_b:
+    # Compare approaches if both succeeded (geometry truthiness means
+    # non-empty). Invalid inputs are repaired up front rather than letting
+    # the overlay raise. A zoning fallback in Approach A is Approach B's own
+    # parcel union, so there is nothing to compare.
+    if used_fallback and polygon_b:
+        print("\n  [Comparison]\n    Skipped: Approach A fell back to the zoning parcel union")
+    elif polygon_a and polygon_b:
         print("\n  [Comparison]")
-        try:
-            intersection = polygon_a.intersection(polygon_b)
-            union_poly = polygon_a.union(polygon_b)
-            iou = intersection.area / union_poly.area if union_poly.area > 0 else 0
-            print(f"    Approach A area: {polygon_a.area * 111.32**2:.3f} km^2")
-            print(f"    Approach B area: {polygon_b.area * 111.32**2:.3f} km^2")
-            print(f"    IoU (Intersection/Union): {iou:.3f}")
-        except Exception as e:
-            print(f"    Comparison failed: {e}")
-
-    # Export GeoJSON
-    geojson_path = os.path.join(args.output_dir, f"{base_name}_{timestamp}.geojson")
-    export_geojson(polygons_for_export, boundary_lines_for_export,
-                   {"community_name": community_name}, geojson_path)
-    print(f"\n  GeoJSON: {geojson_path}")
-
-    # Export KML
-    kml_path = os.path.join(args.output_dir, f"{base_name}_{timestamp}.kml")
-    export_kml(polygons_for_export, {"community_name": community_name}, kml_path)
-    print(f"  KML:     {kml_path}")
-
-    # Generate HTML map
-    if not args.no_map:
-        from community_visualize import create_community_map, save_map
-
-        viz_polygons = []
-        colors = ["#3388ff", "#33cc33", "#ff8833"]
-        for i, (poly, label, source) in enumerate(polygons_for_export):
-            viz_polygons.append((poly, label, colors[i % len(colors)]))
-
-        m = create_community_map(
+        # Areas are computed once and reused: only the intersection
+        # needs an overlay, as area(A | B) is area(A) + area(B) - area(A & B)
+        pair = np.array([polygon_a, polygon_b], dtype=object)
+        invalid = ~shapely.is_valid(pair)
+        if invalid.any():
+            pair[invalid] = shapely.make_valid(pair[invalid])
+        area_a, area_b = _area_km2(pair, ref_lat)
+        cmp_area_a, cmp_area_b = area_a, area_b
+        if args.simplify_tol:
+            # Fewer vertices for the overlay; reported areas stay exact
+            pair = shapely.simplify(pair, args.simplify_tol)
+            cmp_area_a, cmp_area_b = _area_km2(pair, ref_lat)
+        cmp_a, cmp_b = pair
+        # Disjoint approaches (IoU 0) skip the overlay entirely: first a
+        # plain bounding-box test, then a prepared intersects(), both far
+        # cheaper than the intersection itself
+        (ax0, ay0, ax1, ay1), (bx0, by0, bx1, by1) = shapely.bounds(pair)
+        boxes_overlap = not (ax1 < bx0 or bx1 < ax0 or ay1 < by0 or by1 < ay0)
+        inter_area = 0.0
+        if boxes_overlap:
+            shapely.prepare(cmp_a)
+            if shapely.intersects(cmp_a, cmp_b):
+                inter_area = _area_km2(shapely.intersection(cmp_a, cmp_b), ref_lat)
+        union_area = cmp_area_a + cmp_area_b - inter_area
+        iou = inter_area / union_area if union_area > 0 else 0
+        print("\n".join([
+            f"    Approach A area: {area_a:.3f} km^2",
+            f"    Approach B area: {area_b:.3f} km^2",
+            f"    IoU (Intersection/Union): {iou:.3f}",
+        ]))
+
+    # All outputs share one path prefix; suffixes are appended as text since
+    # Path.with_suffix() would cut community names containing a dot
+    base_path = pathlib.Path(args.output_dir) / stem
+
+    geojson_path = f"{base_path}.geojson"
+    kml_path = f"{base_path}.kml"
+    map_path = f"{base_path}.html"
+    # Both writers share one batched read of the polygon coordinates
+    export_rings = _polygon_rings([poly for poly, _, _ in polygons_for_export])
+
+    def write_map():
+        viz = _visualize_module()
+
+        colors = itertools.cycle(["#3388ff", "#33cc33", "#ff8833"])
+        viz_polygons = [(poly, label, next(colors))
+                        for poly, label, source in polygons_for_export]
+
+        m = viz.create_community_map(
             viz_polygons,
             boundary_lines=boundary_lines_for_export,
             metadata={
@@ -1881,13 +2736,84 @@ def main():
             },
             reference_point=(ref_lat, ref_lon),
         )
-        map_path = os.path.join(args.output_dir, f"{base_name}_{timestamp}.html")
-        save_map(m, map_path)
-        print(f"  HTML Map: {map_path}")
+        viz.save_map(m, map_path)
+
+    # The three outputs are independent, so they are written concurrently
+    # (file writes and GEOS calls release the GIL); result() re-raises any
+    # export error here
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        exports = [
+            pool.submit(export_geojson, polygons_for_export, boundary_lines_for_export,
+                        {"community_name": community_name}, geojson_path,
+                        rings=export_rings, pretty=args.pretty),
+            pool.submit(export_kml, polygons_for_export, {"community_name": community_name},
+                        kml_path, rings=export_rings),
+        ]
+        if not args.no_map:
+            exports.append(pool.submit(write_map))
+        for future in exports:
+            future.result()
+
+    summary = [f"\n  GeoJSON: {geojson_path}", f"  KML:     {kml_path}"]
+    if not args.no_map:
+        summary.append(f"  HTML Map: {map_path}")
+
+    # Summary blocks go out as one write each, so parallel workers'
+    # output does not interleave mid-block
+    summary += [
+        f"\n{'=' * 60}",
+        "  Done. Open the HTML file in a browser to view the map.",
+        "=" * 60,
+    ]
+    print("\n".join(summary))
+
 
-    print(f"\n{'=' * 60}")
-    print(f"  Done. Open the HTML file in a browser to view the map.")
-    print(f"{'=' * 60}")
+def _run_community(args, input_path):
+    """
+    Process one description in a worker process.
+
+    Returns the exit status instead of exiting, so one failed community
+    does not abort the batch, and saves the lookup caches before the
+    worker goes away (worker processes skip atexit handlers).
+    """
+    try:
+        _process_community(args, input_path)
+        return 0
+    except SystemExit as e:
+        return e.code or 0
+    except Exception as e:
+        print(f"\n  {input_path} FAILED: {e}")
+        return 1
+    finally:
+        flush_cache()
+
+
+def _share_rate_limits(nominatim_lock, overpass_lock, overpass_time):
+    """Process-pool initializer: share the Nominatim and Overpass rate limits."""
+    share_nominatim_lock(nominatim_lock)
+    share_overpass_throttle(overpass_lock, overpass_time)
+
+
+def main():
+    args = parse_args()
+
+    if len(args.input) == 1:
+        _process_community(args, args.input[0])
+        return
+
+    # Communities are independent: build them in parallel, one per process.
+    # Nominatim still allows one request at a time, and Overpass one every
+    # throttle interval, across all workers.
+    workers = min(len(args.input), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_share_rate_limits,
+                             initargs=(multiprocessing.Lock(), multiprocessing.Lock(),
+                                       multiprocessing.Value("d", float("-inf"), lock=False))) as pool:
+        statuses = list(pool.map(_run_community, [args] * len(args.input), args.input))
+
+    failed = [path for path, status in zip(args.input, statuses) if status]
+    if failed:
+        print(f"\n  {len(failed)} of {len(args.input)} communities failed: {', '.join(failed)}")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ boundary lines, and reference point markers on OpenStreetMap tiles.
 """
 
 import folium
-from shapely.geometry import mapping
+import shapely
 
 
 COLOR_MAP = {
@@ -40,34 +40,43 @@ def create_community_map(polygons, boundary_lines=None, metadata=None, reference
         tiles="OpenStreetMap",
     )
 
+    # Serialize every layer's geometry in one batched GEOS call; folium
+    # loads GeoJSON strings directly instead of walking shapely mappings.
+    # (Its Jinja templates are already compiled once per process.)
+    boundary_lines = boundary_lines or []
+    layer_json = shapely.to_geojson(
+        [polygon for polygon, _, _ in polygons] + [line for line, _ in boundary_lines])
+    polygon_json, line_json = layer_json[:len(polygons)], layer_json[len(polygons):]
+
+    # One style dict per color, shared by every layer drawn in it; folium
+    # calls style_function for each feature at render time, so the lambdas
+    # just hand back a prebuilt dict
+    polygon_styles = {
+        color: {"fillColor": color, "color": color, "weight": 2, "fillOpacity": 0.2}
+        for _, _, color in polygons
+    }
+    line_colors = [COLOR_MAP.get(bmeta.get("feature_type", ""), "#333333")
+                   for _, bmeta in boundary_lines]
+    line_styles = {color: {"color": color, "weight": 4, "opacity": 0.8}
+                   for color in line_colors}
+
     # Add each polygon
-    for polygon, label, color in polygons:
+    for (polygon, label, color), geojson in zip(polygons, polygon_json):
         folium.GeoJson(
-            mapping(polygon),
+            str(geojson),
             name=label,
-            style_function=lambda x, c=color: {
-                "fillColor": c,
-                "color": c,
-                "weight": 2,
-                "fillOpacity": 0.2,
-            },
+            style_function=lambda x, s=polygon_styles[color]: s,
             tooltip=label,
         ).add_to(m)
 
     # Add boundary lines
-    if boundary_lines:
-        for line, bmeta in boundary_lines:
-            color = COLOR_MAP.get(bmeta.get("feature_type", ""), "#333333")
-            folium.GeoJson(
-                mapping(line),
-                name=bmeta["feature_name"],
-                style_function=lambda x, c=color: {
-                    "color": c,
-                    "weight": 4,
-                    "opacity": 0.8,
-                },
-                tooltip=f"{bmeta['feature_name']} ({bmeta.get('feature_type', '')})",
-            ).add_to(m)
+    for (line, bmeta), color, geojson in zip(boundary_lines, line_colors, line_json):
+        folium.GeoJson(
+            str(geojson),
+            name=bmeta["feature_name"],
+            style_function=lambda x, s=line_styles[color]: s,
+            tooltip=f"{bmeta['feature_name']} ({bmeta.get('feature_type', '')})",
+        ).add_to(m)
 
     # Reference point marker
     if reference_point:
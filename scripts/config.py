@@ -43,6 +43,9 @@ LAYER_COMMUNITY_PLANNING = {
     "name": "Community Planning Boundary",
 }
 
+# Result keys of toronto_gis.query_all() for the layers above, in report order
+QUERY_LAYERS = ("zoning", "former_bylaw", "mtsa", "neighbourhood", "ward", "community_planning")
+
 # --- Boundary validation layers ---
 LAYER_ROAD_CENTRELINE = {
     "url": f"{ARCGIS_BASE}/cot_geospatial2/FeatureServer/2/query",
@@ -59,3 +62,10 @@ LAYER_PROPERTY_BOUNDARY = {
 
 # --- Output ---
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "output")
+
+# --- Persistent lookup cache (delete the directory to force fresh data) ---
+CACHE_DIR = os.environ.get(
+    "GEOSCRIBE_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "geoscribe"),
+)
+CACHE_MAX_AGE_DAYS = 30
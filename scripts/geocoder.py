@@ -3,29 +3,54 @@ Geocode a street address to latitude/longitude coordinates.
 Supports Nominatim (default, free) and Google Maps Geocoding API (optional).
 """
 
-import requests
+import threading
 import time
+from cache import persistent_cache
+from toronto_gis import _SESSION, _decode
 from config import (
-    NOMINATIM_URL, NOMINATIM_USER_AGENT,
+    NOMINATIM_URL,
     GOOGLE_GEOCODE_URL, GOOGLE_MAPS_API_KEY,
 )
 
 
+# Nominatim's usage policy allows one request at a time; callers may geocode
+# from several threads, so uncached lookups queue here
+_nominatim_lock = threading.Lock()
+
+
+def share_nominatim_lock(lock):
+    """
+    Serialize Nominatim requests on `lock` instead of the per-process lock.
+
+    Used as a process-pool initializer with a multiprocessing.Lock, so
+    parallel worker processes still send one request at a time.
+    """
+    global _nominatim_lock
+    _nominatim_lock = lock
+
+
+@persistent_cache("nominatim")
 def geocode_nominatim(address):
-    """Geocode using OpenStreetMap Nominatim (free, no API key)."""
-    response = requests.get(
-        NOMINATIM_URL,
-        params={
-            "q": address,
-            "format": "json",
-            "addressdetails": 1,
-            "limit": 1,
-        },
-        headers={"User-Agent": NOMINATIM_USER_AGENT},
-        timeout=10,
-    )
+    """
+    Geocode using OpenStreetMap Nominatim (free, no API key).
+
+    Results are cached by query string across runs: intersection lookups
+    repeat the same queries for every run over a community, and Nominatim
+    allows about one request per second.
+    """
+    with _nominatim_lock:
+        response = _SESSION.get(
+            NOMINATIM_URL,
+            params={
+                "q": address,
+                "format": "json",
+                "addressdetails": 1,
+                "limit": 1,
+            },
+            timeout=10,
+        )
     response.raise_for_status()
-    results = response.json()
+    results = _decode(response)
 
     if not results:
         raise ValueError(f"Nominatim returned no results for: {address}")
@@ -45,21 +70,27 @@ def geocode_nominatim(address):
     }
 
 
+@persistent_cache("google")
 def geocode_google(address):
-    """Geocode using Google Maps Geocoding API (requires GOOGLE_MAPS_API_KEY env var)."""
+    """
+    Geocode using Google Maps Geocoding API (requires GOOGLE_MAPS_API_KEY env var).
+
+    Cached like geocode_nominatim(); the 30-day cache age matches how long
+    Google's terms allow geocodes to be kept.
+    """
     if not GOOGLE_MAPS_API_KEY:
         raise ValueError(
             "GOOGLE_MAPS_API_KEY environment variable not set. "
             "Set it or use --provider nominatim (default)."
         )
 
-    response = requests.get(
+    response = _SESSION.get(
         GOOGLE_GEOCODE_URL,
         params={"address": address, "key": GOOGLE_MAPS_API_KEY},
         timeout=10,
     )
     response.raise_for_status()
-    data = response.json()
+    data = _decode(response)
 
     if data.get("status") != "OK" or not data.get("results"):
         raise ValueError(
@@ -109,6 +140,8 @@ def geocode(address, provider="nominatim"):
     Returns:
         dict with keys: lat, lon, display_name, source, neighbourhood, city, province, postcode
     """
+    # Runs of whitespace don't change the answer, so they shouldn't miss the cache
+    address = " ".join(address.split())
     if provider == "google":
         return geocode_google(address)
     return geocode_nominatim(address)
@@ -4,8 +4,18 @@ Generate structured validation reports in Markdown and JSON formats.
 
 import json
 import os
-from datetime import datetime
-from config import OUTPUT_DIR
+from datetime import date, datetime
+from decimal import Decimal
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used instead
+    orjson = None
+
+from config import OUTPUT_DIR, QUERY_LAYERS
+
+# Address -> file name slug: spaces become underscores, commas are dropped
+_SLUG_TABLE = str.maketrans({" ": "_", ",": None})
 
 
 def generate_report(address, geocode_result, spatial_results, boundary_results=None):
@@ -27,42 +37,42 @@ def generate_report(address, geocode_result, spatial_results, boundary_results=N
             "province": geocode_result.get("province", ""),
             "postcode": geocode_result.get("postcode", ""),
         },
-        "zoning": spatial_results.get("zoning"),
-        "former_bylaw": spatial_results.get("former_bylaw"),
-        "mtsa": spatial_results.get("mtsa"),
-        "neighbourhood": spatial_results.get("neighbourhood"),
-        "ward": spatial_results.get("ward"),
-        "community_planning": spatial_results.get("community_planning"),
     }
+    # Layers that were not queried (validate.py --layers) stay out of the
+    # report rather than reading as "not in this zone"
+    for layer in QUERY_LAYERS:
+        if layer in spatial_results:
+            report[layer] = spatial_results[layer]
     if boundary_results:
         report["boundary_validation"] = boundary_results
     return report
 
 
-def _section(title, content_lines):
-    """Helper to format a markdown section."""
-    lines = [f"## {title}", ""]
+def _add_section(lines, title, content_lines):
+    """Helper to append a markdown section to the report's line buffer."""
+    lines.append(f"## {title}")
+    lines.append("")
     lines.extend(content_lines)
     lines.append("")
-    return "\n".join(lines)
 
 
 def format_markdown(report):
     """Format the validation report as readable Markdown."""
-    sections = []
+    # One line buffer for the whole report, joined once at the end
+    lines = []
 
     # Header
-    sections.append(f"# GIS Validation Report")
-    sections.append(f"**Address:** {report['meta']['address_input']}")
-    sections.append(f"**Generated:** {report['meta']['timestamp']}")
-    sections.append(f"**Geocoder:** {report['meta']['geocoding_provider']}")
-    sections.append("")
-    sections.append("---")
-    sections.append("")
+    lines.append(f"# GIS Validation Report")
+    lines.append(f"**Address:** {report['meta']['address_input']}")
+    lines.append(f"**Generated:** {report['meta']['timestamp']}")
+    lines.append(f"**Geocoder:** {report['meta']['geocoding_provider']}")
+    lines.append("")
+    lines.append("---")
+    lines.append("")
 
     # Location
     loc = report["location"]
-    sections.append(_section("1. Geocoded Location", [
+    _add_section(lines, "1. Geocoded Location", [
         f"| Field | Value |",
         f"|-------|-------|",
         f"| Coordinates | {loc['lat']}, {loc['lon']} |",
@@ -70,7 +80,7 @@ def format_markdown(report):
         f"| Neighbourhood (geocoder) | {loc.get('neighbourhood_from_geocoder', 'N/A')} |",
         f"| City | {loc.get('city', 'N/A')} |",
         f"| Postal Code | {loc.get('postcode', 'N/A')} |",
-    ]))
+    ])
 
     # Zoning
     z = report.get("zoning")
@@ -80,7 +90,7 @@ def format_markdown(report):
             exc_line = f"**Yes** - Exception #{z.get('exception_number', '?')}"
             if z.get("bylaw_section"):
                 exc_line += f" (Section {z['bylaw_section']})"
-        sections.append(_section("2. Zoning (By-law 569-2013)", [
+        _add_section(lines, "2. Zoning (By-law 569-2013)", [
             f"| Field | Value |",
             f"|-------|-------|",
             f"| Zone | **{z.get('zone', 'N/A')}** |",
@@ -89,57 +99,59 @@ def format_markdown(report):
             f"| Min Frontage | {z.get('min_frontage_m', 'N/A')} m |",
             f"| Min Lot Area | {z.get('min_area_sqm', 'N/A')} sqm |",
             f"| FSI/Density | {z.get('fsi_density', 'N/A')} |",
-        ]))
+        ])
     elif z:
-        sections.append(_section("2. Zoning", [f"**Error:** {z.get('error', 'unknown')}"]))
-
-    # Former Municipality By-law
-    fb = report.get("former_bylaw")
-    if fb is None:
-        sections.append(_section("3. Former Municipality By-law", [
-            "Property is governed by **By-law 569-2013** (not a former municipality code).",
-            "",
-            "This means the zoning data above is authoritative under the current city-wide by-law.",
-        ]))
-    elif "error" in fb:
-        sections.append(_section("3. Former Municipality By-law", [f"**Error:** {fb['error']}"]))
-    else:
-        sections.append(_section("3. Former Municipality By-law", [
-            f"**WARNING:** Property is still under a former municipality by-law.",
-            f"",
-            f"| Field | Value |",
-            f"|-------|-------|",
-            f"| By-law Name | {fb.get('bylaw_name', 'N/A')} |",
-            f"| By-law Number | {fb.get('bylaw_number', 'N/A')} |",
-            f"| District | {fb.get('district', 'N/A')} |",
-        ]))
-
-    # MTSA/PMTSA
-    mtsa = report.get("mtsa")
-    if mtsa is None:
-        sections.append(_section("4. MTSA/PMTSA Status", [
-            "Property is **not within** a mapped MTSA/PMTSA boundary in the current GIS data.",
-            "",
-            "**Note:** Some station boundaries may not yet be published. This does NOT",
-            "definitively mean the property is outside all transit station areas.",
-        ]))
-    elif "error" in mtsa:
-        sections.append(_section("4. MTSA/PMTSA Status", [f"**Error:** {mtsa['error']}"]))
-    else:
-        sections.append(_section("4. MTSA/PMTSA Status", [
-            f"Property is **inside** a transit station area.",
-            f"",
-            f"| Field | Value |",
-            f"|-------|-------|",
-            f"| Station | {mtsa.get('station_name', 'N/A')} |",
-            f"| Type | {mtsa.get('mtsa_type', 'N/A')} |",
-            f"| SASP # | {mtsa.get('sasp_number', 'N/A')} |",
-        ]))
+        _add_section(lines, "2. Zoning", [f"**Error:** {z.get('error', 'unknown')}"])
+
+    # Former Municipality By-law (None means 569-2013 applies)
+    if "former_bylaw" in report:
+        fb = report["former_bylaw"]
+        if fb is None:
+            _add_section(lines, "3. Former Municipality By-law", [
+                "Property is governed by **By-law 569-2013** (not a former municipality code).",
+                "",
+                "This means the zoning data above is authoritative under the current city-wide by-law.",
+            ])
+        elif "error" in fb:
+            _add_section(lines, "3. Former Municipality By-law", [f"**Error:** {fb['error']}"])
+        else:
+            _add_section(lines, "3. Former Municipality By-law", [
+                f"**WARNING:** Property is still under a former municipality by-law.",
+                f"",
+                f"| Field | Value |",
+                f"|-------|-------|",
+                f"| By-law Name | {fb.get('bylaw_name', 'N/A')} |",
+                f"| By-law Number | {fb.get('bylaw_number', 'N/A')} |",
+                f"| District | {fb.get('district', 'N/A')} |",
+            ])
+
+    # MTSA/PMTSA (None means outside all mapped areas)
+    if "mtsa" in report:
+        mtsa = report["mtsa"]
+        if mtsa is None:
+            _add_section(lines, "4. MTSA/PMTSA Status", [
+                "Property is **not within** a mapped MTSA/PMTSA boundary in the current GIS data.",
+                "",
+                "**Note:** Some station boundaries may not yet be published. This does NOT",
+                "definitively mean the property is outside all transit station areas.",
+            ])
+        elif "error" in mtsa:
+            _add_section(lines, "4. MTSA/PMTSA Status", [f"**Error:** {mtsa['error']}"])
+        else:
+            _add_section(lines, "4. MTSA/PMTSA Status", [
+                f"Property is **inside** a transit station area.",
+                f"",
+                f"| Field | Value |",
+                f"|-------|-------|",
+                f"| Station | {mtsa.get('station_name', 'N/A')} |",
+                f"| Type | {mtsa.get('mtsa_type', 'N/A')} |",
+                f"| SASP # | {mtsa.get('sasp_number', 'N/A')} |",
+            ])
 
     # Neighbourhood
     n = report.get("neighbourhood")
     if n and "error" not in n:
-        sections.append(_section("5. Official City Neighbourhood", [
+        _add_section(lines, "5. Official City Neighbourhood", [
             f"| Field | Value |",
             f"|-------|-------|",
             f"| Name | **{n.get('name', 'N/A')}** |",
@@ -149,29 +161,29 @@ def format_markdown(report):
             f"**Note:** Community associations (e.g., Thompson Orchard) are informal",
             f"boundaries not tracked in City GIS. The zoning exception (if present)",
             f"is the deterministic proof that a community-specific by-law applies.",
-        ]))
+        ])
     elif n:
-        sections.append(_section("5. Neighbourhood", [f"**Error:** {n.get('error', 'unknown')}"]))
+        _add_section(lines, "5. Neighbourhood", [f"**Error:** {n.get('error', 'unknown')}"])
 
     # Ward
     w = report.get("ward")
     if w and "error" not in w:
-        sections.append(_section("6. Municipal Ward", [
+        _add_section(lines, "6. Municipal Ward", [
             f"| Field | Value |",
             f"|-------|-------|",
             f"| Ward | **{w.get('name', 'N/A')}** |",
             f"| Number | {w.get('number', 'N/A')} |",
-        ]))
+        ])
 
     # Community Planning
     cp = report.get("community_planning")
     if cp and "error" not in cp:
-        sections.append(_section("7. Community Planning District", [
+        _add_section(lines, "7. Community Planning District", [
             f"| Field | Value |",
             f"|-------|-------|",
             f"| Area | {cp.get('name', 'N/A')} |",
             f"| District | {cp.get('district', 'N/A')} |",
-        ]))
+        ])
 
     # Boundary Validation (if present)
     bv = report.get("boundary_validation")
@@ -224,25 +236,74 @@ def format_markdown(report):
                 f"{detail}",
             ])
 
-        sections.append(_section("8. Community Boundary Validation", bv_lines))
+        _add_section(lines, "8. Community Boundary Validation", bv_lines)
 
-    return "\n".join(sections)
+    return "\n".join(lines)
 
 
 def format_json(report):
     """Format report as indented JSON string."""
+    return _json_bytes(report).decode("utf-8")
+
+
+def _json_bytes(report):
+    """
+    Report as indented UTF-8 JSON bytes, ready to write to a binary file.
+
+    Uses orjson when installed; the stdlib fallback produces the same
+    output. Values JSON can't represent go through _json_default().
+    """
     # Strip raw ArcGIS attributes to keep output clean
     clean = _strip_raw(report)
-    return json.dumps(clean, indent=2, default=str)
+    if orjson is not None:
+        return orjson.dumps(clean, default=_json_default,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                            | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(clean, indent=2, default=_json_default,
+                      ensure_ascii=False).encode("utf-8")
+
+
+def _json_default(obj):
+    """
+    Encode a value JSON has no type for, the same way under both encoders.
+
+    NumPy scalars and arrays (from the boundary checks' geometry math)
+    become plain numbers and lists, dates ISO 8601 strings and Decimals
+    floats; anything else is written as its str(). The encoders only call
+    this for such values, never for ordinary strings, numbers or containers.
+    """
+    if hasattr(obj, "tolist"):  # numpy.generic / numpy.ndarray
+        return obj.tolist()
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    return str(obj)
+
+
+def _has_raw(obj):
+    """True if a 'raw' key occurs anywhere in nested dicts/lists."""
+    if isinstance(obj, dict):
+        return "raw" in obj or any(_has_raw(v) for v in obj.values())
+    if isinstance(obj, list):
+        return any(_has_raw(item) for item in obj)
+    return False
 
 
 def _strip_raw(obj):
-    """Recursively remove 'raw' keys from nested dicts."""
+    """
+    Recursively remove 'raw' keys from nested dicts.
+
+    Subtrees without a 'raw' key are returned as is, without building
+    anything; only the containers on the way to a 'raw' key are rebuilt.
+    Everything else (notably the exception zone's parcel geometry) is
+    shared with the report, and the report itself is left unchanged.
+    """
+    if not _has_raw(obj):
+        return obj
     if isinstance(obj, dict):
         return {k: _strip_raw(v) for k, v in obj.items() if k != "raw"}
-    if isinstance(obj, list):
-        return [_strip_raw(item) for item in obj]
-    return obj
+    return [_strip_raw(item) for item in obj]
 
 
 def save_report(report, base_name=None):
@@ -255,17 +316,20 @@ def save_report(report, base_name=None):
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     if not base_name:
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        addr_slug = report["meta"]["address_input"][:30].replace(" ", "_").replace(",", "")
+        # Stamp the files with the time the report was generated
+        ts = datetime.fromisoformat(report["meta"]["timestamp"]).strftime("%Y%m%d_%H%M%S")
+        addr_slug = report["meta"]["address_input"][:30].translate(_SLUG_TABLE)
         base_name = f"validation_{addr_slug}_{ts}"
 
     md_path = os.path.join(OUTPUT_DIR, f"{base_name}.md")
     json_path = os.path.join(OUTPUT_DIR, f"{base_name}.json")
 
-    with open(md_path, "w", encoding="utf-8") as f:
-        f.write(format_markdown(report))
+    # Both files are encoded up front and written as bytes in one call each,
+    # bypassing the text layer (and newline translation on Windows)
+    with open(md_path, "wb") as f:
+        f.write(format_markdown(report).encode("utf-8"))
 
-    with open(json_path, "w", encoding="utf-8") as f:
-        f.write(format_json(report))
+    with open(json_path, "wb") as f:
+        f.write(_json_bytes(report))
 
     return md_path, json_path
@@ -6,13 +6,62 @@ All spatial operations (point-in-polygon) are performed server-side by ArcGIS.
 This client only sends coordinates and receives attribute results.
 """
 
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json via response.json() is used instead
+    orjson = None
+
+from cache import persistent_cache
 from config import (
+    NOMINATIM_USER_AGENT,
     LAYER_ZONING_AREA, LAYER_ZONING_FORMER_MUNIC, LAYER_MTSA,
     LAYER_NEIGHBOURHOOD, LAYER_WARD, LAYER_COMMUNITY_PLANNING,
     LAYER_ROAD_CENTRELINE, LAYER_WATERLINE,
 )
 
+# One keep-alive session per process, shared by the ArcGIS, Overpass and
+# geocoder clients: repeated queries reuse pooled TLS connections instead of
+# handshaking every call. Transient gateway errors and throttling are
+# retried with backoff. Every request identifies the app, as Nominatim and
+# Overpass ask.
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = NOMINATIM_USER_AGENT
+_ADAPTER = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=("GET",), raise_on_status=False),
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+
+def _decode(response):
+    """Parse a JSON response body (ArcGIS, Overpass, geocoders), using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# Query parameters shared by every point-in-polygon request; each call adds
+# only its point and field list
+_POINT_QUERY_PARAMS = {
+    "geometryType": "esriGeometryPoint",
+    "inSR": "4326",
+    "spatialRel": "esriSpatialRelIntersects",
+    "returnGeometry": "false",
+    "f": "json",
+}
+
 
 def _query_layer(layer_config, lat, lon, out_fields="*", extra_params=None):
     """
@@ -27,27 +76,30 @@ def _query_layer(layer_config, lat, lon, out_fields="*", extra_params=None):
 
     Returns:
         List of feature attribute dicts (empty if point outside all polygons)
+
+    Results are cached across runs (see cache.py), keyed by layer and the
+    point rounded to 6 decimals (~11 cm, finer than any boundary matters),
+    so re-validating an address sends no requests. Treat them as read-only.
     """
-    params = {
-        "geometry": f"{lon},{lat}",
-        "geometryType": "esriGeometryPoint",
-        "inSR": "4326",
-        "spatialRel": "esriSpatialRelIntersects",
-        "outFields": out_fields,
-        "returnGeometry": "false",
-        "f": "json",
-    }
-    if extra_params:
-        params.update(extra_params)
+    params = tuple(sorted((extra_params or {}).items()))
+    return _query_layer_by_key(layer_config["url"], layer_config["name"],
+                               round(lat, 6), round(lon, 6), out_fields, params)
+
 
-    response = requests.get(layer_config["url"], params=params, timeout=15)
+@persistent_cache("arcgis_point")
+def _query_layer_by_key(url, name, lat, lon, out_fields, extra_params):
+    """Uncached body of _query_layer(), on hashable arguments."""
+    params = {**_POINT_QUERY_PARAMS, "geometry": f"{lon},{lat}", "outFields": out_fields}
+    params.update(extra_params)
+
+    response = _SESSION.get(url, params=params, timeout=15)
     response.raise_for_status()
-    data = response.json()
+    data = _decode(response)
 
     if "error" in data:
         err = data["error"]
         raise ValueError(
-            f"ArcGIS error on {layer_config['name']}: "
+            f"ArcGIS error on {name}: "
             f"[{err.get('code', '?')}] {err.get('message', 'unknown')}"
         )
 
@@ -55,14 +107,24 @@ def _query_layer(layer_config, lat, lon, out_fields="*", extra_params=None):
     return [f["attributes"] for f in features]
 
 
-def _query_where(layer_config, where_clause, out_fields="*", return_geometry=False,
-                 out_sr="4326", extra_params=None):
+def _iter_where(layer_config, where_clause, out_fields="*", return_geometry=False,
+                out_sr="4326", extra_params=None, envelope=None):
     """
-    Query a layer by attribute WHERE clause (not spatial).
-    Optionally returns geometry in the specified spatial reference.
+    Yield features matching an attribute WHERE clause, one page at a time.
 
-    Returns:
-        List of dicts. Each dict has 'attributes' and optionally 'geometry'.
+    Each response page is decoded, yielded and released before the next is
+    requested, so callers that reduce features as they arrive never hold the
+    full result set. Pages are followed while ArcGIS reports
+    exceededTransferLimit, so results are no longer cut off at the layer's
+    maxRecordCount.
+
+    Args:
+        envelope: optional (xmin, ymin, xmax, ymax) WGS84 tuple; restricts the
+            query to features intersecting that box
+
+    Yields:
+        Dicts with 'attributes' and (if return_geometry) 'geometry'; plain
+        attribute dicts otherwise.
     """
     params = {
         "where": where_clause,
@@ -72,25 +134,99 @@ def _query_where(layer_config, where_clause, out_fields="*", return_geometry=Fal
     }
     if return_geometry:
         params["outSR"] = out_sr
+        # Coordinates otherwise come back with ~15 significant digits; 7
+        # decimals of a degree is ~1 cm and cuts geometry payloads by about
+        # half, which is most of the bytes these responses carry
+        params["geometryPrecision"] = 7
+    if envelope is not None:
+        params.update({
+            "geometry": ",".join(map(repr, envelope)),
+            "geometryType": "esriGeometryEnvelope",
+            "inSR": "4326",
+            "spatialRel": "esriSpatialRelIntersects",
+        })
     if extra_params:
         params.update(extra_params)
 
-    response = requests.get(layer_config["url"], params=params, timeout=30)
-    response.raise_for_status()
-    data = response.json()
+    offset = 0
+    while True:
+        if offset:
+            params["resultOffset"] = offset
+        response = _SESSION.get(layer_config["url"], params=params, timeout=30)
+        response.raise_for_status()
+        data = _decode(response)
+
+        if "error" in data:
+            err = data["error"]
+            raise ValueError(
+                f"ArcGIS error on {layer_config['name']}: "
+                f"[{err.get('code', '?')}] {err.get('message', 'unknown')}"
+            )
+
+        features = data.get("features", [])
+        for f in features:
+            if return_geometry:
+                yield {"attributes": f["attributes"], "geometry": f.get("geometry", {})}
+            else:
+                yield f["attributes"]
+
+        if not features or not data.get("exceededTransferLimit"):
+            return
+        offset += len(features)
 
-    if "error" in data:
-        err = data["error"]
-        raise ValueError(
-            f"ArcGIS error on {layer_config['name']}: "
-            f"[{err.get('code', '?')}] {err.get('message', 'unknown')}"
-        )
 
-    features = data.get("features", [])
-    if return_geometry:
-        return [{"attributes": f["attributes"], "geometry": f.get("geometry", {})}
-                for f in features]
-    return [f["attributes"] for f in features]
+def _query_where(layer_config, where_clause, out_fields="*", return_geometry=False,
+                 out_sr="4326", extra_params=None, envelope=None):
+    """
+    Query a layer by attribute WHERE clause (not spatial).
+    Optionally returns geometry in the specified spatial reference.
+
+    Args:
+        envelope: optional (xmin, ymin, xmax, ymax) WGS84 bounding box filter
+
+    Returns:
+        List of dicts. Each dict has 'attributes' and optionally 'geometry'.
+    """
+    return list(_iter_where(layer_config, where_clause, out_fields=out_fields,
+                            return_geometry=return_geometry, out_sr=out_sr,
+                            extra_params=extra_params, envelope=envelope))
+
+
+def _query_where_cached(layer_config, where_clause, out_fields="*", return_geometry=False,
+                        extra_params=None, envelope=None):
+    """
+    _query_where() for repeatable lookups, cached across runs (see cache.py).
+
+    Keyed by layer URL, WHERE clause, fields, geometry flag, extra params and
+    envelope. The returned features are shared: treat them as read-only.
+    """
+    params = tuple(sorted((extra_params or {}).items()))
+    return _query_where_by_key(layer_config["url"], layer_config["name"], where_clause,
+                               out_fields, return_geometry, params, envelope)
+
+
+@persistent_cache("arcgis_where")
+def _query_where_by_key(url, name, where_clause, out_fields, return_geometry, params, envelope):
+    """Uncached body of _query_where_cached(), on hashable arguments."""
+    return _query_where({"url": url, "name": name}, where_clause, out_fields=out_fields,
+                        return_geometry=return_geometry, extra_params=dict(params),
+                        envelope=envelope)
+
+
+def _sql_str(value):
+    """Quote a string as a WHERE-clause literal, doubling embedded quotes (O'Connor Dr)."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _feature_coords(features, part_key):
+    """
+    All vertices of the features' rings or paths (`part_key`) as one (N, 2)
+    float64 array of [lon, lat], flattened without a per-coordinate loop.
+    """
+    parts = itertools.chain.from_iterable(
+        f.get("geometry", {}).get(part_key, []) for f in features)
+    coords = list(itertools.chain.from_iterable(parts))
+    return np.array(coords, dtype=np.float64).reshape(-1, 2)
 
 
 def query_exception_zone(exception_number, zone_type=None, near_lat=None, near_lon=None,
@@ -99,7 +235,7 @@ def query_exception_zone(exception_number, zone_type=None, near_lat=None, near_l
     Query zoning parcels with a given exception number.
 
     Args:
-        exception_number: e.g. 42
+        exception_number: e.g. 42 (anything int() accepts; ValueError otherwise)
         zone_type: Filter by zone type e.g. "RD" (important: exception numbers
                    are reused across zone types city-wide)
         near_lat, near_lon: Center point for spatial filter
@@ -108,54 +244,55 @@ def query_exception_zone(exception_number, zone_type=None, near_lat=None, near_l
     Returns:
         dict with parcel_count, zone_types, bounding_box, and raw features.
     """
-    where = f"ZN_EXCPTN_NO = {exception_number}"
+    # The number is coerced to int and the zone code quoted, so neither can
+    # alter the query; equal inputs always produce the same WHERE text
+    where = f"ZN_EXCPTN_NO = {int(exception_number)}"
     if zone_type:
-        where += f" AND ZN_ZONE = '{zone_type}'"
+        where += f" AND ZN_ZONE = {_sql_str(zone_type.strip().upper())}"
 
-    extra_params = {}
+    envelope = None
     if near_lat is not None and near_lon is not None:
-        envelope = f"{near_lon - radius},{near_lat - radius},{near_lon + radius},{near_lat + radius}"
-        extra_params = {
-            "geometry": envelope,
-            "geometryType": "esriGeometryEnvelope",
-            "inSR": "4326",
-            "spatialRel": "esriSpatialRelIntersects",
-        }
+        envelope = (near_lon - radius, near_lat - radius, near_lon + radius, near_lat + radius)
 
     features = _query_where(
         LAYER_ZONING_AREA,
         where_clause=where,
         out_fields="ZN_ZONE,ZN_STRING,ZN_EXCPTN_NO,ZBL_EXCPTN",
         return_geometry=True,
-        extra_params=extra_params if extra_params else None,
+        envelope=envelope,
     )
 
     if not features:
         return {"error": f"No zoning parcels found with exception {exception_number}"}
 
-    # Compute bounding box from all polygon rings
-    all_lons = []
-    all_lats = []
+    # One pass over the features collects their attributes and rings; the
+    # bounding box is then a single min/max over all vertices at once
+    zone_types = set()
+    zoning_strings = []
+    rings = []
     for f in features:
-        geom = f.get("geometry", {})
-        for ring in geom.get("rings", []):
-            for coord in ring:
-                all_lons.append(coord[0])
-                all_lats.append(coord[1])
-
-    zone_types = sorted(set(f["attributes"].get("ZN_ZONE", "") for f in features))
-    zoning_strings = [f["attributes"].get("ZN_STRING", "") for f in features]
+        attr = f["attributes"]
+        zone_types.add(attr.get("ZN_ZONE", ""))
+        zoning_strings.append(attr.get("ZN_STRING", ""))
+        rings.extend(f.get("geometry", {}).get("rings", []))
+
+    coords = np.array(list(itertools.chain.from_iterable(rings)), dtype=np.float64).reshape(-1, 2)
+    if len(coords):
+        min_lon, min_lat = coords.min(axis=0).tolist()
+        max_lon, max_lat = coords.max(axis=0).tolist()
+    else:
+        min_lon = min_lat = max_lon = max_lat = None
 
     return {
         "exception_number": exception_number,
         "parcel_count": len(features),
-        "zone_types": zone_types,
+        "zone_types": sorted(zone_types),
         "zoning_strings": zoning_strings,
         "bounding_box": {
-            "min_lat": min(all_lats) if all_lats else None,
-            "max_lat": max(all_lats) if all_lats else None,
-            "min_lon": min(all_lons) if all_lons else None,
-            "max_lon": max(all_lons) if all_lons else None,
+            "min_lat": min_lat,
+            "max_lat": max_lat,
+            "min_lon": min_lon,
+            "max_lon": max_lon,
         },
         "features": features,
     }
@@ -171,54 +308,42 @@ def query_road_geometry(road_name, near_lat=None, near_lon=None, radius=0.01):
         radius: Bounding box half-width in degrees (~1.1km per 0.01 deg)
 
     Returns:
-        List of [lon, lat] coordinate pairs forming the road line.
+        (N, 2) array of [lon, lat] coordinates forming the road line.
     """
-    where = f"LINEAR_NAME_FULL = '{road_name}'"
+    where = f"LINEAR_NAME_FULL = {_sql_str(road_name)}"
 
     # Use spatial envelope to get only segments near the property
-    extra_params = {}
+    envelope = None
     if near_lat is not None and near_lon is not None:
-        envelope = f"{near_lon - radius},{near_lat - radius},{near_lon + radius},{near_lat + radius}"
-        extra_params = {
-            "geometry": envelope,
-            "geometryType": "esriGeometryEnvelope",
-            "inSR": "4326",
-            "spatialRel": "esriSpatialRelIntersects",
-        }
+        envelope = (near_lon - radius, near_lat - radius, near_lon + radius, near_lat + radius)
 
     features = _query_where(
         LAYER_ROAD_CENTRELINE,
         where_clause=where,
         out_fields="LINEAR_NAME_FULL",
         return_geometry=True,
-        extra_params=extra_params if extra_params else None,
+        envelope=envelope,
     )
 
     if not features:
         raise ValueError(f"No road segments found for: {road_name}"
                          + (f" near ({near_lat}, {near_lon})" if near_lat else ""))
 
-    # Extract all coordinates from all path segments
-    all_coords = []
-    for f in features:
-        geom = f.get("geometry", {})
-        for path in geom.get("paths", []):
-            for coord in path:
-                all_coords.append(coord)  # [lon, lat]
-
-    return all_coords
+    # All coordinates from all path segments
+    return _feature_coords(features, "paths")
 
 
+@persistent_cache("waterlines")
 def query_waterline_geometry(waterline_name):
     """
     Get the geometry of a named waterline (creek, river).
 
     Returns:
-        List of [lon, lat] coordinate pairs forming the waterline.
+        (N, 2) array of [lon, lat] coordinates forming the waterline.
     """
     features = _query_where(
         LAYER_WATERLINE,
-        where_clause=f"WATERLINE_NAME = '{waterline_name}'",
+        where_clause=f"WATERLINE_NAME = {_sql_str(waterline_name)}",
         out_fields="WATERLINE_NAME",
         return_geometry=True,
     )
@@ -226,14 +351,7 @@ def query_waterline_geometry(waterline_name):
     if not features:
         raise ValueError(f"No waterline segments found for: {waterline_name}")
 
-    all_coords = []
-    for f in features:
-        geom = f.get("geometry", {})
-        for path in geom.get("paths", []):
-            for coord in path:
-                all_coords.append(coord)
-
-    return all_coords
+    return _feature_coords(features, "paths")
 
 
 def query_zoning(lat, lon):
@@ -349,10 +467,17 @@ def query_community_planning(lat, lon):
     }
 
 
-def query_all(lat, lon):
+def query_all(lat, lon, layers=None):
     """
     Run all spatial queries and return combined results.
 
+    The layer lookups are independent round-trips, so they are all in
+    flight at once on the shared session; results keep the order below.
+
+    Args:
+        layers: optional subset of config.QUERY_LAYERS to query; the rest are
+            skipped and left out of the result (default: all of them)
+
     Returns:
         dict with keys: zoning, former_bylaw, mtsa, neighbourhood, ward, community_planning
         Each value is the result dict from the corresponding query function.
@@ -367,11 +492,17 @@ def query_all(lat, lon):
         ("ward", query_ward),
         ("community_planning", query_community_planning),
     ]
-
-    for name, func in queries:
-        try:
-            results[name] = func(lat, lon)
-        except Exception as e:
-            results[name] = {"error": str(e)}
+    if layers is not None:
+        queries = [(name, func) for name, func in queries if name in layers]
+    if not queries:
+        return results
+
+    with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+        futures = [(name, pool.submit(func, lat, lon)) for name, func in queries]
+        for name, future in futures:
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                results[name] = {"error": str(e)}
 
     return results
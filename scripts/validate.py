@@ -11,11 +11,7 @@ Usage:
 
 import sys
 import argparse
-from geocoder import geocode
-from toronto_gis import query_all
-from boundary_check import validate_thompson_orchard
-from report_generator import generate_report, format_markdown, format_json, save_report
-from config import DEFAULT_ADDRESS
+from config import DEFAULT_ADDRESS, QUERY_LAYERS
 
 
 def parse_args():
@@ -42,12 +38,37 @@ def parse_args():
         "--skip-boundary", action="store_true",
         help="Skip community boundary validation even if zoning exception found"
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--layers",
+        help=f"Comma-separated GIS layers to query (default: all): {', '.join(QUERY_LAYERS)}"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Ignore cached GIS and geocoding lookups and query the services afresh"
+    )
+    args = parser.parse_args()
+    if args.layers:
+        args.layers = [name.strip() for name in args.layers.split(",")]
+        unknown = sorted(set(args.layers) - set(QUERY_LAYERS))
+        if unknown:
+            parser.error(f"unknown layer(s): {', '.join(unknown)}")
+    return args
 
 
 def main():
     args = parse_args()
 
+    # The GIS clients pull in requests, NumPy and Shapely; imported only once
+    # the arguments are known good, so --help and usage errors return at once
+    from cache import disable_cache
+    from geocoder import geocode
+    from toronto_gis import query_all
+    from boundary_check import validate_thompson_orchard
+    from report_generator import generate_report, format_markdown, format_json, save_report
+
+    if args.no_cache:
+        disable_cache()
+
     print(f"{'=' * 60}")
     print(f"  Property Report GIS Validation")
     print(f"  Address: {args.address}")
@@ -66,7 +87,7 @@ def main():
 
     # Step 2: Run all spatial queries
     print("\n[2/3] Querying Toronto GIS layers...")
-    spatial = query_all(geo["lat"], geo["lon"])
+    spatial = query_all(geo["lat"], geo["lon"], layers=args.layers)
 
     for name, result in spatial.items():
         if result is None: